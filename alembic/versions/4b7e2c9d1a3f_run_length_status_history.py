@@ -0,0 +1,43 @@
+"""Run-length encode status history
+
+Revision ID: 4b7e2c9d1a3f
+Revises: dc218973530a
+Create Date: 2026-10-17 09:12:31.540218
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7e2c9d1a3f"
+down_revision: str | None = "dc218973530a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add run bounds to service_status.
+
+    Existing rows become single-poll runs ending where they started.
+    """
+    op.add_column("service_status", sa.Column("last_seen_at", sa.DateTime(), nullable=True))
+    op.add_column(
+        "service_status",
+        sa.Column("check_count", sa.Integer(), nullable=False, server_default="1"),
+    )
+    op.execute("UPDATE service_status SET last_seen_at = checked_at")
+    op.alter_column(
+        "service_status",
+        "last_seen_at",
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    """Drop run bounds from service_status."""
+    op.drop_column("service_status", "check_count")
+    op.drop_column("service_status", "last_seen_at")
@@ -0,0 +1,53 @@
+"""Create hourly and daily status rollup tables
+
+Revision ID: 5d2c8b4e9f17
+Revises: c3a9d6e2f810
+Create Date: 2026-10-17 13:05:12.664091
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2c8b4e9f17"
+down_revision: str | None = "c3a9d6e2f810"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ROLLUP_TABLES = ("status_rollup_hourly", "status_rollup_daily")
+
+
+def upgrade() -> None:
+    """Create the rollup tables."""
+    for table in ROLLUP_TABLES:
+        op.create_table(
+            table,
+            sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("service_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("bucket_start", sa.DateTime(), nullable=False),
+            sa.Column("status", sa.String(20), nullable=False),
+            sa.Column("seconds", sa.Double(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["service_id"],
+                ["service.id"],
+                name=f"fk_{table}_service_id_service",
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("id", name=f"pk_{table}"),
+        )
+        op.create_index(
+            f"uq_{table}_service_bucket_status",
+            table,
+            ["service_id", "bucket_start", "status"],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the rollup tables."""
+    for table in ROLLUP_TABLES:
+        op.drop_table(table)
@@ -0,0 +1,49 @@
+"""Add current status projection to service
+
+Revision ID: 8e1f5a2b7c4d
+Revises: 4b7e2c9d1a3f
+Create Date: 2026-10-17 10:03:54.118730
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e1f5a2b7c4d"
+down_revision: str | None = "4b7e2c9d1a3f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add current_status/last_checked_at and backfill from the latest record."""
+    op.add_column("service", sa.Column("current_status", sa.String(20), nullable=True))
+    op.add_column("service", sa.Column("last_checked_at", sa.DateTime(), nullable=True))
+    op.execute(
+        """
+        UPDATE service
+        SET current_status = latest.status, last_checked_at = latest.last_seen_at
+        FROM (
+            SELECT DISTINCT ON (service_id) service_id, status, last_seen_at
+            FROM service_status
+            ORDER BY service_id, checked_at DESC
+        ) AS latest
+        WHERE latest.service_id = service.id
+        """
+    )
+    op.create_index(
+        "ix_service_active_status",
+        "service",
+        ["is_active", "current_status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the current status projection."""
+    op.drop_index("ix_service_active_status", table_name="service")
+    op.drop_column("service", "last_checked_at")
+    op.drop_column("service", "current_status")
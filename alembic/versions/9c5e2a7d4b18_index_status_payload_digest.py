@@ -0,0 +1,37 @@
+"""Index service_status payload digests
+
+Revision ID: 9c5e2a7d4b18
+Revises: d8a1f4c7e265
+Create Date: 2026-10-18 10:41:07.552913
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c5e2a7d4b18"
+down_revision: str | None = "d8a1f4c7e265"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index raw_response_digest on every status partition.
+
+    Purging unreferenced payloads checks each candidate digest against
+    ``service_status``; without an index that is a scan of the whole
+    history per payload.
+    """
+    op.create_index(
+        "ix_service_status_raw_response_digest",
+        "service_status",
+        ["raw_response_digest"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the digest index."""
+    op.drop_index("ix_service_status_raw_response_digest", table_name="service_status")
@@ -0,0 +1,58 @@
+"""Extend keyset pagination indexes with id
+
+Revision ID: a7f3c1e58b20
+Revises: 5d2c8b4e9f17
+Create Date: 2026-10-17 13:48:26.118430
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7f3c1e58b20"
+down_revision: str | None = "5d2c8b4e9f17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add id as the trailing column of the paginated indexes.
+
+    Pages are ordered by ``(timestamp, id)`` so rows sharing a timestamp
+    are never skipped or repeated; with id in the index the cursor
+    predicate and the ordering are both answered by the index scan.
+    """
+    op.drop_index("ix_incident_status_created", table_name="incident")
+    op.create_index(
+        "ix_incident_status_created",
+        "incident",
+        ["status", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_service_status_service_checked", table_name="service_status")
+    op.create_index(
+        "ix_service_status_service_checked",
+        "service_status",
+        ["service_id", "checked_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Restore the two-column indexes."""
+    op.drop_index("ix_service_status_service_checked", table_name="service_status")
+    op.create_index(
+        "ix_service_status_service_checked",
+        "service_status",
+        ["service_id", "checked_at"],
+        unique=False,
+    )
+    op.drop_index("ix_incident_status_created", table_name="incident")
+    op.create_index(
+        "ix_incident_status_created",
+        "incident",
+        ["status", "created_at"],
+        unique=False,
+    )
@@ -0,0 +1,37 @@
+"""Add adaptive poll schedule to service
+
+Revision ID: b6d4e8f2a913
+Revises: f1c8e3a90d45
+Create Date: 2026-10-17 16:42:11.503318
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d4e8f2a913"
+down_revision: str | None = "f1c8e3a90d45"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add next_poll_at/poll_interval_seconds; existing services are due at once."""
+    op.add_column("service", sa.Column("next_poll_at", sa.DateTime(), nullable=True))
+    op.add_column("service", sa.Column("poll_interval_seconds", sa.Integer(), nullable=True))
+    op.create_index(
+        "ix_service_active_next_poll",
+        "service",
+        ["is_active", "next_poll_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the poll schedule."""
+    op.drop_index("ix_service_active_next_poll", table_name="service")
+    op.drop_column("service", "poll_interval_seconds")
+    op.drop_column("service", "next_poll_at")
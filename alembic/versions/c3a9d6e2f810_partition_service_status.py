@@ -0,0 +1,157 @@
+"""Partition service_status by day on checked_at
+
+Revision ID: c3a9d6e2f810
+Revises: 8e1f5a2b7c4d
+Create Date: 2026-10-17 11:27:40.902315
+
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9d6e2f810"
+down_revision: str | None = "8e1f5a2b7c4d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _status_columns() -> list[sa.Column[Any]]:
+    """Columns shared by the partitioned and the flat table."""
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("service_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("checked_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_seen_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("check_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("raw_response", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["service_id"],
+            ["service.id"],
+            name="fk_service_status_service_id_service",
+            ondelete="CASCADE",
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Rebuild service_status as a daily range-partitioned table.
+
+    Only the two composite indexes are kept: the single-column indexes on
+    service_id, status and checked_at are covered by them or by partition
+    pruning, so every insert now maintains three B-trees instead of six.
+    """
+    op.rename_table("service_status", "service_status_legacy")
+    op.execute(
+        "ALTER TABLE service_status_legacy "
+        "RENAME CONSTRAINT pk_service_status TO pk_service_status_legacy"
+    )
+    op.execute(
+        "ALTER TABLE service_status_legacy "
+        "RENAME CONSTRAINT fk_service_status_service_id_service "
+        "TO fk_service_status_legacy_service_id_service"
+    )
+    for index in (
+        "ix_service_status_service_id",
+        "ix_service_status_status",
+        "ix_service_status_checked_at",
+        "ix_service_status_service_checked",
+        "ix_service_status_status_checked",
+    ):
+        op.drop_index(index, table_name="service_status_legacy")
+
+    op.create_table(
+        "service_status",
+        *_status_columns(),
+        sa.PrimaryKeyConstraint("checked_at", "id", name="pk_service_status"),
+        postgresql_partition_by="RANGE (checked_at)",
+    )
+    op.create_index(
+        "ix_service_status_service_checked",
+        "service_status",
+        ["service_id", "checked_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_service_status_status_checked",
+        "service_status",
+        ["status", "checked_at"],
+        unique=False,
+    )
+
+    # One partition per day from the oldest existing row through a week ahead;
+    # the partition maintenance task keeps the window topped up afterwards
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            day date;
+        BEGIN
+            FOR day IN
+                SELECT generate_series(
+                    COALESCE((SELECT min(checked_at)::date FROM service_status_legacy),
+                             current_date),
+                    current_date + 7,
+                    interval '1 day'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF service_status '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'service_status_p' || to_char(day, 'YYYYMMDD'), day, day + 1
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO service_status
+            (id, service_id, status, checked_at, last_seen_at, check_count, raw_response)
+        SELECT id, service_id, status, checked_at, last_seen_at, check_count, raw_response
+        FROM service_status_legacy
+        """
+    )
+    op.drop_table("service_status_legacy")
+
+
+def downgrade() -> None:
+    """Collapse the partitions back into a single heap table."""
+    op.create_table(
+        "service_status_flat",
+        *_status_columns(),
+        sa.PrimaryKeyConstraint("id", name="pk_service_status_flat"),
+    )
+    op.execute(
+        """
+        INSERT INTO service_status_flat
+            (id, service_id, status, checked_at, last_seen_at, check_count, raw_response)
+        SELECT id, service_id, status, checked_at, last_seen_at, check_count, raw_response
+        FROM service_status
+        """
+    )
+    op.drop_table("service_status")  # drops every partition with it
+    op.rename_table("service_status_flat", "service_status")
+    op.execute(
+        "ALTER TABLE service_status RENAME CONSTRAINT pk_service_status_flat TO pk_service_status"
+    )
+    op.create_index("ix_service_status_service_id", "service_status", ["service_id"], unique=False)
+    op.create_index("ix_service_status_status", "service_status", ["status"], unique=False)
+    op.create_index("ix_service_status_checked_at", "service_status", ["checked_at"], unique=False)
+    op.create_index(
+        "ix_service_status_service_checked",
+        "service_status",
+        ["service_id", "checked_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_service_status_status_checked",
+        "service_status",
+        ["status", "checked_at"],
+        unique=False,
+    )
@@ -0,0 +1,43 @@
+"""Add shared poll budget bucket
+
+Revision ID: d8a1f4c7e265
+Revises: b6d4e8f2a913
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a1f4c7e265"
+down_revision: str | None = "b6d4e8f2a913"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create poll_budget_bucket; pollers insert its row on first claim."""
+    op.create_table(
+        "poll_budget_bucket",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("refilled_at", sa.DateTime(), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name="pk_poll_budget_bucket"),
+    )
+    op.create_index(
+        "uq_poll_budget_bucket_name",
+        "poll_budget_bucket",
+        ["name"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop poll_budget_bucket."""
+    op.drop_index("uq_poll_budget_bucket_name", table_name="poll_budget_bucket")
+    op.drop_table("poll_budget_bucket")
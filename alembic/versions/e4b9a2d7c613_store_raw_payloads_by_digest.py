@@ -0,0 +1,97 @@
+"""Store raw payloads deduplicated by digest
+
+Revision ID: e4b9a2d7c613
+Revises: a7f3c1e58b20
+Create Date: 2026-10-17 14:22:09.530817
+
+"""
+
+import gzip
+import hashlib
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b9a2d7c613"
+down_revision: str | None = "a7f3c1e58b20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BATCH_SIZE = 1000
+
+
+def _encode(payload: Any) -> tuple[bytes, bytes, int]:
+    """Canonical digest, gzip data and size, as src.services.payloads does."""
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(body).digest(), gzip.compress(body, mtime=0), len(body)
+
+
+def upgrade() -> None:
+    """Move raw_response bodies into raw_payload and reference them by digest."""
+    op.create_table(
+        "raw_payload",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("digest", sa.LargeBinary(32), nullable=False),
+        sa.Column("encoding", sa.String(10), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id", name="pk_raw_payload"),
+    )
+    op.create_index("uq_raw_payload_digest", "raw_payload", ["digest"], unique=True)
+    op.add_column(
+        "service_status", sa.Column("raw_response_digest", sa.LargeBinary(32), nullable=True)
+    )
+
+    conn = op.get_bind()
+    insert_payload = sa.text(
+        "INSERT INTO raw_payload (id, digest, encoding, data, size) "
+        "VALUES (:id, :digest, 'gzip', :data, :size) ON CONFLICT (digest) DO NOTHING"
+    )
+    set_digest = sa.text(
+        "UPDATE service_status SET raw_response_digest = :digest "
+        "WHERE id = :id AND checked_at = :checked_at"
+    )
+    select_batch = sa.text(
+        "SELECT id, checked_at, raw_response FROM service_status "
+        "WHERE raw_response IS NOT NULL AND (checked_at, id) > (:checked_at, :id) "
+        "ORDER BY checked_at, id LIMIT :limit"
+    )
+    position: dict[str, Any] = {"checked_at": datetime.min, "id": uuid.UUID(int=0)}
+    while rows := conn.execute(select_batch, {**position, "limit": BATCH_SIZE}).all():
+        payloads: dict[bytes, dict[str, Any]] = {}
+        references = []
+        for row in rows:
+            digest, data, size = _encode(row.raw_response)
+            payloads.setdefault(
+                digest, {"id": uuid.uuid4(), "digest": digest, "data": data, "size": size}
+            )
+            references.append({"digest": digest, "id": row.id, "checked_at": row.checked_at})
+        conn.execute(insert_payload, list(payloads.values()))
+        conn.execute(set_digest, references)
+        position = {"checked_at": rows[-1].checked_at, "id": rows[-1].id}
+
+    op.drop_column("service_status", "raw_response")
+
+
+def downgrade() -> None:
+    """Inline payloads into service_status again and drop raw_payload."""
+    op.add_column("service_status", sa.Column("raw_response", sa.JSON(), nullable=True))
+    conn = op.get_bind()
+    payloads = conn.execute(sa.text("SELECT digest, data FROM raw_payload")).all()
+    conn.execute(
+        sa.text(
+            "UPDATE service_status SET raw_response = CAST(:body AS json) "
+            "WHERE raw_response_digest = :digest"
+        ),
+        [{"digest": row.digest, "body": gzip.decompress(row.data).decode()} for row in payloads],
+    )
+    op.drop_column("service_status", "raw_response_digest")
+    op.drop_table("raw_payload")
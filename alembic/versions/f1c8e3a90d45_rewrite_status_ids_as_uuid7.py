@@ -0,0 +1,51 @@
+"""Rewrite service_status ids as UUIDv7
+
+Revision ID: f1c8e3a90d45
+Revises: e4b9a2d7c613
+Create Date: 2026-10-17 15:03:44.271906
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c8e3a90d45"
+down_revision: str | None = "e4b9a2d7c613"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Turn existing random status record ids into time-ordered ones.
+
+    New rows get UUIDv7 ids from the application. For existing version 4
+    ids, the first 48 bits are replaced with the record's ``checked_at`` in
+    Unix milliseconds and the version nibble is set to 7, keeping the
+    remaining random bits. Nothing references ``service_status.id``, so
+    only this table changes; ids of services and incidents are exposed by
+    the API and keep their values.
+    """
+    op.execute(
+        """
+        UPDATE service_status
+        SET id = encode(
+            set_bit(set_bit(
+                overlay(
+                    uuid_send(id)
+                    PLACING substring(
+                        int8send((extract(epoch FROM checked_at) * 1000)::bigint) FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1), 53, 1),
+            'hex'
+        )::uuid
+        WHERE get_byte(uuid_send(id), 6) >> 4 = 4
+        """
+    )
+
+
+def downgrade() -> None:
+    """UUIDv7 ids are valid UUIDs; nothing to undo."""
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark streaming RSS parsing against a full-DOM parse.
+
+Usage:
+    uv run python scripts/benchmark_aws_rss.py [--items 50000] [--new 5] [--feed PATH]
+
+Builds a large AWS-style feed in memory (or reads ``--feed``), then finds
+the items newer than the last-seen one twice: once by parsing the whole
+document into a tree, and once with the adapter's ``FeedReader``, fed in
+64 KiB chunks as the feed would arrive over the network. Reports the time
+and peak memory of each, taking the fastest of several runs.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET  # nosec B405
+from collections.abc import Callable
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.providers.aws import FeedCursor, FeedReader
+
+CHUNK_SIZE = 64 * 1024
+REPEATS = 5
+
+
+def build_feed(items: int) -> bytes:
+    """Generate a feed of ``items`` items, newest first."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        "<title>Amazon EC2 (N. Virginia) Service Status</title>"
+    ]
+    for n in range(items, 0, -1):
+        day, hour = divmod(n, 24)
+        parts.append(
+            f"<item><title>Service is operating normally: [RESOLVED] Event {n}</title>"
+            f"<link>https://status.aws.amazon.com/</link>"
+            f"<pubDate>{time.strftime('%a, %d %b %Y', time.gmtime(day * 86400))} "
+            f"{hour:02d}:00:00 PST</pubDate>"
+            f"<guid isPermaLink='false'>https://status.aws.amazon.com/#ec2_{n}</guid>"
+            f"<description>Between {hour}:00 and {hour}:45 PM PST we experienced increased "
+            f"error rates for EC2 APIs in the US-EAST-1 Region. The issue has been resolved "
+            f"and the service is operating normally. Event {n}.</description></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode()
+
+
+def dom_parse(body: bytes, cursor: FeedCursor) -> int:
+    """Parse the whole document, then walk items until the cursor."""
+    root = ET.fromstring(body)  # noqa: S314  # nosec B314
+    reader = FeedReader(cursor)
+    new = 0
+    for element in root.iter("item"):
+        item = reader._read_item(element)
+        if cursor.reached(item):
+            break
+        new += 1
+    return new
+
+
+def stream_parse(body: bytes, cursor: FeedCursor) -> int:
+    """Feed the document in chunks until the reader stops."""
+    reader = FeedReader(cursor)
+    for offset in range(0, len(body), CHUNK_SIZE):
+        if reader.feed(body[offset : offset + CHUNK_SIZE]):
+            break
+    else:
+        reader.close()
+    return len(reader.items)
+
+
+def measure(
+    parse: Callable[[bytes, FeedCursor], int], body: bytes, cursor: FeedCursor
+) -> tuple[float, int, int]:
+    """Return the fastest time, the peak traced memory and the items found."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        found = parse(body, cursor)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    parse(body, cursor)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, found
+
+
+def main() -> None:
+    """Run both parsers and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000, help="items in the generated feed")
+    parser.add_argument("--new", type=int, default=5, help="items newer than the last-seen one")
+    parser.add_argument("--feed", type=Path, help="parse this feed file instead of generating one")
+    args = parser.parse_args()
+
+    body = args.feed.read_bytes() if args.feed else build_feed(args.items)
+    # The last-seen item is the one following the newest ``--new`` items
+    reader = FeedReader(max_items=args.new + 1)
+    reader.feed(body)
+    if len(reader.items) <= args.new:
+        sys.exit(f"The feed has fewer than {args.new + 1} items")
+    seen = reader.items[args.new]
+    cursor = FeedCursor(seen.guid, seen.published_at)
+
+    print(f"Feed of {len(body) / 2**20:.1f} MiB, {args.new} new items")
+    print(f"{'parser':<10} {'time':>10} {'peak memory':>14} {'new items':>10}")
+    for name, parse in (("dom", dom_parse), ("streaming", stream_parse)):
+        elapsed, peak, found = measure(parse, body, cursor)
+        print(f"{name:<10} {elapsed * 1000:>8.2f}ms {peak / 2**20:>11.2f} MiB {found:>10}")
+
+
+if __name__ == "__main__":
+    main()
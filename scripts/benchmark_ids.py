@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark random (UUIDv4) against time-ordered (UUIDv7) primary keys.
+
+Usage:
+    uv run python scripts/benchmark_ids.py [--rows 500000] [--batch 5000]
+
+Inserts the same number of rows into two scratch tables in the configured
+PostgreSQL database, one keyed by ``uuid.uuid4`` and one by ``uuid7``, and
+reports insert throughput and the size of each table's primary key index.
+The tables are created as temporary tables and vanish with the connection.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.config import get_settings
+from src.core.database import create_engine
+from src.core.ids import uuid7
+
+SCHEMES: dict[str, Callable[[], uuid.UUID]] = {
+    "uuid4": uuid.uuid4,
+    "uuid7": uuid7,
+}
+
+
+async def run_scheme(
+    conn: AsyncConnection,
+    name: str,
+    generate: Callable[[], uuid.UUID],
+    rows: int,
+    batch: int,
+) -> tuple[float, int]:
+    """Insert ``rows`` rows keyed by ``generate``.
+
+    Returns:
+        Rows inserted per second and the primary key index size in bytes.
+    """
+    table = f"bench_{name}"
+    await conn.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {table} ("
+            "id uuid PRIMARY KEY, checked_at timestamp NOT NULL DEFAULT now(), "
+            "status varchar(20) NOT NULL)"
+        )
+    )
+    insert = text(f"INSERT INTO {table} (id, status) VALUES (:id, 'operational')")  # noqa: S608  # nosec B608
+
+    started = time.perf_counter()
+    for start in range(0, rows, batch):
+        size = min(batch, rows - start)
+        await conn.execute(insert, [{"id": generate()} for _ in range(size)])
+    elapsed = time.perf_counter() - started
+
+    index_size = await conn.scalar(text(f"SELECT pg_relation_size('{table}_pkey')"))
+    return rows / elapsed, int(index_size or 0)
+
+
+async def benchmark(rows: int, batch: int) -> None:
+    """Run every scheme and print a comparison."""
+    settings = get_settings()
+    engine = create_engine(settings)
+    try:
+        async with engine.connect() as conn:
+            print(f"Inserting {rows:,} rows per scheme in batches of {batch:,}")
+            print(f"{'scheme':<8} {'rows/s':>12} {'pk index':>12}")
+            for name, generate in SCHEMES.items():
+                throughput, index_size = await run_scheme(conn, name, generate, rows, batch)
+                await conn.commit()
+                print(f"{name:<8} {throughput:>12,.0f} {index_size / 2**20:>10.1f} MB")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000, help="rows per scheme")
+    parser.add_argument("--batch", type=int, default=5_000, help="rows per INSERT batch")
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.rows, args.batch))
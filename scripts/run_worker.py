@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Run the status poller without the HTTP API.
+
+Usage:
+    uv run python scripts/run_worker.py
+
+Polls status pages, stores the results and maintains rollups until
+interrupted with Ctrl+C or SIGTERM. Start the API with
+STATUS_POLLER_ENABLED=false when running this worker, so polling stays
+off the API's event loop. Several workers may run at once; they share
+the services between them.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.worker import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Helpers for serving pre-rendered JSON with HTTP validators."""
+
+from fastapi import Request
+from starlette.responses import Response
+
+from src.services.status_cache import RenderedEntity
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's ``If-None-Match`` header matches an ETag.
+
+    Args:
+        request: The incoming request.
+        etag: The current ETag of the resource, compared weakly.
+
+    Returns:
+        True if the client already holds the current representation.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def conditional_json_response(request: Request, entity: RenderedEntity) -> Response:
+    """Serve a rendered entity, answering 304 when the client's copy is current.
+
+    Args:
+        request: The incoming request.
+        entity: Pre-serialized JSON body and its ETag.
+
+    Returns:
+        A 304 response without a body, or a 200 JSON response.
+    """
+    headers = {"ETag": entity.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, entity.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entity.body, media_type="application/json", headers=headers)
@@ -1,10 +1,17 @@
 """FastAPI dependencies for dependency injection."""
 
 from collections.abc import AsyncGenerator
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends, Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.services.events import StatusEventBroker
+from src.services.health import HealthMonitor
+from src.services.status_cache import StatusSnapshotCache
+
+if TYPE_CHECKING:
+    from src.core.database import ReadRouter
 
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
@@ -30,5 +37,91 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
             raise
 
 
-# Type alias for cleaner route signatures
+async def get_read_db_connection(request: Request) -> AsyncGenerator[AsyncConnection]:
+    """Get a database connection for read-only handlers.
+
+    The fast path for list endpoints: statements run on an autocommit
+    connection and return plain rows, with no ORM session, identity map
+    or commit round trip. Connections come from the read replica when
+    one is configured, falling back to the primary as configured, so
+    dashboard reads stay off the primary that the poller writes to.
+    Results may lag the primary by the replica's replication delay.
+
+    Args:
+        request: The incoming FastAPI request.
+
+    Yields:
+        Database connection for the request.
+    """
+    read_router: ReadRouter = request.app.state.db_read_router
+    async with read_router.connect() as connection:
+        yield connection
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Get a database session for read-only handlers that need the ORM.
+
+    The session is bound to an autocommit connection from the read
+    router and is closed without committing. It does not autoflush, and
+    its identity map is discarded with it at the end of the request.
+
+    Args:
+        request: The incoming FastAPI request.
+
+    Yields:
+        Database session for the request.
+    """
+    read_router: ReadRouter = request.app.state.db_read_router
+    async with (
+        read_router.connect() as connection,
+        AsyncSession(bind=connection, autoflush=False, expire_on_commit=False) as session,
+    ):
+        yield session
+
+
+def get_status_cache(request: Request) -> StatusSnapshotCache:
+    """Get the shared status snapshot cache from app state.
+
+    Args:
+        request: The incoming FastAPI request.
+
+    Returns:
+        The application's status snapshot cache.
+    """
+    cache: StatusSnapshotCache = request.app.state.status_cache
+    return cache
+
+
+def get_event_broker(request: Request) -> StatusEventBroker:
+    """Get the shared status event broker from app state.
+
+    Args:
+        request: The incoming FastAPI request.
+
+    Returns:
+        The application's status event broker.
+    """
+    broker: StatusEventBroker = request.app.state.event_broker
+    return broker
+
+
+def get_health_monitor(request: Request) -> HealthMonitor:
+    """Get the background readiness monitor from app state.
+
+    Args:
+        request: The incoming FastAPI request.
+
+    Returns:
+        The application's health monitor.
+    """
+    monitor: HealthMonitor = request.app.state.health_monitor
+    return monitor
+
+
+# Type aliases for cleaner route signatures
 DbSession = Annotated[AsyncSession, Depends(get_db_session)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db_session)]
+ReadDbConnection = Annotated[AsyncConnection, Depends(get_read_db_connection)]
+StatusCache = Annotated[StatusSnapshotCache, Depends(get_status_cache)]
+EventBroker = Annotated[StatusEventBroker, Depends(get_event_broker)]
+Monitor = Annotated[HealthMonitor, Depends(get_health_monitor)]
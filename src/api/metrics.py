@@ -0,0 +1,69 @@
+"""Request instrumentation and the Prometheus scrape endpoint."""
+
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import (
+    HTTP_REQUEST_DB_DURATION,
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DURATION,
+    QueryStats,
+    request_query_stats,
+)
+
+# Label for requests that matched no route, so scans cannot inflate cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Records latency and database work per route template.
+
+    A plain ASGI middleware rather than ``BaseHTTPMiddleware``, so it adds
+    no task or body buffering to each request and leaves streaming
+    responses untouched. Labels use the matched route's template, keeping
+    one series per endpoint instead of one per URL.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request, then record its metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = QueryStats()
+        token = request_query_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_query_stats.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(elapsed)
+            HTTP_REQUEST_DB_QUERIES.labels(route).observe(stats.count)
+            HTTP_REQUEST_DB_DURATION.labels(route).observe(stats.duration)
+
+
+async def metrics_endpoint(request: Request) -> Response:  # noqa: ARG001
+    """Serve every registered metric in the Prometheus text format."""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,152 @@
+"""Request rate limiting for API routes."""
+
+import logging
+import time
+from typing import cast
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from limits import RateLimitItem, RateLimitItemPerSecond
+from limits.aio.storage import MemoryStorage, Storage
+from limits.aio.strategies import (
+    FixedWindowRateLimiter,
+    MovingWindowRateLimiter,
+    RateLimiter,
+    SlidingWindowCounterRateLimiter,
+)
+from limits.storage import storage_from_string
+from starlette.responses import Response
+
+from src.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES: dict[str, type[RateLimiter]] = {
+    "fixed-window": FixedWindowRateLimiter,
+    "moving-window": MovingWindowRateLimiter,
+    "sliding-window-counter": SlidingWindowCounterRateLimiter,
+}
+
+KEY_PREFIX = "status-beacon"
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a client has used up a route's request budget."""
+
+    def __init__(self, limit: RateLimitItem, reset_at: float) -> None:
+        """Initialize the error.
+
+        Args:
+            limit: The limit that was exceeded.
+            reset_at: Unix time at which the client may retry.
+        """
+        super().__init__(f"Rate limit of {limit} exceeded")
+        self.limit = limit
+        self.reset_at = reset_at
+
+
+class ClientRateLimiter:
+    """Per-client, per-route request budgets backed by ``limits``.
+
+    Counters live in ``rate_limit_storage_uri``: ``memory://`` keeps them
+    in the process, while a shared store such as ``redis://redis:6379``
+    makes the budget hold across every worker instead of multiplying it
+    by the worker count. Storage calls are async, so a shared store never
+    blocks the event loop. If the shared store fails, requests are
+    counted in process memory rather than rejected, and the store is left
+    alone for ``rate_limit_storage_retry_seconds`` before it is tried
+    again, so an outage does not cost every request a failing call. The
+    outage is logged when it starts and when the store recovers.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize the limiter.
+
+        Args:
+            settings: Application settings with rate limit configuration.
+        """
+        self.enabled = settings.rate_limit_enabled
+        self.limit = RateLimitItemPerSecond(
+            settings.rate_limit_requests, settings.rate_limit_window_seconds
+        )
+        strategy = STRATEGIES[settings.rate_limit_strategy]
+        self.storage = cast(
+            "Storage", storage_from_string(_async_uri(settings.rate_limit_storage_uri))
+        )
+        self.strategy = strategy(self.storage)
+        self.fallback = strategy(MemoryStorage())
+        self.retry_seconds = settings.rate_limit_storage_retry_seconds
+        self._storage_retry_at = 0.0
+        self._storage_down = False
+
+    async def hit(self, client: str, route: str) -> None:
+        """Count a request against the client's budget for a route.
+
+        Raises:
+            RateLimitExceededError: If the budget is used up.
+        """
+        if not self.enabled:
+            return
+        keys = (KEY_PREFIX, client, route)
+        strategy = self.fallback
+        if time.monotonic() >= self._storage_retry_at:
+            try:
+                allowed = await self.strategy.hit(self.limit, *keys)
+                strategy = self.strategy
+            except Exception:
+                if not self._storage_down:
+                    logger.warning(
+                        "Rate limit storage unavailable; counting in memory, retrying every %.0fs",
+                        self.retry_seconds,
+                        exc_info=True,
+                    )
+                self._storage_down = True
+                self._storage_retry_at = time.monotonic() + self.retry_seconds
+            else:
+                if self._storage_down:
+                    logger.info("Rate limit storage recovered")
+                self._storage_down = False
+        if strategy is self.fallback:
+            allowed = await self.fallback.hit(self.limit, *keys)
+        if not allowed:
+            stats = await strategy.get_window_stats(self.limit, *keys)
+            raise RateLimitExceededError(self.limit, stats.reset_time)
+
+    async def reset(self) -> None:
+        """Clear every counter."""
+        await self.storage.reset()
+        await self.fallback.storage.reset()
+
+
+def _async_uri(uri: str) -> str:
+    """Select the asyncio implementation of a ``limits`` storage URI."""
+    return uri if uri.startswith("async+") else f"async+{uri}"
+
+
+async def enforce_rate_limit(request: Request) -> None:
+    """Route dependency counting the request against the client's budget.
+
+    Buckets are keyed by client address and route template, so
+    ``/services/{service_id}/status`` shares one budget for all services.
+    """
+    limiter: ClientRateLimiter = request.app.state.rate_limiter
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    client = request.client.host if request.client else "unknown"
+    await limiter.hit(client, path)
+
+
+def rate_limit_exceeded_handler(request: Request, exc: Exception) -> Response:  # noqa: ARG001
+    """Answer 429 with a Retry-After hint."""
+    headers = {}
+    if isinstance(exc, RateLimitExceededError):
+        headers = {
+            "Retry-After": str(max(1, int(exc.reset_at - time.time()) + 1)),
+            "X-RateLimit-Limit": str(exc.limit.amount),
+            "X-RateLimit-Remaining": "0",
+        }
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Rate limit exceeded. Please try again later."},
+        headers=headers,
+    )
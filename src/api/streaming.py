@@ -0,0 +1,57 @@
+"""Helpers for serving Server-Sent Events."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import Request
+from starlette.responses import StreamingResponse
+
+from src.services.events import StatusEventBroker, Subscription
+
+
+async def sse_events(
+    request: Request,
+    broker: StatusEventBroker,
+    subscription: Subscription,
+    keepalive_seconds: float,
+) -> AsyncIterator[str]:
+    """Render a subscription as a Server-Sent Events stream.
+
+    A comment line is sent after ``keepalive_seconds`` without events so
+    proxies keep the connection open and disconnected clients are noticed.
+    If the subscription overflows, a final ``overflow`` event tells the
+    client to resynchronize before reconnecting.
+
+    Args:
+        request: The streaming request, checked for disconnects.
+        broker: Broker the subscription belongs to.
+        subscription: Subscription to drain.
+        keepalive_seconds: Idle time before a keepalive is sent.
+
+    Yields:
+        Encoded SSE frames.
+    """
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.next(), keepalive_seconds)
+            except TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            yield f"event: {event.type}\ndata: {event.data}\n\n"
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an SSE frame iterator in an uncached, unbuffered response."""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
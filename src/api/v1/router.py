@@ -1,9 +1,16 @@
 """API v1 router aggregating all route modules."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from src.api.v1.routes import health
+from src.api.rate_limit import enforce_rate_limit
+from src.api.v1.routes import health, incidents, services, stream
 
 api_router = APIRouter()
 
+# Health probes are never rate limited
+rate_limited = [Depends(enforce_rate_limit)]
+
 api_router.include_router(health.router)
+api_router.include_router(incidents.router, dependencies=rate_limited)
+api_router.include_router(services.router, dependencies=rate_limited)
+api_router.include_router(stream.router, dependencies=rate_limited)
@@ -1,12 +1,15 @@
 """Health check endpoints."""
 
+from datetime import datetime
 from typing import Literal
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter
 from pydantic import BaseModel
-from sqlalchemy import text
 
 from src import __version__
+from src.api.dependencies import Monitor
+from src.core.clock import utcnow
+from src.services.health import DatabaseStatus, HealthStatus
 
 router = APIRouter(tags=["health"])
 
@@ -21,9 +24,13 @@ class HealthResponse(BaseModel):
 class ReadinessResponse(BaseModel):
     """Detailed health check with component status."""
 
-    status: Literal["healthy", "degraded", "unhealthy"]
+    status: HealthStatus
     version: str
-    database: Literal["connected", "disconnected"]
+    database: DatabaseStatus
+    checked_at: datetime | None = None
+    age_seconds: float | None = None
+    last_poll_at: datetime | None = None
+    poll_age_seconds: float | None = None
 
 
 @router.get(
@@ -41,29 +48,27 @@ async def health_check() -> HealthResponse:
     "/health/ready",
     response_model=ReadinessResponse,
     summary="Readiness check",
-    description="Returns detailed health status including database connectivity",
+    description=(
+        "Returns the cached verdict of the background health monitor: database "
+        "connectivity, freshness of poll results and the age of the verdict"
+    ),
 )
-async def readiness_check(request: Request) -> ReadinessResponse:
-    """Check if the API is ready to serve requests.
+async def readiness_check(monitor: Monitor) -> ReadinessResponse:
+    """Report the verdict of the background health monitor.
 
-    This endpoint verifies database connectivity in addition to basic health.
+    Probes never touch the database: the monitor checks connectivity and
+    poll freshness on its own schedule, and the response says how old its
+    verdict is. Stale poll results report ``degraded``.
     """
-    db_status: Literal["connected", "disconnected"] = "disconnected"
-
-    try:
-        session_factory = request.app.state.db_session_factory
-        async with session_factory() as session:
-            await session.execute(text("SELECT 1"))
-            db_status = "connected"
-    except Exception:  # noqa: S110  # nosec B110
-        pass
-
-    overall_status: Literal["healthy", "degraded", "unhealthy"] = (
-        "healthy" if db_status == "connected" else "unhealthy"
-    )
-
+    verdict = monitor.verdict
+    if verdict is None:
+        return ReadinessResponse(status="unhealthy", version=__version__, database="disconnected")
     return ReadinessResponse(
-        status=overall_status,
+        status=monitor.status(),
         version=__version__,
-        database=db_status,
+        database=verdict.database,
+        checked_at=verdict.checked_at,
+        age_seconds=(utcnow() - verdict.checked_at).total_seconds(),
+        last_poll_at=verdict.last_poll_at,
+        poll_age_seconds=verdict.poll_age_seconds(),
     )
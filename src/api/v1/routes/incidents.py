@@ -0,0 +1,35 @@
+"""Incident endpoints."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from src.api.dependencies import ReadDbConnection
+from src.models import IncidentStatus
+from src.services.incidents import IncidentPage, load_incident_page
+from src.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+
+router = APIRouter(prefix="/incidents", tags=["incidents"])
+
+
+@router.get(
+    "",
+    response_model=IncidentPage,
+    summary="List incidents",
+    description=(
+        "Returns incidents in the given status, newest first. Pass the returned "
+        "`next_cursor` as `cursor` to fetch the following page."
+    ),
+    responses={400: {"description": "Invalid cursor"}},
+)
+async def list_incidents(
+    connection: ReadDbConnection,
+    incident_status: Annotated[IncidentStatus, Query(alias="status")],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> IncidentPage:
+    """List incidents with keyset pagination."""
+    try:
+        return await load_incident_page(connection, incident_status, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
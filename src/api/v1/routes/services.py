@@ -0,0 +1,121 @@
+"""Service and current status endpoints."""
+
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from starlette.responses import Response
+
+from src.api.caching import conditional_json_response
+from src.api.dependencies import ReadDbConnection, ReadDbSession, StatusCache
+from src.services.history import StatusHistoryPage, load_history_page
+from src.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from src.services.rollups import UptimeReport, UptimeWindow, load_uptime
+from src.services.status_cache import ServiceSnapshot
+
+router = APIRouter(prefix="/services", tags=["services"])
+
+
+@router.get(
+    "",
+    response_model=list[ServiceSnapshot],
+    summary="List services",
+    description=(
+        "Returns every monitored service with its current status. Supports "
+        "conditional requests via ETag/If-None-Match."
+    ),
+    responses={304: {"description": "Not modified"}},
+)
+async def list_services(request: Request, cache: StatusCache) -> Response:
+    """List all active services from the in-memory status snapshot."""
+    snapshot = await cache.get()
+    return conditional_json_response(request, snapshot.services)
+
+
+@router.get(
+    "/{service_id}/status",
+    response_model=ServiceSnapshot,
+    summary="Get service status",
+    description=(
+        "Returns the current status of a single service. Supports conditional "
+        "requests via ETag/If-None-Match."
+    ),
+    responses={
+        304: {"description": "Not modified"},
+        404: {"description": "Service not found"},
+    },
+)
+async def get_service_status(
+    service_id: uuid.UUID,
+    request: Request,
+    cache: StatusCache,
+) -> Response:
+    """Get the current status of a service from the in-memory snapshot."""
+    snapshot = await cache.get()
+    entity = snapshot.by_id.get(service_id)
+    if entity is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Service not found")
+    return conditional_json_response(request, entity)
+
+
+@router.get(
+    "/{service_id}/uptime",
+    response_model=UptimeReport,
+    summary="Get service uptime",
+    description=(
+        "Returns the time a service spent in each status and its uptime ratio "
+        "over the last 24 hours, 7, 30 or 90 days, read from pre-aggregated "
+        "rollups. Maintenance and unknown time are excluded from the ratio."
+    ),
+    responses={404: {"description": "Service not found"}},
+)
+async def get_service_uptime(
+    service_id: uuid.UUID,
+    cache: StatusCache,
+    session: ReadDbSession,
+    window: UptimeWindow = "24h",
+) -> UptimeReport:
+    """Get uptime for a service over a rolling window."""
+    snapshot = await cache.get()
+    if service_id not in snapshot.by_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Service not found")
+    summary = await load_uptime(session, service_id, window)
+    return UptimeReport(
+        service_id=service_id,
+        window=summary.window,
+        since=summary.since,
+        until=summary.until,
+        uptime_ratio=summary.uptime_ratio,
+        seconds=summary.seconds,
+    )
+
+
+@router.get(
+    "/{service_id}/history",
+    response_model=StatusHistoryPage,
+    summary="Get service status history",
+    description=(
+        "Returns the stored status records of a service, newest first. Each "
+        "record covers a run of identical observations. Pass the returned "
+        "`next_cursor` as `cursor` to fetch the following page."
+    ),
+    responses={
+        400: {"description": "Invalid cursor"},
+        404: {"description": "Service not found"},
+    },
+)
+async def get_service_history(
+    service_id: uuid.UUID,
+    cache: StatusCache,
+    connection: ReadDbConnection,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> StatusHistoryPage:
+    """Get a page of status history with keyset pagination."""
+    snapshot = await cache.get()
+    if service_id not in snapshot.by_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Service not found")
+    try:
+        return await load_history_page(connection, service_id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -0,0 +1,55 @@
+"""Streaming endpoints pushing status changes and incidents to clients."""
+
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from starlette.responses import StreamingResponse
+
+from src.api.dependencies import EventBroker, StatusCache
+from src.api.streaming import sse_events, sse_response
+from src.core.config import get_settings
+from src.services.events import SubscriberLimitError
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+
+
+@router.get(
+    "",
+    summary="Stream status transitions and incidents",
+    description=(
+        "Server-Sent Events stream of `status` transitions and new or changed "
+        "`incident`s as they are ingested. "
+        "Filter by `service_id` and/or `provider` (both repeatable); events for "
+        "services matching any filter are sent. Clients that fall too far behind "
+        "receive an `overflow` event and are disconnected, and should reload "
+        "current state before reconnecting."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        503: {"description": "Too many stream subscribers"},
+    },
+)
+async def stream_status(
+    request: Request,
+    broker: EventBroker,
+    cache: StatusCache,
+    service_id: Annotated[list[uuid.UUID] | None, Query()] = None,
+    provider: Annotated[list[str] | None, Query()] = None,
+) -> StreamingResponse:
+    """Open an event stream of status transitions and incidents."""
+    service_ids: frozenset[uuid.UUID] | None = None
+    if service_id or provider:
+        ids = set(service_id or ())
+        if provider:
+            snapshot = await cache.get()
+            ids.update(sid for sid, name in snapshot.providers.items() if name in provider)
+        service_ids = frozenset(ids)
+
+    try:
+        subscription = broker.subscribe(service_ids)
+    except SubscriberLimitError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
+    keepalive = get_settings().stream_keepalive_seconds
+    return sse_response(sse_events(request, broker, subscription, keepalive))
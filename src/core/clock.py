@@ -0,0 +1,12 @@
+"""Time helpers shared across the application."""
+
+from datetime import UTC, datetime
+
+
+def utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime.
+
+    Timestamp columns are declared without a time zone, so values written
+    from Python must be naive UTC to match what the database stores.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
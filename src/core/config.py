@@ -20,9 +20,27 @@ class Settings(BaseSettings):
         - APP_NAME, DEBUG, ENVIRONMENT
         - HOST, PORT
         - POSTGRES_PORT, DB_POOL_SIZE, DB_POOL_OVERFLOW, DB_POOL_TIMEOUT
+        - POSTGRES_REPLICA_HOST, POSTGRES_REPLICA_PORT
+        - DB_REPLICA_FALLBACK, DB_REPLICA_RETRY_SECONDS
         - CORS_ORIGINS
-        - RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW_SECONDS
-        - STATUS_POLL_INTERVAL_SECONDS
+        - RATE_LIMIT_ENABLED, RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW_SECONDS
+        - RATE_LIMIT_STRATEGY, RATE_LIMIT_STORAGE_URI, RATE_LIMIT_STORAGE_RETRY_SECONDS
+        - STATUS_POLL_INTERVAL_SECONDS, STATUS_POLLER_ENABLED
+        - STATUS_POLL_MIN_INTERVAL_SECONDS, STATUS_POLL_MAX_INTERVAL_SECONDS
+        - STATUS_POLL_BACKOFF_FACTOR, STATUS_POLL_BUDGET_PER_MINUTE, STATUS_POLL_TICK_SECONDS
+        - STATUS_POLL_CLAIM_SECONDS, STATUS_PARSE_WORKERS
+        - STATUS_POLL_CONCURRENCY, STATUS_POLL_PER_HOST_LIMIT
+        - STATUS_POLL_TIMEOUT_SECONDS, STATUS_POLL_JITTER_RATIO
+        - STATUS_POLL_CIRCUIT_FAILURE_THRESHOLD, STATUS_POLL_CIRCUIT_BACKOFF_SECONDS
+        - STATUS_POLL_CIRCUIT_MAX_BACKOFF_SECONDS
+        - STATUS_HISTORY_MODE, STATUS_RETENTION_DAYS
+        - STATUS_WRITE_BATCH_SIZE, STATUS_WRITE_FLUSH_MS, STATUS_WRITE_QUEUE_SIZE
+        - STATUS_PARTITION_PREMAKE_DAYS, STATUS_PARTITION_MAINTENANCE_INTERVAL_SECONDS
+        - UPTIME_ROLLUP_FLUSH_SECONDS, UPTIME_MAX_GAP_SECONDS, UPTIME_HOURLY_RETENTION_DAYS
+        - STREAM_CLIENT_BUFFER_SIZE, STREAM_MAX_SUBSCRIBERS, STREAM_KEEPALIVE_SECONDS
+        - STATUS_NOTIFY_ENABLED, STATUS_NOTIFY_CHANNEL
+        - METRICS_ENABLED, WORKER_METRICS_PORT
+        - HEALTH_CHECK_INTERVAL_SECONDS, HEALTH_CHECK_TIMEOUT_SECONDS, HEALTH_POLL_STALE_SECONDS
     """
 
     model_config = SettingsConfigDict(
@@ -56,6 +74,12 @@ class Settings(BaseSettings):
     db_pool_overflow: int = 10  # Max extra connections when pool is exhausted
     db_pool_timeout: int = 30  # Seconds to wait for a connection from pool
 
+    # Optional read replica serving GET endpoints
+    postgres_replica_host: str | None = None
+    postgres_replica_port: int | None = None  # Defaults to POSTGRES_PORT
+    db_replica_fallback: bool = True  # Read from the primary while the replica is unreachable
+    db_replica_retry_seconds: float = 30.0  # How long to avoid a replica after a failed connect
+
     @property
     def database_url(self) -> PostgresDsn:
         """Build the database URL from components.
@@ -72,6 +96,23 @@ class Settings(BaseSettings):
             path=self.postgres_db,
         )
 
+    @property
+    def replica_database_url(self) -> PostgresDsn | None:
+        """Build the read replica URL, or None when no replica is configured.
+
+        The replica shares the primary's credentials and database name.
+        """
+        if not self.postgres_replica_host:
+            return None
+        return PostgresDsn.build(
+            scheme="postgresql+asyncpg",
+            username=self.postgres_user,
+            password=self.postgres_password.get_secret_value(),
+            host=self.postgres_replica_host,
+            port=self.postgres_replica_port or self.postgres_port,
+            path=self.postgres_db,
+        )
+
     @property
     def database_url_masked(self) -> str:
         """Return database URL with password masked for logging."""
@@ -84,11 +125,69 @@ class Settings(BaseSettings):
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:7007"]
 
     # Rate limiting
-    rate_limit_requests: int = 100  # Max requests per window
+    rate_limit_enabled: bool = True
+    rate_limit_requests: int = 100  # Max requests per window, per client and route
     rate_limit_window_seconds: int = 60  # Window duration in seconds
+    rate_limit_strategy: Literal["fixed-window", "moving-window", "sliding-window-counter"] = (
+        "sliding-window-counter"
+    )
+    rate_limit_storage_uri: str = "memory://"  # e.g. redis://redis:6379 to share across workers
+    rate_limit_storage_retry_seconds: float = 30.0  # Memory-only counting after a storage failure
 
     # Polling (operational default)
-    status_poll_interval_seconds: int = 60
+    status_poll_interval_seconds: int = 60  # Base cadence of a service
+    status_poll_min_interval_seconds: int = 15  # Cadence during incidents and outages
+    status_poll_max_interval_seconds: int = 600  # Ceiling for quiet services
+    status_poll_backoff_factor: float = 1.5  # Interval growth per unchanged poll
+    status_poll_budget_per_minute: int = 600  # Max upstream fetches per minute, all pollers
+    status_poll_tick_seconds: float = 5.0  # How often due services are collected
+    status_poll_claim_seconds: int = 120  # Lease on claimed services before others retry them
+    status_parse_workers: int = 2  # Processes decoding status pages; 0 decodes inline
+    status_poller_enabled: bool = True  # Run the poller inside the API process
+    status_poll_concurrency: int = 50  # Max in-flight status page fetches
+    status_poll_per_host_limit: int = 4  # Max concurrent fetches per upstream host
+    status_poll_timeout_seconds: float = 10.0  # HTTP timeout for a single fetch
+    status_poll_jitter_ratio: float = 0.5  # Fraction of the tick used to spread starts
+    status_poll_circuit_failure_threshold: int = 3  # Consecutive host failures opening its circuit
+    status_poll_circuit_backoff_seconds: float = 60.0  # First open period; doubles on each trip
+    status_poll_circuit_max_backoff_seconds: float = 3600.0
+
+    # Status history storage: one row per run of identical polls, or one per poll
+    status_history_mode: Literal["run_length", "per_poll"] = "run_length"
+
+    # Write-behind buffer batching changed poll results into shared transactions
+    status_write_batch_size: int = 500  # Most poll results written per transaction
+    status_write_flush_ms: int = 250  # Longest a poll result waits for its batch to fill
+    status_write_queue_size: int = 5000  # Queued results before polling waits for writes
+
+    # Status history partitions (PostgreSQL only)
+    status_retention_days: int = 90  # Daily partitions older than this are dropped
+    status_partition_premake_days: int = 7  # Daily partitions created ahead of time
+    status_partition_maintenance_interval_seconds: int = 3600
+
+    # Uptime rollups
+    uptime_rollup_flush_seconds: int = 60  # How often accumulated rollups are written
+    # Longest gap between polls still counted as covered; at least max interval plus claim lease
+    uptime_max_gap_seconds: int = 300
+    uptime_hourly_retention_days: int = 30  # Hourly rollups older than this are deleted
+
+    # Event stream
+    stream_client_buffer_size: int = 100  # Events buffered per client before it is dropped
+    stream_max_subscribers: int = 1000  # Concurrent stream connections per process
+    stream_keepalive_seconds: float = 15.0  # Idle time before a keepalive comment is sent
+
+    # Cross-worker change notifications (PostgreSQL LISTEN/NOTIFY)
+    status_notify_enabled: bool = True
+    status_notify_channel: str = "status_beacon_changes"
+
+    # Prometheus metrics, served at /metrics
+    metrics_enabled: bool = True
+    worker_metrics_port: int = 9100  # Where the standalone worker serves its metrics
+
+    # Readiness monitor; probes read its cached verdict
+    health_check_interval_seconds: float = 10.0
+    health_check_timeout_seconds: float = 5.0
+    health_poll_stale_seconds: int = 1200  # Report degraded when no poll landed for this long
 
 
 @lru_cache
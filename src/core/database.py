@@ -1,8 +1,16 @@
 """Async database engine and session management."""
 
-from collections.abc import AsyncGenerator
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -10,6 +18,9 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from src.core.config import Settings
+from src.core.metrics import InstrumentedQueuePool
+
+logger = logging.getLogger(__name__)
 
 
 def create_engine(settings: Settings) -> AsyncEngine:
@@ -21,8 +32,29 @@ def create_engine(settings: Settings) -> AsyncEngine:
     Returns:
         Configured async SQLAlchemy engine.
     """
+    return _create_engine(str(settings.database_url), settings)
+
+
+def create_replica_engine(settings: Settings) -> AsyncEngine | None:
+    """Create the read replica engine, if a replica is configured.
+
+    The replica engine gets a pool of the same size as the primary's.
+
+    Args:
+        settings: Application settings containing database configuration.
+
+    Returns:
+        Configured async SQLAlchemy engine, or None without a replica.
+    """
+    url = settings.replica_database_url
+    return _create_engine(str(url), settings) if url is not None else None
+
+
+def _create_engine(url: str, settings: Settings) -> AsyncEngine:
+    """Create an async engine with the configured pool settings."""
     return create_async_engine(
-        str(settings.database_url),
+        url,
+        poolclass=InstrumentedQueuePool,
         pool_size=settings.db_pool_size,
         max_overflow=settings.db_pool_overflow,
         pool_timeout=settings.db_pool_timeout,
@@ -48,6 +80,90 @@ def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSessi
     )
 
 
+class ReadRouter:
+    """Opens connections for read-only requests, preferring the replica.
+
+    Connections run in ``AUTOCOMMIT`` mode, so reads issue no ``BEGIN``
+    or ``COMMIT`` round trips; they share the engines' pools. They are
+    opened before being handed out, so an unreachable replica is
+    detected up front. With fallback enabled the request is then served
+    by the primary, and the replica is skipped for ``retry_seconds`` so
+    each request does not pay for a failing connect. Without a replica
+    every connection comes from the primary.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replica: AsyncEngine | None = None,
+        *,
+        fallback: bool = True,
+        retry_seconds: float = 30.0,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            primary: Engine of the primary.
+            replica: Engine of the replica, if any.
+            fallback: Whether to read from the primary when the replica fails.
+            retry_seconds: How long to avoid the replica after a failed connect.
+        """
+        self.primary = primary.execution_options(isolation_level="AUTOCOMMIT")
+        self.replica = replica.execution_options(isolation_level="AUTOCOMMIT") if replica else None
+        self.fallback = fallback
+        self.retry_seconds = retry_seconds
+        self._replica_retry_at = 0.0
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator[AsyncConnection]:
+        """Open an autocommit connection on the replica, or on the primary.
+
+        Yields:
+            The open connection, closed on exit.
+
+        Raises:
+            DBAPIError: If the replica is unreachable and fallback is disabled.
+            OSError: If the replica is unreachable and fallback is disabled.
+        """
+        connection = None
+        if self.replica is not None and time.monotonic() >= self._replica_retry_at:
+            try:
+                connection = await self.replica.connect()
+            except (OSError, DBAPIError):
+                if not self.fallback:
+                    raise
+                logger.warning(
+                    "Read replica unavailable; reading from the primary for %.0fs",
+                    self.retry_seconds,
+                    exc_info=True,
+                )
+                self._replica_retry_at = time.monotonic() + self.retry_seconds
+        if connection is None:
+            connection = await self.primary.connect()
+        try:
+            yield connection
+        finally:
+            await connection.close()
+
+
+def upsert(dialect_name: str, table: Table | type[Any]) -> postgresql.Insert:
+    """Build an INSERT that supports ``ON CONFLICT`` clauses.
+
+    The application runs on PostgreSQL; SQLite's compatible construct is
+    returned for its dialect so the same statements run in the test suite.
+
+    Args:
+        dialect_name: Name of the dialect the statement will run on.
+        table: Table or mapped class to insert into.
+
+    Returns:
+        A dialect-specific insert construct.
+    """
+    if dialect_name == "sqlite":
+        return sqlite.insert(table)  # type: ignore[return-value]
+    return postgresql.insert(table)
+
+
 async def get_session(
     session_factory: async_sessionmaker[AsyncSession],
 ) -> AsyncGenerator[AsyncSession]:
@@ -0,0 +1,208 @@
+"""Prometheus metrics and database instrumentation.
+
+Metrics are registered on the default ``prometheus_client`` registry and
+exposed by the API at ``/metrics``. Recording a sample is an in-process
+counter increment, so instrumentation stays on in production.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+NAMESPACE = "status_beacon"
+
+# Latency buckets from fast cache hits up to slow upstream status pages
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+BATCH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve an HTTP request, by route template",
+    ["method", "route", "status"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries executed while serving a request",
+    ["route"],
+    namespace=NAMESPACE,
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in database queries while serving a request",
+    ["route"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of a single database query",
+    ["pool"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time waited to obtain a pooled database connection",
+    ["pool"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts",
+    "Connection checkouts that gave up after the pool timeout",
+    ["pool"],
+    namespace=NAMESPACE,
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pooled database connections by state",
+    ["pool", "state"],
+    namespace=NAMESPACE,
+)
+DB_POOL_MAX_CONNECTIONS = Gauge(
+    "db_pool_max_connections",
+    "Connections the pool may open, including overflow",
+    ["pool"],
+    namespace=NAMESPACE,
+)
+POLL_FETCH_DURATION = Histogram(
+    "poll_fetch_duration_seconds",
+    "Time to fetch a status page, by provider and outcome",
+    ["provider", "outcome"],
+    namespace=NAMESPACE,
+    buckets=LATENCY_BUCKETS,
+)
+POLL_CIRCUIT_STATE = Gauge(
+    "poll_circuit_state",
+    "Circuit state of an upstream status host: 0 closed, 1 half-open, 2 open",
+    ["host"],
+    namespace=NAMESPACE,
+)
+POLL_CIRCUIT_OPENED = Counter(
+    "poll_circuit_opened",
+    "Times the circuit of an upstream status host opened",
+    ["host"],
+    namespace=NAMESPACE,
+)
+INGEST_BATCH_SIZE = Histogram(
+    "ingest_batch_size",
+    "Services or incidents written per ingest transaction",
+    ["operation"],
+    namespace=NAMESPACE,
+    buckets=BATCH_SIZE_BUCKETS,
+)
+STATUS_WRITE_QUEUE_DEPTH = Gauge(
+    "status_write_queue_depth",
+    "Poll results waiting in the write-behind buffer",
+    namespace=NAMESPACE,
+)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Database work done on behalf of the current request."""
+
+    count: int = 0
+    duration: float = 0.0
+
+
+request_query_stats: ContextVar[QueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait.
+
+    The measured time covers waiting for a free connection, opening an
+    overflow connection when allowed, and the pre-ping.
+    """
+
+    metrics_label = "primary"
+
+    @property
+    def max_connections(self) -> int:
+        """Connections the pool may hold open at once, or 0 if unbounded."""
+        return 0 if self._max_overflow < 0 else self.size() + self._max_overflow
+
+    def recreate(self) -> InstrumentedQueuePool:
+        """Create a replacement pool, as ``engine.dispose()`` does, keeping the label."""
+        pool = cast("InstrumentedQueuePool", super().recreate())
+        pool.metrics_label = self.metrics_label
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing the wait."""
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(self.metrics_label).inc()
+            raise
+        DB_POOL_CHECKOUT_DURATION.labels(self.metrics_label).observe(time.perf_counter() - started)
+        return connection
+
+
+def instrument_engine(engine: AsyncEngine, label: str = "primary") -> None:
+    """Record query durations and pool saturation for an engine.
+
+    Queries are timed with cursor execution events and also attributed to
+    the request being served, if any. Pool gauges are read from the live
+    pool at scrape time, so they survive ``engine.dispose()``.
+
+    Args:
+        engine: The engine to instrument.
+        label: Value of the ``pool`` label on its metrics.
+    """
+    sync_engine = engine.sync_engine
+    if isinstance(sync_engine.pool, InstrumentedQueuePool):
+        sync_engine.pool.metrics_label = label
+    query_duration = DB_QUERY_DURATION.labels(label)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_query(conn: Connection, *_: Any) -> None:
+        conn.info["query_started_at"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _end_query(conn: Connection, *_: Any) -> None:
+        elapsed = time.perf_counter() - conn.info.pop("query_started_at", time.perf_counter())
+        query_duration.observe(elapsed)
+        stats = request_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+
+    _register_pool_gauges(sync_engine, label)
+
+
+def _register_pool_gauges(sync_engine: Engine, label: str) -> None:
+    """Expose the pool's checked-out, idle and maximum connections."""
+
+    def read(stat: Callable[[InstrumentedQueuePool], int]) -> Callable[[], float]:
+        def value() -> float:
+            pool = sync_engine.pool
+            return stat(pool) if isinstance(pool, InstrumentedQueuePool) else 0
+
+        return value
+
+    DB_POOL_CONNECTIONS.labels(label, "checked_out").set_function(
+        read(InstrumentedQueuePool.checkedout)
+    )
+    DB_POOL_CONNECTIONS.labels(label, "idle").set_function(read(InstrumentedQueuePool.checkedin))
+    DB_POOL_MAX_CONNECTIONS.labels(label).set_function(read(lambda pool: pool.max_connections))
@@ -3,32 +3,47 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
-from starlette.responses import Response
 
 from src import __version__
+from src.api.metrics import MetricsMiddleware, metrics_endpoint
+from src.api.rate_limit import (
+    ClientRateLimiter,
+    RateLimitExceededError,
+    rate_limit_exceeded_handler,
+)
 from src.api.v1.router import api_router
 from src.core.config import get_settings
-from src.core.database import create_engine, create_session_factory
-
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
-
-def rate_limit_exceeded_handler(
-    request: Request,  # noqa: ARG001
-    exc: Exception,  # noqa: ARG001
-) -> Response:
-    """Custom handler for rate limit exceeded errors."""
-    return JSONResponse(
-        status_code=429,
-        content={"detail": "Rate limit exceeded. Please try again later."},
-    )
+from src.core.database import (
+    ReadRouter,
+    create_engine,
+    create_replica_engine,
+    create_session_factory,
+)
+from src.core.metrics import instrument_engine
+from src.services.events import StatusEventBroker
+from src.services.health import HealthMonitor
+from src.services.notify import StatusNotificationBus
+from src.services.partitions import PartitionMaintainer
+from src.services.poller import StatusPoller
+from src.services.rollups import UptimeAggregator
+from src.services.status_cache import StatusSnapshotCache
+
+
+def _relay_notifications(
+    bus: StatusNotificationBus,
+    poller: StatusPoller,
+    status_cache: StatusSnapshotCache,
+    event_broker: StatusEventBroker,
+) -> None:
+    """Broadcast this process's writes and apply other processes' to local state."""
+    poller.ingestor.add_listener(bus.publish)
+    poller.incidents.add_listener(bus.publish_incidents)
+    bus.add_listener(status_cache.apply)
+    bus.add_listener(event_broker.publish)
+    bus.add_incident_listener(event_broker.publish_incidents)
+    bus.add_reset_listener(status_cache.invalidate)
 
 
 @asynccontextmanager
@@ -43,10 +58,73 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     session_factory = create_session_factory(engine)
     app.state.db_engine = engine
     app.state.db_session_factory = session_factory
+    if settings.metrics_enabled:
+        instrument_engine(engine)
+
+    # Optional read replica for GET endpoints, keeping reads off the write path
+    replica_engine = create_replica_engine(settings)
+    app.state.db_replica_engine = replica_engine
+    if replica_engine is not None and settings.metrics_enabled:
+        instrument_engine(replica_engine, label="replica")
+    app.state.db_read_router = ReadRouter(
+        engine,
+        replica_engine,
+        fallback=settings.db_replica_fallback,
+        retry_seconds=settings.db_replica_retry_seconds,
+    )
+
+    # Keep status history partitions ahead of time and within retention
+    partition_maintainer = PartitionMaintainer(engine, settings)
+    await partition_maintainer.start()
+
+    # In-memory status snapshot served by read endpoints
+    status_cache = StatusSnapshotCache(session_factory)
+    app.state.status_cache = status_cache
+
+    # Start background status polling; its writes keep the snapshot current
+    poller = StatusPoller(settings, session_factory)
+    poller.ingestor.add_listener(status_cache.apply)
+    app.state.poller = poller
+
+    # Push transitions to streaming clients
+    event_broker = StatusEventBroker(
+        settings.stream_client_buffer_size, settings.stream_max_subscribers
+    )
+    poller.ingestor.add_listener(event_broker.publish)
+    poller.incidents.add_listener(event_broker.publish_incidents)
+    app.state.event_broker = event_broker
+
+    # Share updates with other workers and apply theirs to this one's state
+    notification_bus = StatusNotificationBus(settings)
+    _relay_notifications(notification_bus, poller, status_cache, event_broker)
+    if settings.status_notify_enabled and engine.dialect.name == "postgresql":
+        await notification_bus.start()
+
+    # Fold every observation into hourly/daily uptime rollups
+    uptime_aggregator = UptimeAggregator(session_factory, settings)
+    poller.ingestor.add_listener(uptime_aggregator.apply)
+    poller.ingestor.add_resync_listener(uptime_aggregator.resync)
+    await uptime_aggregator.start()
+
+    if settings.status_poller_enabled:
+        await poller.start()
+
+    # Readiness is checked in the background; probes read the cached verdict
+    health_monitor = HealthMonitor(engine, settings)
+    app.state.health_monitor = health_monitor
+    await health_monitor.start()
 
     yield
 
-    # Shutdown - close database connections
+    # Shutdown - stop background tasks, then close database connections
+    await health_monitor.stop()
+    # Writes the poll results still buffered, so their listeners see them before stopping
+    await poller.stop()
+    await uptime_aggregator.stop()
+    await notification_bus.stop()
+    await partition_maintainer.stop()
+    if replica_engine is not None:
+        await replica_engine.dispose()
     await engine.dispose()
 
 
@@ -74,6 +152,18 @@ def create_app() -> FastAPI:
                 "name": "health",
                 "description": "Health check endpoints for monitoring API status",
             },
+            {
+                "name": "incidents",
+                "description": "Incidents reported by third-party status pages",
+            },
+            {
+                "name": "services",
+                "description": "Monitored services and their current status",
+            },
+            {
+                "name": "stream",
+                "description": "Server-Sent Events stream of status transitions",
+            },
         ],
     )
 
@@ -86,9 +176,14 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Rate limiting
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    # Prometheus metrics: per-route latency and database work, scraped at /metrics
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    # Rate limiting, enforced per client and route by the API router
+    app.state.rate_limiter = ClientRateLimiter(settings)
+    app.add_exception_handler(RateLimitExceededError, rate_limit_exceeded_handler)
 
     # Include API router
     app.include_router(api_router, prefix=settings.api_v1_prefix)
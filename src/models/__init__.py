@@ -7,14 +7,21 @@ Import from here rather than individual model files.
 from src.models.base import Base, TimestampMixin
 from src.models.enums import IncidentImpact, IncidentStatus, ServiceStatus
 from src.models.incident import Incident
+from src.models.poll_budget import PollBudgetBucket
+from src.models.raw_payload import RawPayload
 from src.models.service import Service
 from src.models.service_status import ServiceStatusRecord
+from src.models.status_rollup import DailyStatusRollup, HourlyStatusRollup
 
 __all__ = [
     "Base",
+    "DailyStatusRollup",
+    "HourlyStatusRollup",
     "Incident",
     "IncidentImpact",
     "IncidentStatus",
+    "PollBudgetBucket",
+    "RawPayload",
     "Service",
     "ServiceStatus",
     "ServiceStatusRecord",
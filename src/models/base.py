@@ -6,8 +6,11 @@ from typing import Any
 
 from sqlalchemy import MetaData, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
+from src.core.ids import uuid7
+
 # Naming convention for constraints (important for Alembic migrations)
 NAMING_CONVENTION: dict[str, str] = {
     "ix": "ix_%(column_0_label)s",
@@ -18,13 +21,14 @@ NAMING_CONVENTION: dict[str, str] = {
 }
 
 
-class Base(DeclarativeBase):
+class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all SQLAlchemy models.
 
     Provides:
-    - UUID primary keys
+    - Time-ordered UUIDv7 primary keys
     - Automatic table naming
     - Naming convention for constraints
+    - ``awaitable_attrs`` for loading lazy relationships under asyncio
     """
 
     metadata = MetaData(naming_convention=NAMING_CONVENTION)
@@ -39,7 +43,7 @@ class Base(DeclarativeBase):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     def to_dict(self) -> dict[str, Any]:
@@ -68,7 +68,7 @@ class Incident(Base, TimestampMixin):
             "external_id",
             unique=True,
         ),
-        Index("ix_incident_status_created", "status", "created_at"),
+        Index("ix_incident_status_created", "status", "created_at", "id"),
         Index("ix_incident_service_status", "service_id", "status"),
     )
 
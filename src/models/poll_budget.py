@@ -0,0 +1,38 @@
+"""Shared token bucket for upstream status page fetches."""
+
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import Float, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class PollBudgetBucket(Base):
+    """Tokens left in a fetch budget shared by every poller.
+
+    Each poller locks the row while claiming due services, refills it for
+    the time elapsed since ``refilled_at`` and takes one token per claimed
+    service, so ``STATUS_POLL_BUDGET_PER_MINUTE`` holds across all
+    replicas and workers rather than per process.
+    """
+
+    name: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    tokens: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+    refilled_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+    )
+
+    __table_args__ = (Index("uq_poll_budget_bucket_name", "name", unique=True),)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<PollBudgetBucket(name={self.name!r}, tokens={self.tokens:.1f})>"
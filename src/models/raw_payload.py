@@ -0,0 +1,49 @@
+"""Deduplicated storage of raw upstream response payloads."""
+
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import Index, Integer, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class RawPayload(Base):
+    """A distinct upstream payload, stored once and compressed.
+
+    Rows are addressed by the SHA-256 ``digest`` of the payload's canonical
+    JSON, which status records reference instead of embedding the body, so
+    storage grows with the number of distinct payloads rather than polls.
+    ``last_used_at`` is refreshed whenever a record references the payload
+    and protects recently used rows from garbage collection.
+    """
+
+    digest: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
+        nullable=False,
+    )
+    encoding: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+        default="gzip",
+    )
+    data: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+    )
+    size: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("uq_raw_payload_digest", "digest", unique=True),)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<RawPayload(digest={self.digest.hex()}, size={self.size})>"
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from datetime import datetime  # noqa: TC003
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
+from src.models.enums import ServiceStatus  # noqa: TC001
 
 if TYPE_CHECKING:
     from src.models.incident import Incident
@@ -19,6 +21,16 @@ class Service(Base, TimestampMixin):
 
     Represents a third-party service (AWS, GCP, Azure, etc.) whose
     status page we poll for health information.
+
+    ``current_status`` and ``last_checked_at`` are a projection of the
+    latest poll maintained by the ingest path, so listing services with
+    their status never touches ``service_status``. The history and
+    incident relationships load only when explicitly requested (for
+    example with ``selectinload`` or ``awaitable_attrs``).
+
+    ``next_poll_at`` and ``poll_interval_seconds`` hold the service's
+    adaptive poll schedule, so a restarted poller resumes it; a service
+    without ``next_poll_at`` is due immediately.
     """
 
     name: Mapped[str] = mapped_column(
@@ -40,21 +52,38 @@ class Service(Base, TimestampMixin):
         default=True,
         nullable=False,
     )
+    current_status: Mapped[ServiceStatus | None] = mapped_column(
+        String(20),
+        nullable=True,
+    )
+    last_checked_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
+    next_poll_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
+    poll_interval_seconds: Mapped[int | None] = mapped_column(
+        nullable=True,
+    )
 
     status_records: Mapped[list[ServiceStatusRecord]] = relationship(
         "ServiceStatusRecord",
         back_populates="service",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
     incidents: Mapped[list[Incident]] = relationship(
         "Incident",
         back_populates="service",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
     )
 
-    __table_args__ = (Index("ix_service_provider_active", "provider", "is_active"),)
+    __table_args__ = (
+        Index("ix_service_provider_active", "provider", "is_active"),
+        Index("ix_service_active_status", "is_active", "current_status"),
+        Index("ix_service_active_next_poll", "is_active", "next_poll_at"),
+    )
 
     def __repr__(self) -> str:
         """String representation for debugging."""
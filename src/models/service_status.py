@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import uuid  # noqa: TC003
 from datetime import datetime  # noqa: TC003
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, ForeignKey, Index, String, func
+from sqlalchemy import ForeignKey, Index, Integer, LargeBinary, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
@@ -18,10 +18,23 @@ if TYPE_CHECKING:
 
 
 class ServiceStatusRecord(Base):
-    """Historical record of a service's status at a point in time.
+    """Historical record of a run of identical status observations.
 
-    Each poll of a service's status page creates one of these records,
-    allowing historical analysis of uptime and performance.
+    In run-length mode (the default) a record covers every consecutive
+    poll that observed the same status: ``checked_at`` is when the run was
+    first seen, ``last_seen_at`` the most recent poll that confirmed it and
+    ``check_count`` the number of polls folded into it. A new record is
+    only opened on a transition, so the full timeline is the sequence of
+    records ordered by ``checked_at``, each lasting until the next one
+    starts. In per-poll mode every stored poll is its own record with
+    ``check_count`` of 1.
+
+    The upstream payload of the latest poll in the record is kept in
+    ``raw_payload`` and referenced by ``raw_response_digest``.
+
+    On PostgreSQL the table is range-partitioned by day on ``checked_at``,
+    which is therefore part of the primary key. Writes should filter on
+    ``checked_at`` as well as ``id`` so only one partition is touched.
     """
 
     @declared_attr.directive
@@ -34,20 +47,28 @@ class ServiceStatusRecord(Base):
         UUID(as_uuid=True),
         ForeignKey("service.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     status: Mapped[ServiceStatus] = mapped_column(
         String(20),
         nullable=False,
-        index=True,
     )
     checked_at: Mapped[datetime] = mapped_column(
+        primary_key=True,
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
-    raw_response: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON,
+    last_seen_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        nullable=False,
+    )
+    check_count: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        nullable=False,
+    )
+    raw_response_digest: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32),
         nullable=True,
     )
 
@@ -57,8 +78,11 @@ class ServiceStatusRecord(Base):
     )
 
     __table_args__ = (
-        Index("ix_service_status_service_checked", "service_id", "checked_at"),
+        Index("ix_service_status_service_checked", "service_id", "checked_at", "id"),
         Index("ix_service_status_status_checked", "status", "checked_at"),
+        # Answers the reference check when unreferenced payloads are purged
+        Index("ix_service_status_raw_response_digest", "raw_response_digest"),
+        {"postgresql_partition_by": "RANGE (checked_at)"},
     )
 
     def __repr__(self) -> str:
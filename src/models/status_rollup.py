@@ -0,0 +1,90 @@
+"""Rollup models aggregating time spent in each status per time bucket."""
+
+from __future__ import annotations
+
+import uuid  # noqa: TC003
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import Double, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+from src.models.base import Base
+from src.models.enums import ServiceStatus  # noqa: TC001
+
+
+class StatusRollupMixin:
+    """Columns shared by hourly and daily status rollups.
+
+    Each row holds the number of seconds a service spent in one status
+    during one bucket, so uptime over any window aligned to the bucket
+    size is a sum over a handful of rows. The unique
+    ``(service_id, bucket_start, status)`` index serves both the
+    incremental upserts and window reads.
+    """
+
+    service_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("service.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    bucket_start: Mapped[datetime] = mapped_column(
+        nullable=False,
+    )
+    status: Mapped[ServiceStatus] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    seconds: Mapped[float] = mapped_column(
+        Double,
+        nullable=False,
+        default=0.0,
+    )
+
+
+class HourlyStatusRollup(StatusRollupMixin, Base):
+    """Seconds spent in each status per service per hour."""
+
+    @declared_attr.directive
+    @classmethod
+    def __tablename__(cls) -> str:
+        """Override auto-generated table name."""
+        return "status_rollup_hourly"
+
+    __table_args__ = (
+        Index(
+            "uq_status_rollup_hourly_service_bucket_status",
+            "service_id",
+            "bucket_start",
+            "status",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<HourlyStatusRollup(bucket_start={self.bucket_start}, status={self.status})>"
+
+
+class DailyStatusRollup(StatusRollupMixin, Base):
+    """Seconds spent in each status per service per day."""
+
+    @declared_attr.directive
+    @classmethod
+    def __tablename__(cls) -> str:
+        """Override auto-generated table name."""
+        return "status_rollup_daily"
+
+    __table_args__ = (
+        Index(
+            "uq_status_rollup_daily_service_bucket_status",
+            "service_id",
+            "bucket_start",
+            "status",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<DailyStatusRollup(bucket_start={self.bucket_start}, status={self.status})>"
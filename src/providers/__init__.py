@@ -1 +1,24 @@
 """Status page providers for fetching service health data."""
+
+from src.providers.aws import AwsRssProvider, FeedReader
+from src.providers.base import IncidentReport, ProviderError, ProviderResult, StatusProvider
+from src.providers.circuit import CircuitBreaker, CircuitOpenError, CircuitState
+from src.providers.gcp import GcpIncidentsProvider
+from src.providers.registry import get_provider_class, register_provider
+from src.providers.statuspage import StatuspageProvider
+
+__all__ = [
+    "AwsRssProvider",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "FeedReader",
+    "GcpIncidentsProvider",
+    "IncidentReport",
+    "ProviderError",
+    "ProviderResult",
+    "StatusProvider",
+    "StatuspageProvider",
+    "get_provider_class",
+    "register_provider",
+]
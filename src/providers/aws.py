@@ -0,0 +1,299 @@
+"""AWS Health Dashboard RSS adapter."""
+
+from __future__ import annotations
+
+import uuid  # noqa: TC003
+import xml.etree.ElementTree as ET  # nosec B405
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+from src.core.clock import utcnow
+from src.models.enums import ServiceStatus
+from src.providers.base import ProviderError, ProviderResult, StatusProvider
+from src.providers.registry import register_provider
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import httpx
+
+    from src.models import Service
+
+# Leading phrase of an item title, as AWS words its severities
+TITLE_STATUS: tuple[tuple[str, ServiceStatus], ...] = (
+    ("service is operating normally", ServiceStatus.OPERATIONAL),
+    ("informational message", ServiceStatus.DEGRADED),
+    ("performance issues", ServiceStatus.PARTIAL_OUTAGE),
+    ("service disruption", ServiceStatus.MAJOR_OUTAGE),
+)
+
+# Marker AWS adds to the title of an item closing an event
+RESOLVED_MARKER = "[resolved]"
+
+# The newest item only sets the status while it is younger than this
+RECENT_WINDOW = timedelta(days=1)
+
+# Most items kept from one fetch, and so the most held in memory
+MAX_NEW_ITEMS = 50
+
+
+@dataclass(frozen=True, slots=True)
+class FeedItem:
+    """One ``<item>`` of an RSS feed."""
+
+    guid: str
+    title: str
+    published_at: datetime | None
+    description: str | None
+
+    def to_json(self) -> dict[str, Any]:
+        """Serialize for storage as a raw payload."""
+        return {
+            "guid": self.guid,
+            "title": self.title,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "description": self.description,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class FeedCursor:
+    """Newest item seen by the previous fetch of a feed."""
+
+    guid: str | None
+    published_at: datetime | None
+
+    def reached(self, item: FeedItem) -> bool:
+        """Whether ``item`` is the newest seen item or older than it."""
+        if self.guid is not None and item.guid == self.guid:
+            return True
+        return (
+            self.published_at is not None
+            and item.published_at is not None
+            and item.published_at <= self.published_at
+        )
+
+
+class FeedReader:
+    """Incremental RSS parser that stops at the first already-seen item.
+
+    Feeds list items newest first, so everything after the cursor is
+    known already. Bytes are parsed as they arrive and each item is
+    dropped from the tree once read, so memory is bounded by
+    ``max_items`` rather than by the size of the feed.
+    """
+
+    def __init__(self, cursor: FeedCursor | None = None, max_items: int = MAX_NEW_ITEMS) -> None:
+        """Initialize the reader.
+
+        Args:
+            cursor: Newest item of the previous fetch; read everything if None.
+            max_items: Stop after this many new items.
+        """
+        self.cursor = cursor
+        self.max_items = max_items
+        self.items: list[FeedItem] = []
+        self.done = False
+        self._parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        self._channel: ET.Element | None = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse the next chunk of the feed.
+
+        Returns:
+            True once the reader needs no more input.
+
+        Raises:
+            ProviderError: If the feed is not well-formed XML.
+        """
+        if self.done:
+            return True
+        try:
+            self._parser.feed(chunk)
+            # Syntax errors surface while reading the events, not from feed()
+            events = list(self._parser.read_events())
+        except ET.ParseError as exc:
+            raise ProviderError(f"Invalid RSS feed: {exc}") from exc
+        for event in events:
+            element = event[-1]
+            if not isinstance(element, ET.Element):
+                continue
+            if event[0] == "start":
+                if element.tag == "channel":
+                    self._channel = element
+                continue
+            if element.tag != "item":
+                continue
+            item = self._read_item(element)
+            if self._channel is not None:
+                self._channel.remove(element)
+            if self.cursor is not None and self.cursor.reached(item):
+                self.done = True
+                break
+            self.items.append(item)
+            if len(self.items) >= self.max_items:
+                self.done = True
+                break
+        return self.done
+
+    def close(self) -> None:
+        """Finish a feed that was read to its end.
+
+        Raises:
+            ProviderError: If the feed ended before the document did.
+        """
+        if self.done:
+            return
+        self.done = True
+        try:
+            self._parser.close()
+        except ET.ParseError as exc:
+            raise ProviderError(f"Invalid RSS feed: {exc}") from exc
+
+    @staticmethod
+    def _read_item(element: ET.Element) -> FeedItem:
+        title = (element.findtext("title") or "").strip()
+        guid = element.findtext("guid") or element.findtext("link") or title
+        return FeedItem(
+            guid=guid.strip(),
+            title=title,
+            published_at=_parse_date(element.findtext("pubDate")),
+            description=element.findtext("description"),
+        )
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    """Parse an RFC 822 ``pubDate`` into naive UTC, or None if malformed."""
+    if not value:
+        return None
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(UTC).replace(tzinfo=None)
+
+
+def _expired(published_at: datetime | None, cutoff: datetime) -> bool:
+    """Whether an item was published before ``cutoff``; undated items never expire."""
+    return published_at is not None and published_at < cutoff
+
+
+@dataclass(frozen=True, slots=True)
+class _FeedState:
+    """What the previous fetch of a feed left behind."""
+
+    cursor: FeedCursor
+    status: ServiceStatus
+    etag: str | None
+    last_modified: str | None
+
+
+@register_provider("aws")
+class AwsRssProvider(StatusProvider):
+    """Adapter for AWS Health Dashboard RSS feeds.
+
+    ``status_url`` is a feed such as
+    ``https://status.aws.amazon.com/rss/ec2-us-east-1.rss``. The response
+    is streamed through a ``FeedReader`` that stops at the newest item of
+    the previous fetch, and the rest of the body is never downloaded.
+    The newest item's title gives the status, unless it is marked
+    ``[RESOLVED]`` or older than ``RECENT_WINDOW``; a feed without such an
+    item means the service is operating normally. A status held from an
+    earlier fetch returns to operational once its item ages out, even if
+    the feed has not changed since. Fetches are conditional on the
+    previous ``ETag`` and ``Last-Modified``, like the Statuspage adapter.
+
+    Unlike the other adapters, this one parses on the event loop rather
+    than through ``offload``. The pull parser's state cannot be sent to a
+    process pool, so offloading would mean parsing the same bytes again
+    for every batch. Parsing here is incremental and stops at the
+    previous fetch's newest item, so each chunk is parsed once and an
+    ordinary fetch only parses the few new items at the top of the feed.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, executor: Executor | None = None) -> None:
+        """Initialize the adapter with no feed state."""
+        super().__init__(client, executor)
+        self._states: dict[uuid.UUID, _FeedState] = {}
+
+    async def fetch_status(self, service: Service) -> ProviderResult:
+        """Read the feed's new items and derive the status from the newest."""
+        cutoff = utcnow() - RECENT_WINDOW
+        previous = self._states.get(service.id)
+        headers = {"Accept": "application/rss+xml, application/xml"}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        reader = FeedReader(previous.cursor if previous is not None else None)
+        async with self.client.stream("GET", service.status_url, headers=headers) as response:
+            if response.status_code == 304 and previous is not None:
+                return self._unchanged(service.id, previous, cutoff)
+            response.raise_for_status()
+            # Parsed on the loop, chunk by chunk as it arrives; see the class docstring
+            async for chunk in response.aiter_bytes():
+                if reader.feed(chunk):
+                    break
+            else:
+                reader.close()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if not reader.items and previous is not None:
+            state = _FeedState(previous.cursor, previous.status, etag, last_modified)
+            return self._unchanged(service.id, state, cutoff)
+
+        newest = reader.items[0] if reader.items else None
+        status = (
+            self.parse_status(newest.title)
+            if newest and not _expired(newest.published_at, cutoff)
+            else ServiceStatus.OPERATIONAL
+        )
+        cursor = FeedCursor(newest.guid, newest.published_at) if newest else FeedCursor(None, None)
+        self._states[service.id] = _FeedState(cursor, status, etag, last_modified)
+        return ProviderResult(
+            status=status,
+            raw_response={"items": [item.to_json() for item in reader.items]},
+        )
+
+    def _unchanged(
+        self, service_id: uuid.UUID, state: _FeedState, cutoff: datetime
+    ) -> ProviderResult:
+        """Result of a fetch without new items, clearing a status that aged out."""
+        if state.status != ServiceStatus.OPERATIONAL and _expired(
+            state.cursor.published_at, cutoff
+        ):
+            state = replace(state, status=ServiceStatus.OPERATIONAL)
+            self._states[service_id] = state
+            return ProviderResult(status=state.status, raw_response={"items": []})
+        self._states[service_id] = state
+        return ProviderResult(status=state.status, changed=False)
+
+    def forget(self, service_id: uuid.UUID) -> None:
+        """Drop the feed state of a service so its next fetch reads the feed afresh."""
+        self._states.pop(service_id, None)
+
+    @staticmethod
+    def parse_status(title: str) -> ServiceStatus:
+        """Map an item title to a ServiceStatus.
+
+        Args:
+            title: Item title, e.g. ``"Service is operating normally: [RESOLVED] ..."``.
+
+        Returns:
+            OPERATIONAL for an item marked ``[RESOLVED]``, otherwise the
+            status its severity phrase denotes, or UNKNOWN.
+        """
+        lowered = title.strip().lower()
+        if RESOLVED_MARKER in lowered:
+            return ServiceStatus.OPERATIONAL
+        for phrase, status in TITLE_STATUS:
+            if lowered.startswith(phrase):
+                return status
+        return ServiceStatus.UNKNOWN
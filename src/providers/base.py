@@ -0,0 +1,115 @@
+"""Base classes for status page provider adapters."""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+    from datetime import datetime
+
+    import httpx
+
+    from src.models import IncidentImpact, IncidentStatus, Service, ServiceStatus
+
+T = TypeVar("T")
+
+
+class ProviderError(Exception):
+    """Raised when a status page cannot be fetched or understood."""
+
+
+@dataclass(frozen=True, slots=True)
+class IncidentReport:
+    """An incident as reported by a status page, normalized."""
+
+    external_id: str
+    title: str
+    status: IncidentStatus
+    impact: IncidentImpact
+    description: str | None = None
+    resolved_at: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderResult:
+    """Normalized outcome of polling a single service's status page.
+
+    ``changed`` is False when the adapter determined that the upstream page
+    is identical to the previous fetch; ``status`` then repeats the last
+    known value and there is nothing new to store. ``incidents`` holds
+    only the incidents that are new or changed since the previous fetch,
+    for adapters that report incidents at all.
+    """
+
+    status: ServiceStatus
+    raw_response: dict[str, Any] | None = None
+    changed: bool = True
+    incidents: tuple[IncidentReport, ...] = ()
+
+
+class StatusProvider(ABC):
+    """Base class for status page adapters.
+
+    One adapter instance is shared by every service with a matching
+    ``Service.provider`` value, so any per-service state must be keyed
+    by service id. CPU-heavy decoding should go through ``offload`` so it
+    runs on the poller's process pool instead of the event loop. An
+    adapter that stops reading partway through a stream may parse
+    incrementally on the loop instead, as the AWS adapter does, as long
+    as each chunk's parsing is short and stopping early keeps the total
+    small.
+    """
+
+    name: ClassVar[str]
+
+    def __init__(self, client: httpx.AsyncClient, executor: Executor | None = None) -> None:
+        """Initialize the adapter.
+
+        Args:
+            client: Shared HTTP client used for all upstream requests.
+            executor: Pool for CPU-bound decoding; decoding runs inline if omitted.
+        """
+        self.client = client
+        self.executor = executor
+
+    async def offload(self, func: Callable[[bytes], T], body: bytes) -> T:
+        """Decode a response body on the executor, if there is one.
+
+        Args:
+            func: Module-level function, so it can be sent to a process pool.
+            body: Raw response body.
+
+        Returns:
+            Whatever ``func`` returns.
+        """
+        if self.executor is None:
+            return func(body)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, body)
+
+    @abstractmethod
+    async def fetch_status(self, service: Service) -> ProviderResult:
+        """Fetch and normalize the current status of a service.
+
+        Args:
+            service: The service whose status page should be polled.
+
+        Returns:
+            The normalized status result.
+
+        Raises:
+            ProviderError: If the status page cannot be fetched or parsed.
+        """
+
+    def forget(self, service_id: uuid.UUID) -> None:  # noqa: B027
+        """Drop any state remembered about a service's previous fetch.
+
+        Called when the stored status stops reflecting the last fetch, so
+        the next fetch is reported as changed. Stateless adapters need not
+        override this.
+        """
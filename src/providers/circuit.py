@@ -0,0 +1,132 @@
+"""Per-host circuit breaking for status page fetches."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from src.core.metrics import POLL_CIRCUIT_OPENED, POLL_CIRCUIT_STATE
+from src.providers.base import ProviderError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(IntEnum):
+    """State of a host's circuit, valued as exported in metrics."""
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitOpenError(ProviderError):
+    """Raised instead of fetching from a host whose circuit is open."""
+
+
+@dataclass(slots=True)
+class _HostCircuit:
+    """Failure bookkeeping for one upstream host."""
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    trips: int = 0
+    retry_at: float = 0.0
+
+
+class CircuitBreaker:
+    """Stops fetching from hosts that keep failing.
+
+    After ``failure_threshold`` consecutive failures a host's circuit
+    opens and fetches from it are refused immediately, instead of each
+    waiting out a timeout while holding a concurrency slot. Once the
+    backoff expires a single probe is let through (half-open): success
+    closes the circuit, failure reopens it with the backoff doubled, up
+    to ``max_backoff`` seconds.
+
+    Not thread-safe; meant to be shared by the fetches of one event loop.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        backoff: float = 60.0,
+        max_backoff: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit.
+            backoff: Seconds a circuit stays open after its first trip.
+            max_backoff: Upper bound for the doubled backoff.
+            clock: Monotonic time source.
+        """
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self._hosts: dict[str, _HostCircuit] = {}
+
+    def state(self, host: str) -> CircuitState:
+        """Current state of a host's circuit."""
+        circuit = self._hosts.get(host)
+        return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def before_request(self, host: str) -> None:
+        """Admit a fetch from ``host`` or refuse it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                probe already in flight.
+        """
+        circuit = self._hosts.get(host)
+        if circuit is None or circuit.state == CircuitState.CLOSED:
+            return
+        now = self.clock()
+        if now >= circuit.retry_at:
+            # Admit one probe; another is allowed if it never reports back
+            circuit.retry_at = now + self.backoff
+            self._set_state(host, circuit, CircuitState.HALF_OPEN)
+            return
+        raise CircuitOpenError(f"Circuit open for {host}")
+
+    def record_success(self, host: str) -> None:
+        """Close the host's circuit after a successful fetch."""
+        circuit = self._hosts.get(host)
+        if circuit is None:
+            return
+        if circuit.state != CircuitState.CLOSED:
+            logger.info("Circuit for %s closed", host)
+        circuit.failures = 0
+        circuit.trips = 0
+        self._set_state(host, circuit, CircuitState.CLOSED)
+
+    def record_failure(self, host: str) -> None:
+        """Count a failed fetch, opening the circuit when warranted."""
+        circuit = self._hosts.setdefault(host, _HostCircuit())
+        circuit.failures += 1
+        if circuit.state == CircuitState.HALF_OPEN or (
+            circuit.state == CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+        ):
+            backoff = min(self.backoff * 2**circuit.trips, self.max_backoff)
+            circuit.trips += 1
+            circuit.retry_at = self.clock() + backoff
+            self._set_state(host, circuit, CircuitState.OPEN)
+            POLL_CIRCUIT_OPENED.labels(host).inc()
+            logger.warning(
+                "Circuit for %s opened after %d failures; retrying in %.0fs",
+                host,
+                circuit.failures,
+                backoff,
+            )
+
+    @staticmethod
+    def _set_state(host: str, circuit: _HostCircuit, state: CircuitState) -> None:
+        circuit.state = state
+        POLL_CIRCUIT_STATE.labels(host).set(state)
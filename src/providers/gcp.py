@@ -0,0 +1,339 @@
+"""Google Cloud status adapter (``incidents.json``)."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import uuid  # noqa: TC003
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urlsplit
+
+from src.core.clock import utcnow
+from src.models.enums import IncidentImpact, IncidentStatus, ServiceStatus
+from src.providers.base import IncidentReport, ProviderError, ProviderResult, StatusProvider
+from src.providers.registry import register_provider
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import httpx
+
+    from src.models import Service
+
+# GCP's status_impact mapped to the service status and incident impact it implies
+IMPACT: dict[str, tuple[ServiceStatus, IncidentImpact]] = {
+    "SERVICE_INFORMATION": (ServiceStatus.DEGRADED, IncidentImpact.MINOR),
+    "SERVICE_DISRUPTION": (ServiceStatus.PARTIAL_OUTAGE, IncidentImpact.MAJOR),
+    "SERVICE_OUTAGE": (ServiceStatus.MAJOR_OUTAGE, IncidentImpact.CRITICAL),
+}
+
+# Worst first, to pick the overall status from several open incidents
+STATUS_SEVERITY = (
+    ServiceStatus.MAJOR_OUTAGE,
+    ServiceStatus.PARTIAL_OUTAGE,
+    ServiceStatus.DEGRADED,
+)
+
+# Resolved incidents modified within this window are still reported
+RECENT_WINDOW = timedelta(days=7)
+
+# Largest single incident accepted before the feed is considered malformed
+MAX_ELEMENT_CHARS = 4 * 2**20
+
+# Newly streamed bytes collected before they are decoded in one batch
+PARSE_BATCH_BYTES = 2**20
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonArrayReader:
+    """Decodes the elements of a top-level JSON array as its bytes arrive.
+
+    Only the element being decoded is buffered, so memory is bounded by
+    the largest element rather than by the size of the document. Each
+    element is decoded with the standard C-accelerated decoder.
+    """
+
+    def __init__(self, expect: str = "[") -> None:
+        """Initialize a reader.
+
+        Args:
+            expect: State to start in, from a previous reader's ``expect``;
+                a new document starts by expecting the opening bracket.
+        """
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._expect = expect  # "[", "value", "value or ]", ", or ]", or "" once closed
+
+    @property
+    def expect(self) -> str:
+        """What the reader expects next, to resume reading in another reader."""
+        return self._expect
+
+    def unconsumed(self) -> bytes:
+        """The bytes fed so far that are not part of a returned element yet."""
+        return self._buffer.encode() + self._text.getstate()[0]
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Decode the elements completed by ``chunk``.
+
+        Returns:
+            The elements, in document order.
+
+        Raises:
+            ProviderError: If the document is not a JSON array.
+        """
+        try:
+            self._buffer += self._text.decode(chunk)
+        except UnicodeDecodeError as exc:
+            raise ProviderError(f"Invalid GCP incidents JSON: {exc}") from exc
+        elements: list[Any] = []
+        pos: int | None = 0
+        while pos is not None:
+            consumed, pos = pos, self._advance(pos, elements)
+        self._buffer = self._buffer[consumed:]
+        return elements
+
+    def _advance(self, pos: int, elements: list[Any]) -> int | None:
+        """Consume the token or element at ``pos``.
+
+        Returns:
+            The position after it, or None if more input is needed first.
+        """
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(buffer):
+            return None
+        char = buffer[pos]
+        if self._expect == "[":
+            if char != "[":
+                raise ProviderError("GCP incidents feed is not a JSON array")
+            self._expect = "value or ]"
+            return pos + 1
+        if self._expect == "":
+            raise ProviderError("Invalid GCP incidents JSON: data after the array")
+        if char == "]" and self._expect != "value":
+            self._expect = ""
+            return pos + 1
+        if self._expect == ", or ]":
+            if char != ",":
+                raise ProviderError("Invalid GCP incidents JSON: expected ',' or ']'")
+            self._expect = "value"
+            return pos + 1
+        try:
+            element, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as exc:
+            if len(buffer) - pos > MAX_ELEMENT_CHARS:
+                raise ProviderError(f"Invalid GCP incidents JSON: {exc}") from exc
+            end = len(buffer)
+        if end == len(buffer):
+            return None  # Incomplete, or a number that may continue in the next chunk
+        elements.append(element)
+        self._expect = ", or ]"
+        return end
+
+    def close(self) -> None:
+        """Check that the document ended with its closing bracket.
+
+        Raises:
+            ProviderError: If the array was truncated or malformed.
+        """
+        if self._expect != "" or self._buffer.strip(_WHITESPACE):
+            raise ProviderError("GCP incidents feed ended before the array was closed")
+
+
+def _parse_time(value: Any) -> datetime | None:
+    """Parse an ISO 8601 timestamp into naive UTC, or None if absent or malformed."""
+    if not isinstance(value, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(UTC).replace(tzinfo=None)
+
+
+def _is_relevant(incident: Any, product: str, cutoff: datetime) -> bool:
+    """Whether an incident is open or recent, and affects the followed product."""
+    if not isinstance(incident, dict) or "id" not in incident:
+        return False
+    if incident.get("end") is not None:
+        modified = _parse_time(incident.get("modified"))
+        if modified is None or modified < cutoff:
+            return False
+    if not product:
+        return True
+    products = incident.get("affected_products") or []
+    return any(
+        product in (str(p.get("title", "")).casefold(), str(p.get("id", "")).casefold())
+        for p in products
+        if isinstance(p, dict)
+    )
+
+
+def scan_incidents(
+    product: str, cutoff: datetime, expect: str, final: bool, body: bytes
+) -> tuple[list[dict[str, Any]], bytes, str]:
+    """Decode a run of ``incidents.json`` and keep the relevant incidents.
+
+    Module-level so it can run on the poller's process pool. Reader state
+    cannot cross processes, so each run starts in the state the previous
+    one ended in, with the bytes it left over at the front of ``body``.
+
+    Args:
+        product: Product to follow, casefolded, or empty for every product.
+        cutoff: Resolved incidents modified before this are dropped.
+        expect: The previous run's reader state, or "[" for the first run.
+        final: Whether ``body`` runs to the end of the document.
+        body: The previous run's leftover bytes followed by the new ones.
+
+    Returns:
+        The relevant incidents, the bytes left for the next run, and the
+        reader state to resume it in.
+
+    Raises:
+        ProviderError: If the document is not a JSON array.
+    """
+    reader = JsonArrayReader(expect)
+    kept = [incident for incident in reader.feed(body) if _is_relevant(incident, product, cutoff)]
+    if final:
+        reader.close()
+    return kept, reader.unconsumed(), reader.expect
+
+
+@dataclass(frozen=True, slots=True)
+class _FeedState:
+    """What the previous fetch left behind for one service."""
+
+    modified: dict[str, str]  # Incident id -> its ``modified`` when last reported
+    status: ServiceStatus
+    etag: str | None
+    last_modified: str | None
+
+
+@register_provider("gcp")
+class GcpIncidentsProvider(StatusProvider):
+    """Adapter for the Google Cloud status ``incidents.json`` feed.
+
+    The feed lists GCP's whole incident history on every request. It is
+    decoded element by element as it streams in, one ``PARSE_BATCH_BYTES``
+    batch at a time through ``offload``, and only incidents that are still
+    open or were modified within ``RECENT_WINDOW`` are kept.
+    Each is compared with the version reported on the previous fetch, by
+    GCP's ``modified`` timestamp, and only new or changed ones are
+    returned, so an unchanged incident is never written again.
+
+    ``status_url`` is the feed URL, optionally with the product to follow
+    as fragment (``https://status.cloud.google.com/incidents.json#Cloud Run``);
+    without one every product counts. The service's status follows the
+    worst open incident.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, executor: Executor | None = None) -> None:
+        """Initialize the adapter with no feed state."""
+        super().__init__(client, executor)
+        self._states: dict[uuid.UUID, _FeedState] = {}
+
+    async def fetch_status(self, service: Service) -> ProviderResult:
+        """Read the feed and report the incidents that changed."""
+        previous = self._states.get(service.id)
+        headers = {"Accept": "application/json"}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        url = urlsplit(service.status_url)
+        product = unquote(url.fragment).casefold()
+        cutoff = utcnow() - RECENT_WINDOW
+        kept: list[dict[str, Any]] = []
+        expect, pending, fresh = "[", bytearray(), 0
+        async with self.client.stream(
+            "GET", url._replace(fragment="").geturl(), headers=headers
+        ) as response:
+            if response.status_code == 304 and previous is not None:
+                return ProviderResult(status=previous.status, changed=False)
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                pending += chunk
+                fresh += len(chunk)
+                if fresh >= PARSE_BATCH_BYTES:
+                    scan = partial(scan_incidents, product, cutoff, expect, False)
+                    found, rest, expect = await self.offload(scan, bytes(pending))
+                    kept.extend(found)
+                    pending, fresh = bytearray(rest), 0
+            scan = partial(scan_incidents, product, cutoff, expect, True)
+            found, _, _ = await self.offload(scan, bytes(pending))
+            kept.extend(found)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        seen = previous.modified if previous is not None else {}
+        modified = {str(incident["id"]): str(incident.get("modified")) for incident in kept}
+        changed = [
+            incident
+            for incident in kept
+            if seen.get(str(incident["id"])) != modified[str(incident["id"])]
+        ]
+        status = self._overall_status(kept)
+        self._states[service.id] = _FeedState(modified, status, etag, last_modified)
+        if previous is not None and not changed and status == previous.status:
+            return ProviderResult(status=status, changed=False)
+        return ProviderResult(
+            status=status,
+            raw_response={"incidents": changed},
+            incidents=tuple(self.parse_incident(incident) for incident in changed),
+        )
+
+    def forget(self, service_id: uuid.UUID) -> None:
+        """Drop the feed state of a service so its next fetch reports every incident."""
+        self._states.pop(service_id, None)
+
+    @staticmethod
+    def _overall_status(incidents: list[dict[str, Any]]) -> ServiceStatus:
+        """The worst status among the open incidents, or OPERATIONAL."""
+        open_statuses = {
+            IMPACT.get(str(incident.get("status_impact")), IMPACT["SERVICE_INFORMATION"])[0]
+            for incident in incidents
+            if incident.get("end") is None
+        }
+        return next(
+            (status for status in STATUS_SEVERITY if status in open_statuses),
+            ServiceStatus.OPERATIONAL,
+        )
+
+    @staticmethod
+    def parse_incident(incident: dict[str, Any]) -> IncidentReport:
+        """Normalize one element of ``incidents.json``.
+
+        Args:
+            incident: A decoded incident object.
+
+        Returns:
+            The incident as an IncidentReport.
+        """
+        _, impact = IMPACT.get(str(incident.get("status_impact")), IMPACT["SERVICE_INFORMATION"])
+        latest = incident.get("most_recent_update") or {}
+        resolved_at = _parse_time(incident.get("end"))
+        if resolved_at is not None:
+            status = IncidentStatus.RESOLVED
+        elif latest.get("status") == "AVAILABLE":
+            status = IncidentStatus.MONITORING
+        else:
+            status = IncidentStatus.INVESTIGATING
+        return IncidentReport(
+            external_id=str(incident["id"])[:100],
+            title=str(incident.get("external_desc") or "Untitled incident")[:500],
+            status=status,
+            impact=impact,
+            description=latest.get("text"),
+            resolved_at=resolved_at,
+        )
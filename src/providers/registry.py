@@ -0,0 +1,40 @@
+"""Registry mapping ``Service.provider`` values to adapter classes."""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from src.providers.base import StatusProvider
+
+T = TypeVar("T", bound=type[StatusProvider])
+
+_PROVIDERS: dict[str, type[StatusProvider]] = {}
+
+
+def register_provider(name: str) -> Callable[[T], T]:
+    """Class decorator registering an adapter under a provider name.
+
+    Args:
+        name: Value of ``Service.provider`` handled by the adapter.
+
+    Returns:
+        Decorator that registers and returns the adapter class.
+    """
+
+    def decorator(cls: T) -> T:
+        cls.name = name
+        _PROVIDERS[name] = cls
+        return cls
+
+    return decorator
+
+
+def get_provider_class(name: str) -> type[StatusProvider] | None:
+    """Look up the adapter class registered for a provider name.
+
+    Args:
+        name: Value of ``Service.provider``.
+
+    Returns:
+        The adapter class, or None if no adapter handles the provider.
+    """
+    return _PROVIDERS.get(name)
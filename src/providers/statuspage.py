@@ -0,0 +1,149 @@
+"""Statuspage.io adapter (Cloudflare, GitHub, Stripe and other hosted pages)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid  # noqa: TC003
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.models.enums import ServiceStatus
+from src.providers.base import ProviderError, ProviderResult, StatusProvider
+from src.providers.registry import register_provider
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import httpx
+
+    from src.models import Service
+
+# Statuspage's overall "indicator" mapped to our status values
+INDICATOR_STATUS: dict[str, ServiceStatus] = {
+    "none": ServiceStatus.OPERATIONAL,
+    "minor": ServiceStatus.DEGRADED,
+    "major": ServiceStatus.PARTIAL_OUTAGE,
+    "critical": ServiceStatus.MAJOR_OUTAGE,
+    "maintenance": ServiceStatus.MAINTENANCE,
+}
+
+SUMMARY_PATH = "/api/v2/summary.json"
+
+
+@dataclass(frozen=True, slots=True)
+class _Validator:
+    """Revalidation state remembered from the previous fetch of a page."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    status: ServiceStatus
+
+
+@register_provider("statuspage")
+class StatuspageProvider(StatusProvider):
+    """Adapter for pages hosted on Statuspage.io.
+
+    Every fetch is a conditional GET using the ``ETag`` and
+    ``Last-Modified`` validators from the previous response. A ``304`` or
+    a body whose hash matches the previous one is reported as unchanged
+    without being parsed, so the poller can skip the write as well.
+    Changed bodies are decoded on the executor, if one is configured.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, executor: Executor | None = None) -> None:
+        """Initialize the adapter with an empty validator cache."""
+        super().__init__(client, executor)
+        self._validators: dict[uuid.UUID, _Validator] = {}
+
+    @staticmethod
+    def summary_url(status_url: str) -> str:
+        """Resolve the summary endpoint for a configured status URL.
+
+        Accepts either the page root (``https://www.githubstatus.com``) or
+        a full API URL ending in ``.json``.
+        """
+        if status_url.endswith(".json"):
+            return status_url
+        return status_url.rstrip("/") + SUMMARY_PATH
+
+    async def fetch_status(self, service: Service) -> ProviderResult:
+        """Fetch the page summary, revalidating against the previous fetch."""
+        previous = self._validators.get(service.id)
+        headers: dict[str, str] = {"Accept": "application/json"}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        response = await self.client.get(self.summary_url(service.status_url), headers=headers)
+        if response.status_code == 304 and previous is not None:
+            return ProviderResult(status=previous.status, changed=False)
+        response.raise_for_status()
+
+        body = response.content
+        digest = hashlib.sha256(body).digest()
+        if previous is not None and digest == previous.digest:
+            self._remember(service.id, response.headers, digest, previous.status)
+            return ProviderResult(status=previous.status, changed=False)
+
+        payload, status = await self.offload(decode_summary, body)
+        self._remember(service.id, response.headers, digest, status)
+        return ProviderResult(status=status, raw_response=payload)
+
+    def forget(self, service_id: uuid.UUID) -> None:
+        """Drop the validators of a service so its next fetch is unconditional."""
+        self._validators.pop(service_id, None)
+
+    def _remember(
+        self,
+        service_id: uuid.UUID,
+        headers: httpx.Headers,
+        digest: bytes,
+        status: ServiceStatus,
+    ) -> None:
+        """Store validators for the next conditional request."""
+        self._validators[service_id] = _Validator(
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            digest=digest,
+            status=status,
+        )
+
+    @staticmethod
+    def _decode(body: bytes) -> dict[str, Any]:
+        """Decode a summary body, rejecting anything that is not an object."""
+        try:
+            payload = json.loads(body)
+        except ValueError as exc:
+            raise ProviderError(f"Invalid Statuspage JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise ProviderError("Statuspage summary is not a JSON object")
+        return payload
+
+    @staticmethod
+    def parse_status(payload: dict[str, Any]) -> ServiceStatus:
+        """Map a Statuspage summary to a ServiceStatus.
+
+        Args:
+            payload: Decoded ``summary.json`` or ``status.json`` body.
+
+        Returns:
+            The overall status, or UNKNOWN for an unrecognized indicator.
+        """
+        indicator = (payload.get("status") or {}).get("indicator")
+        return INDICATOR_STATUS.get(str(indicator), ServiceStatus.UNKNOWN)
+
+
+def decode_summary(body: bytes) -> tuple[dict[str, Any], ServiceStatus]:
+    """Decode a summary body and map it to a status.
+
+    Module-level so it can run in a worker process.
+
+    Raises:
+        ProviderError: If the body is not a JSON object.
+    """
+    payload = StatuspageProvider._decode(body)
+    return payload, StatuspageProvider.parse_status(payload)
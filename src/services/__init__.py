@@ -1 +1,18 @@
 """Business logic services."""
+
+from src.services.history import StatusInterval, load_timeline
+from src.services.incident_ingest import IncidentIngestor
+from src.services.ingest import StatusIngestor
+from src.services.poller import CycleStats, StatusPoller
+from src.services.rollups import UptimeAggregator, load_uptime
+
+__all__ = [
+    "CycleStats",
+    "IncidentIngestor",
+    "StatusIngestor",
+    "StatusInterval",
+    "StatusPoller",
+    "UptimeAggregator",
+    "load_timeline",
+    "load_uptime",
+]
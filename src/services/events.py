@@ -0,0 +1,183 @@
+"""Fan-out of ingested status transitions and incidents to streaming subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid  # noqa: TC003
+from dataclasses import dataclass, field
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel
+
+from src.models import IncidentImpact, IncidentStatus, ServiceStatus  # noqa: TC001
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.services.incident_ingest import IncidentChange
+    from src.services.ingest import StatusUpdate
+
+logger = logging.getLogger(__name__)
+
+EventType = Literal["status", "incident"]
+
+
+class StatusTransitionEvent(BaseModel):
+    """Payload of a ``status`` event."""
+
+    service_id: uuid.UUID
+    status: ServiceStatus
+    previous_status: ServiceStatus | None
+    checked_at: datetime
+
+
+class IncidentEvent(BaseModel):
+    """Payload of an ``incident`` event."""
+
+    id: uuid.UUID
+    service_id: uuid.UUID
+    external_id: str
+    title: str
+    status: IncidentStatus
+    impact: IncidentImpact
+    resolved_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class StreamEvent:
+    """An event serialized once and shared by every subscriber."""
+
+    type: EventType
+    service_id: uuid.UUID
+    data: str
+
+
+@dataclass(eq=False, slots=True)
+class Subscription:
+    """A subscriber's filter and bounded event buffer.
+
+    ``service_ids`` of None receives events for every service. When the
+    buffer fills up the subscription is closed instead of growing; the
+    client is expected to resynchronize from the REST endpoints and
+    reconnect.
+    """
+
+    service_ids: frozenset[uuid.UUID] | None
+    queue: asyncio.Queue[StreamEvent | None]
+    overflowed: bool = field(default=False)
+
+    def wants(self, event: StreamEvent) -> bool:
+        """Whether the event passes this subscriber's filter."""
+        return self.service_ids is None or event.service_id in self.service_ids
+
+    def offer(self, event: StreamEvent) -> None:
+        """Buffer an event, closing the subscription if the buffer is full."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            # Free the buffer and wake the reader so it can end the stream
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def next(self) -> StreamEvent | None:
+        """Wait for the next event, or None once the subscription overflowed."""
+        return await self.queue.get()
+
+
+class SubscriberLimitError(Exception):
+    """Raised when the broker already serves its maximum of subscribers."""
+
+
+class StatusEventBroker:
+    """Publishes status transitions and incidents to in-process stream subscribers.
+
+    ``publish`` is registered as a ``StatusIngestor`` listener and
+    ``publish_incidents`` as an ``IncidentIngestor`` one. Each event is
+    serialized once and offered to every matching subscriber without
+    awaiting, so a slow client never delays ingestion; its buffer is
+    bounded by ``buffer_size`` events.
+    """
+
+    def __init__(self, buffer_size: int = 100, max_subscribers: int = 1000) -> None:
+        """Initialize the broker.
+
+        Args:
+            buffer_size: Maximum buffered events per subscriber.
+            max_subscribers: Maximum concurrent subscribers.
+        """
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self._subscriptions: set[Subscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(self, service_ids: frozenset[uuid.UUID] | None = None) -> Subscription:
+        """Open a subscription.
+
+        Args:
+            service_ids: Services to receive events for, or None for all.
+
+        Returns:
+            The new subscription; pass it to ``unsubscribe`` when done.
+
+        Raises:
+            SubscriberLimitError: If the subscriber limit is reached.
+        """
+        if len(self._subscriptions) >= self.max_subscribers:
+            raise SubscriberLimitError("Too many stream subscribers")
+        subscription = Subscription(service_ids, asyncio.Queue(maxsize=self.buffer_size))
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Close a subscription."""
+        self._subscriptions.discard(subscription)
+
+    def publish(self, updates: Sequence[StatusUpdate]) -> None:
+        """Offer the transitions among ``updates`` to matching subscribers."""
+        if not self._subscriptions:
+            return
+        for update in updates:
+            if not update.is_transition or update.status is None:
+                continue
+            payload = StatusTransitionEvent(
+                service_id=update.service_id,
+                status=update.status,
+                previous_status=update.previous_status,
+                checked_at=update.checked_at,
+            )
+            self._offer(StreamEvent("status", update.service_id, payload.model_dump_json()))
+
+    def publish_incidents(self, changes: Sequence[IncidentChange]) -> None:
+        """Offer new and changed incidents to matching subscribers."""
+        if not self._subscriptions:
+            return
+        for change in changes:
+            payload = IncidentEvent(
+                id=change.incident_id,
+                service_id=change.service_id,
+                external_id=change.external_id,
+                title=change.title,
+                status=change.status,
+                impact=change.impact,
+                resolved_at=change.resolved_at,
+            )
+            self._offer(StreamEvent("incident", change.service_id, payload.model_dump_json()))
+
+    def _offer(self, event: StreamEvent) -> None:
+        """Offer an event to matching subscribers, dropping those that overflow."""
+        for subscription in list(self._subscriptions):
+            if subscription.wants(event):
+                subscription.offer(event)
+                if subscription.overflowed:
+                    logger.info("Closing stream subscriber with a full buffer")
+                    self._subscriptions.discard(subscription)
@@ -0,0 +1,125 @@
+"""Background readiness monitoring."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING, Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.clock import utcnow
+from src.models import Service
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from src.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+HealthStatus = Literal["healthy", "degraded", "unhealthy"]
+DatabaseStatus = Literal["connected", "disconnected"]
+
+# A verdict this many check intervals old means the monitor itself is stuck
+STALE_VERDICT_INTERVALS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class HealthVerdict:
+    """Outcome of one readiness check."""
+
+    checked_at: datetime
+    database: DatabaseStatus
+    last_poll_at: datetime | None = None
+
+    def poll_age_seconds(self) -> float | None:
+        """Age of the newest poll result when the check ran."""
+        if self.last_poll_at is None:
+            return None
+        return (self.checked_at - self.last_poll_at).total_seconds()
+
+
+class HealthMonitor:
+    """Checks the database and poll freshness on its own schedule.
+
+    Readiness probes read the cached verdict instead of each checking out
+    a connection, so probe traffic never reaches the pool. A check is a
+    single query for the most recent ``last_checked_at``, which proves
+    the database answers and shows whether a poller, in this process or
+    another, is still writing results.
+    """
+
+    def __init__(self, engine: AsyncEngine, settings: Settings) -> None:
+        """Initialize the monitor.
+
+        Args:
+            engine: Database engine to check.
+            settings: Application settings with health check configuration.
+        """
+        self.engine = engine
+        self.settings = settings
+        self.verdict: HealthVerdict | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Check once, then keep checking on the configured interval."""
+        if self._task is None:
+            await self.check()
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Check until cancelled."""
+        while True:
+            await asyncio.sleep(self.settings.health_check_interval_seconds)
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Readiness check failed")
+
+    async def check(self) -> HealthVerdict:
+        """Query the database and cache the verdict.
+
+        Returns:
+            The new verdict.
+        """
+        try:
+            async with asyncio.timeout(self.settings.health_check_timeout_seconds):
+                async with self.engine.connect() as conn:
+                    last_poll_at = await conn.scalar(select(func.max(Service.last_checked_at)))
+            verdict = HealthVerdict(utcnow(), "connected", last_poll_at)
+        except (OSError, SQLAlchemyError):
+            logger.warning("Readiness check could not reach the database", exc_info=True)
+            verdict = HealthVerdict(utcnow(), "disconnected")
+        self.verdict = verdict
+        return verdict
+
+    def status(self, now: datetime | None = None) -> HealthStatus:
+        """Overall readiness derived from the cached verdict.
+
+        Unhealthy without a verdict or a database connection; degraded
+        when poll results, or the verdict itself, are stale.
+        """
+        verdict = self.verdict
+        if verdict is None or verdict.database == "disconnected":
+            return "unhealthy"
+        now = now or utcnow()
+        max_verdict_age = self.settings.health_check_interval_seconds * STALE_VERDICT_INTERVALS
+        if (now - verdict.checked_at).total_seconds() > max_verdict_age:
+            return "degraded"
+        poll_age = verdict.poll_age_seconds()
+        if poll_age is not None and poll_age > self.settings.health_poll_stale_seconds:
+            return "degraded"
+        return "healthy"
@@ -0,0 +1,140 @@
+"""Reconstruction of a service's status timeline from stored runs."""
+
+from __future__ import annotations
+
+import uuid  # noqa: TC003
+from dataclasses import dataclass
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+from sqlalchemy import func, select
+
+from src.models import ServiceStatus, ServiceStatusRecord
+from src.services.pagination import fetch_keyset_page
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+@dataclass(frozen=True, slots=True)
+class StatusInterval:
+    """A span of time during which a service held a single status."""
+
+    status: ServiceStatus
+    start: datetime
+    end: datetime
+    checks: int
+
+
+async def load_timeline(
+    session: AsyncSession,
+    service_id: uuid.UUID,
+    since: datetime,
+    until: datetime,
+) -> list[StatusInterval]:
+    """Rebuild the status timeline of a service within a time range.
+
+    Each stored record lasts until the next record of the same service
+    starts; the latest record lasts until it was last seen. Intervals are
+    clipped to ``[since, until)``. Works the same for run-length and
+    per-poll history.
+
+    Args:
+        session: Database session.
+        service_id: Service whose history to read.
+        since: Inclusive start of the range.
+        until: Exclusive end of the range.
+
+    Returns:
+        Consecutive intervals ordered by start time.
+    """
+    # The record in effect at ``since`` may have started before it
+    preceding = (
+        select(func.max(ServiceStatusRecord.checked_at))
+        .where(
+            ServiceStatusRecord.service_id == service_id,
+            ServiceStatusRecord.checked_at <= since,
+        )
+        .scalar_subquery()
+    )
+    rows = (
+        await session.execute(
+            select(
+                ServiceStatusRecord.status,
+                ServiceStatusRecord.checked_at,
+                ServiceStatusRecord.last_seen_at,
+                ServiceStatusRecord.check_count,
+            )
+            .where(
+                ServiceStatusRecord.service_id == service_id,
+                ServiceStatusRecord.checked_at >= func.coalesce(preceding, since),
+                ServiceStatusRecord.checked_at < until,
+            )
+            .order_by(ServiceStatusRecord.checked_at)
+        )
+    ).all()
+
+    intervals: list[StatusInterval] = []
+    for index, row in enumerate(rows):
+        end = rows[index + 1].checked_at if index + 1 < len(rows) else row.last_seen_at
+        start, end = max(row.checked_at, since), min(end, until)
+        if end >= start:
+            intervals.append(StatusInterval(ServiceStatus(row.status), start, end, row.check_count))
+    return intervals
+
+
+class StatusRecordView(BaseModel):
+    """Public view of a stored run of identical status observations."""
+
+    id: uuid.UUID
+    status: ServiceStatus
+    checked_at: datetime
+    last_seen_at: datetime
+    check_count: int
+
+
+class StatusHistoryPage(BaseModel):
+    """A page of status records and the cursor of the page after it."""
+
+    items: list[StatusRecordView]
+    next_cursor: str | None
+
+
+async def load_history_page(
+    connection: AsyncConnection | AsyncSession,
+    service_id: uuid.UUID,
+    limit: int,
+    cursor: str | None = None,
+) -> StatusHistoryPage:
+    """Read a page of a service's stored status records, newest first.
+
+    Walks ``ix_service_status_service_checked`` from the cursor position.
+
+    Args:
+        connection: Database connection, or a session.
+        service_id: Service whose history to read.
+        limit: Maximum number of records in the page.
+        cursor: Cursor returned with the previous page, if any.
+
+    Returns:
+        The records and the cursor of the next page.
+    """
+    rows, next_cursor = await fetch_keyset_page(
+        connection,
+        select(
+            ServiceStatusRecord.id,
+            ServiceStatusRecord.status,
+            ServiceStatusRecord.checked_at,
+            ServiceStatusRecord.last_seen_at,
+            ServiceStatusRecord.check_count,
+        ).where(ServiceStatusRecord.service_id == service_id),
+        ServiceStatusRecord.checked_at,
+        ServiceStatusRecord.id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return StatusHistoryPage(
+        items=[StatusRecordView.model_validate(row._mapping) for row in rows],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,251 @@
+"""Change detection and batched persistence of provider-reported incidents."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING
+
+from sqlalchemy import case, func, select
+
+from src.core.database import upsert
+from src.core.ids import uuid7
+from src.core.metrics import INGEST_BATCH_SIZE
+from src.models import Incident, IncidentImpact, IncidentStatus
+from src.services.schedule import CLOSED_INCIDENT_STATUSES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.providers import IncidentReport
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT, keeping each statement under PostgreSQL's bind parameter limit
+MAX_ROWS_PER_STATEMENT = 1000
+
+IncidentKey = tuple[uuid.UUID, str]
+
+
+@dataclass(frozen=True, slots=True)
+class IncidentChange:
+    """A committed new or changed incident, as stored."""
+
+    incident_id: uuid.UUID
+    service_id: uuid.UUID
+    external_id: str
+    title: str
+    status: IncidentStatus
+    impact: IncidentImpact
+    resolved_at: datetime | None = None
+
+
+IncidentListener = Callable[[Sequence[IncidentChange]], None]
+
+
+def incident_digest(
+    title: str,
+    status: IncidentStatus,
+    impact: IncidentImpact,
+    description: str | None,
+) -> bytes:
+    """Hash the fields of an incident that a provider can change."""
+    fields = (title, str(status), str(impact), description or "")
+    return hashlib.blake2b("\x1f".join(fields).encode(), digest_size=16).digest()
+
+
+class IncidentIngestor:
+    """Writes the incidents providers report, skipping those that did not change.
+
+    A digest of each known incident's title, status, impact and
+    description is kept in memory, keyed by ``(service_id, external_id)``
+    and loaded per service the first time it reports anything. Reports
+    matching their digest are dropped without touching the database; the
+    rest, from any number of services, are written by one multi-row
+    ``INSERT ... ON CONFLICT`` on ``uq_incident_service_external`` per
+    ``MAX_ROWS_PER_STATEMENT`` rows, all in one transaction.
+
+    ``resolved_at`` follows the status: it is set when an incident is first
+    seen resolved, to the provider's time if it reported one or to when the
+    report was seen otherwise, kept while it stays resolved, and cleared if
+    it reopens.
+
+    The rows written by each committed batch are passed to registered
+    listeners as ``IncidentChange`` events.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Initialize the ingestor with an empty index.
+
+        Args:
+            session_factory: Factory for database sessions.
+        """
+        self.session_factory = session_factory
+        self._index: dict[IncidentKey, bytes] = {}
+        self._loaded: set[uuid.UUID] = set()
+        self._listeners: list[IncidentListener] = []
+
+    def add_listener(self, listener: IncidentListener) -> None:
+        """Register a callback invoked with the incidents of each committed write."""
+        self._listeners.append(listener)
+
+    async def ingest(
+        self,
+        reports: Iterable[tuple[uuid.UUID, IncidentReport]],
+        seen_at: datetime,
+    ) -> int:
+        """Store the new and changed incidents among ``reports``.
+
+        Args:
+            reports: Incidents paired with the service that reported them.
+            seen_at: When the reports were fetched.
+
+        Returns:
+            The number of incidents written.
+        """
+        latest: dict[IncidentKey, IncidentReport] = {}
+        for service_id, report in reports:
+            latest[service_id, report.external_id] = report
+        if not latest:
+            return 0
+
+        async with self.session_factory() as session:
+            await self._load(session, {service_id for service_id, _ in latest})
+            digests = {
+                key: incident_digest(report.title, report.status, report.impact, report.description)
+                for key, report in latest.items()
+            }
+            changed = [key for key, digest in digests.items() if self._index.get(key) != digest]
+            if not changed:
+                return 0
+            INGEST_BATCH_SIZE.labels("incidents").observe(len(changed))
+            written: list[IncidentChange] = []
+            for start in range(0, len(changed), MAX_ROWS_PER_STATEMENT):
+                batch = changed[start : start + MAX_ROWS_PER_STATEMENT]
+                written += await self._upsert(
+                    session, [(key, latest[key]) for key in batch], seen_at
+                )
+            await session.commit()
+
+        # Only once committed, so a failed write is retried on the next report
+        for key in changed:
+            self._index[key] = digests[key]
+        self._notify(written)
+        return len(changed)
+
+    def forget(self, service_ids: Iterable[uuid.UUID]) -> None:
+        """Drop the indexed incidents of services, reloading them on next use."""
+        dropped = set(service_ids) & self._loaded
+        if dropped:
+            self._loaded -= dropped
+            self._index = {
+                key: value for key, value in self._index.items() if key[0] not in dropped
+            }
+
+    def _notify(self, changes: Sequence[IncidentChange]) -> None:
+        """Pass committed incidents to every listener, isolating their failures."""
+        for listener in self._listeners:
+            try:
+                listener(changes)
+            except Exception:
+                logger.exception("Incident listener %r failed", listener)
+
+    async def _load(self, session: AsyncSession, service_ids: set[uuid.UUID]) -> None:
+        """Index the stored incidents of services not indexed yet."""
+        missing = list(service_ids - self._loaded)
+        if not missing:
+            return
+        rows = await session.execute(
+            select(
+                Incident.service_id,
+                Incident.external_id,
+                Incident.title,
+                Incident.status,
+                Incident.impact,
+                Incident.description,
+            ).where(Incident.service_id.in_(missing))
+        )
+        for row in rows:
+            self._index[row.service_id, row.external_id] = incident_digest(
+                row.title, IncidentStatus(row.status), IncidentImpact(row.impact), row.description
+            )
+        self._loaded.update(missing)
+
+    @staticmethod
+    async def _upsert(
+        session: AsyncSession,
+        reports: list[tuple[IncidentKey, IncidentReport]],
+        seen_at: datetime,
+    ) -> list[IncidentChange]:
+        """Insert or overwrite a batch of incidents in one statement.
+
+        Returns:
+            The incidents as stored.
+        """
+        stmt = upsert(session.get_bind().dialect.name, Incident)
+        rows = [
+            {
+                "id": uuid7(),
+                "service_id": service_id,
+                "external_id": external_id,
+                "title": report.title,
+                "description": report.description,
+                "status": report.status,
+                "impact": report.impact,
+                "resolved_at": (
+                    report.resolved_at or seen_at
+                    if report.status in CLOSED_INCIDENT_STATUSES
+                    else None
+                ),
+            }
+            for (service_id, external_id), report in reports
+        ]
+        excluded = stmt.excluded
+        result = await session.execute(
+            stmt.values(rows)
+            .on_conflict_do_update(
+                index_elements=["service_id", "external_id"],
+                set_={
+                    "title": excluded.title,
+                    "description": excluded.description,
+                    "status": excluded.status,
+                    "impact": excluded.impact,
+                    # Keep the first resolution time; clear it if the incident reopens
+                    "resolved_at": case(
+                        (
+                            excluded.status.in_(CLOSED_INCIDENT_STATUSES),
+                            func.coalesce(Incident.resolved_at, excluded.resolved_at),
+                        ),
+                        else_=None,
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(
+                Incident.id,
+                Incident.service_id,
+                Incident.external_id,
+                Incident.title,
+                Incident.status,
+                Incident.impact,
+                Incident.resolved_at,
+            )
+        )
+        return [
+            IncidentChange(
+                incident_id=row.id,
+                service_id=row.service_id,
+                external_id=row.external_id,
+                title=row.title,
+                status=IncidentStatus(row.status),
+                impact=IncidentImpact(row.impact),
+                resolved_at=row.resolved_at,
+            )
+            for row in result
+        ]
@@ -0,0 +1,78 @@
+"""Read access to incidents reported by status pages."""
+
+from __future__ import annotations
+
+import uuid  # noqa: TC003
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from src.models import Incident, IncidentImpact, IncidentStatus
+from src.services.pagination import fetch_keyset_page
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+class IncidentView(BaseModel):
+    """Public view of an incident."""
+
+    id: uuid.UUID
+    service_id: uuid.UUID
+    external_id: str
+    title: str
+    status: IncidentStatus
+    impact: IncidentImpact
+    created_at: datetime
+    resolved_at: datetime | None
+
+
+class IncidentPage(BaseModel):
+    """A page of incidents and the cursor of the page after it."""
+
+    items: list[IncidentView]
+    next_cursor: str | None
+
+
+async def load_incident_page(
+    connection: AsyncConnection | AsyncSession,
+    status: IncidentStatus,
+    limit: int,
+    cursor: str | None = None,
+) -> IncidentPage:
+    """Read a page of incidents in one status, newest first.
+
+    Walks ``ix_incident_status_created`` from the cursor position.
+
+    Args:
+        connection: Database connection, or a session.
+        status: Incident status to list.
+        limit: Maximum number of incidents in the page.
+        cursor: Cursor returned with the previous page, if any.
+
+    Returns:
+        The incidents and the cursor of the next page.
+    """
+    rows, next_cursor = await fetch_keyset_page(
+        connection,
+        select(
+            Incident.id,
+            Incident.service_id,
+            Incident.external_id,
+            Incident.title,
+            Incident.status,
+            Incident.impact,
+            Incident.created_at,
+            Incident.resolved_at,
+        ).where(Incident.status == status),
+        Incident.created_at,
+        Incident.id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return IncidentPage(
+        items=[IncidentView.model_validate(row._mapping) for row in rows],
+        next_cursor=next_cursor,
+    )
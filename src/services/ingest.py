@@ -0,0 +1,451 @@
+"""Persistence of poll results into the status history."""
+
+from __future__ import annotations
+
+import logging
+import uuid  # noqa: TC003
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from sqlalchemy import case, func, insert, select, tuple_, update
+
+from src.core.ids import uuid7
+from src.core.metrics import INGEST_BATCH_SIZE
+from src.models import Service, ServiceStatus, ServiceStatusRecord
+from src.services.payloads import store_payloads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.engine import CursorResult
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.providers import ProviderResult
+
+logger = logging.getLogger(__name__)
+
+HistoryMode = Literal["run_length", "per_poll"]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusUpdate:
+    """A committed change to a service's current status projection.
+
+    ``status`` is None when the poll only confirmed the previous status.
+    """
+
+    service_id: uuid.UUID
+    checked_at: datetime
+    status: ServiceStatus | None = None
+    previous_status: ServiceStatus | None = None
+
+    @property
+    def is_transition(self) -> bool:
+        """Whether the service moved to a different status."""
+        return self.status is not None and self.status != self.previous_status
+
+
+StatusListener = Callable[[Sequence[StatusUpdate]], None]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusWrite:
+    """A changed poll result waiting to be stored."""
+
+    service_id: uuid.UUID
+    result: ProviderResult
+    checked_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class _OpenRun:
+    """Primary key and status of the latest status record of a service."""
+
+    record_id: uuid.UUID
+    checked_at: datetime
+    status: ServiceStatus
+
+
+def _rounds(writes: Sequence[StatusWrite]) -> list[list[StatusWrite]]:
+    """Split writes into ordered rounds holding at most one write per service."""
+    rounds: list[list[StatusWrite]] = []
+    last_round: dict[uuid.UUID, int] = {}
+    for write in writes:
+        index = last_round.get(write.service_id, -1) + 1
+        if index == len(rounds):
+            rounds.append([])
+        rounds[index].append(write)
+        last_round[write.service_id] = index
+    return rounds
+
+
+class StatusIngestor:
+    """Writes poll results to ``service_status``.
+
+    In ``run_length`` mode a poll that repeats the current status extends
+    the open record instead of inserting a new one; only transitions open
+    a new record. The key and status of each service's open record are kept
+    in memory so that the common no-transition case is a single UPDATE
+    that touches one partition. If the record was moved in the meantime
+    (partition retention shifts ``checked_at``), the key is reloaded.
+
+    Every write also refreshes the ``current_status``/``last_checked_at``
+    projection on ``service`` in the same transaction; reported incidents
+    are written separately by ``IncidentIngestor``. Once committed, the
+    resulting ``StatusUpdate`` events are passed to registered listeners
+    so in-memory state can follow without reading the database.
+
+    When another process wrote a service since this one did, ``resync``
+    drops what is cached about it and hands the stored observation to
+    resync listeners, so they resume from it rather than from the last
+    observation this process made.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        mode: HistoryMode = "run_length",
+    ) -> None:
+        """Initialize the ingestor.
+
+        Args:
+            session_factory: Factory for database sessions.
+            mode: Whether to run-length encode history or store every poll.
+        """
+        self.session_factory = session_factory
+        self.mode = mode
+        self._open_runs: dict[uuid.UUID, _OpenRun] = {}
+        # The last_checked_at this ingestor wrote for each service
+        self._written: dict[uuid.UUID, datetime] = {}
+        self._listeners: list[StatusListener] = []
+        self._resync_listeners: list[StatusListener] = []
+
+    def add_listener(self, listener: StatusListener) -> None:
+        """Register a callback invoked with the updates of each committed write."""
+        self._listeners.append(listener)
+
+    def add_resync_listener(self, listener: StatusListener) -> None:
+        """Register a callback invoked with the stored observations of resynced services."""
+        self._resync_listeners.append(listener)
+
+    def wrote_last(self, service_id: uuid.UUID, last_checked_at: datetime | None) -> bool:
+        """Whether the service's stored ``last_checked_at`` is this ingestor's write.
+
+        If not, another process wrote the service since, and what is cached
+        about it here may no longer match the database.
+        """
+        return self._written.get(service_id) == last_checked_at
+
+    def forget(self, service_ids: Iterable[uuid.UUID]) -> None:
+        """Drop the cached runs of services, reloading them on next use."""
+        for service_id in service_ids:
+            self._open_runs.pop(service_id, None)
+            self._written.pop(service_id, None)
+
+    def resync(self, services: Sequence[Service]) -> None:
+        """Resume services another process wrote since from what it stored.
+
+        Their cached runs are dropped, and resync listeners receive each
+        service's stored ``last_checked_at`` and ``current_status`` as a
+        ``StatusUpdate``; services never checked are only forgotten.
+        """
+        self.forget(service.id for service in services)
+        observed = [
+            StatusUpdate(service.id, service.last_checked_at, service.current_status)
+            for service in services
+            if service.last_checked_at is not None
+        ]
+        if not observed:
+            return
+        for listener in self._resync_listeners:
+            try:
+                listener(observed)
+            except Exception:
+                logger.exception("Status resync listener %r failed", listener)
+
+    def _notify(self, updates: Sequence[StatusUpdate]) -> None:
+        """Pass committed updates to every listener, isolating their failures."""
+        for listener in self._listeners:
+            try:
+                listener(updates)
+            except Exception:
+                logger.exception("Status listener %r failed", listener)
+
+    async def record(
+        self,
+        service_id: uuid.UUID,
+        result: ProviderResult,
+        checked_at: datetime,
+    ) -> None:
+        """Store a changed poll result.
+
+        Args:
+            service_id: The polled service.
+            result: The provider's result for the poll.
+            checked_at: When the poll was made.
+        """
+        await self.record_many([StatusWrite(service_id, result, checked_at)])
+
+    async def record_many(self, writes: Sequence[StatusWrite]) -> None:
+        """Store many changed poll results in one transaction.
+
+        Projections are refreshed by one batched UPDATE, payloads stored by
+        one multi-row upsert, open runs extended by one UPDATE and new
+        records added by one multi-row INSERT. A service polled more than
+        once in the batch is written in order, one statement set per poll.
+
+        Args:
+            writes: Poll results, in the order they were made.
+        """
+        if not writes:
+            return
+        INGEST_BATCH_SIZE.labels("record").observe(len(writes))
+        updates: list[StatusUpdate] = []
+        try:
+            async with self.session_factory() as session:
+                for batch in _rounds(writes):
+                    updates.extend(await self._write(session, batch))
+                await session.commit()
+        except Exception:
+            # The cached runs may not match what was committed
+            for write in writes:
+                self._open_runs.pop(write.service_id, None)
+            raise
+        for status_update in updates:
+            self._written[status_update.service_id] = status_update.checked_at
+        self._notify(updates)
+
+    async def touch(self, service_ids: Iterable[uuid.UUID], seen_at: datetime) -> None:
+        """Extend the open runs of services whose pages did not change.
+
+        Providers report unchanged pages without a payload, so the status is
+        known to be the same and all of them are extended in one UPDATE,
+        plus one UPDATE of their ``last_checked_at``. Per-poll mode keeps no
+        runs and only refreshes ``last_checked_at``.
+
+        Args:
+            service_ids: Services confirmed unchanged by their last poll.
+            seen_at: When the services were last polled.
+        """
+        service_ids = list(service_ids)
+        if not service_ids:
+            return
+        INGEST_BATCH_SIZE.labels("touch").observe(len(service_ids))
+        async with self.session_factory() as session:
+            if self.mode == "run_length":
+                await self._extend_runs(session, service_ids, seen_at)
+            await session.execute(
+                update(Service).where(Service.id.in_(service_ids)).values(last_checked_at=seen_at)
+            )
+            await session.commit()
+        for service_id in service_ids:
+            self._written[service_id] = seen_at
+        self._notify([StatusUpdate(service_id, seen_at) for service_id in service_ids])
+
+    async def _write(self, session: AsyncSession, writes: list[StatusWrite]) -> list[StatusUpdate]:
+        """Update the projections, then extend open runs or insert new records.
+
+        ``writes`` holds at most one result per service.
+
+        Returns:
+            The resulting updates, with each service's previous status.
+        """
+        await session.execute(
+            update(Service),
+            [
+                {
+                    "id": write.service_id,
+                    "current_status": write.result.status,
+                    "last_checked_at": write.checked_at,
+                }
+                for write in writes
+            ],
+        )
+        payloads = [
+            (write.service_id, (write.result.raw_response, write.checked_at))
+            for write in writes
+            if write.result.raw_response is not None
+        ]
+        stored = await store_payloads(session, [payload for _, payload in payloads])
+        digests = dict(zip((service_id for service_id, _ in payloads), stored, strict=True))
+
+        missing = [write.service_id for write in writes if write.service_id not in self._open_runs]
+        if missing:
+            await self._load_open_runs(session, missing)
+        previous = {
+            write.service_id: run.status
+            for write in writes
+            if (run := self._open_runs.get(write.service_id)) is not None
+        }
+        inserts = writes
+        if self.mode == "run_length":
+            extended = await self._extend_matching_runs(session, writes, digests)
+            inserts = [write for write in writes if write.service_id not in extended]
+        if inserts:
+            await self._insert_records(session, inserts, digests)
+        return [
+            StatusUpdate(
+                write.service_id,
+                write.checked_at,
+                write.result.status,
+                previous.get(write.service_id),
+            )
+            for write in writes
+        ]
+
+    async def _extend_matching_runs(
+        self,
+        session: AsyncSession,
+        writes: list[StatusWrite],
+        digests: dict[uuid.UUID, bytes],
+    ) -> set[uuid.UUID]:
+        """Extend the open runs that repeat the polled status.
+
+        Runs whose record moved since it was cached (partition retention
+        shifts ``checked_at``) are reloaded and extended once more.
+
+        Returns:
+            The services whose run was extended.
+        """
+        extended: set[uuid.UUID] = set()
+        pending = writes
+        for attempt in range(2):
+            runs = [
+                (write, run)
+                for write in pending
+                if (run := self._open_runs.get(write.service_id)) is not None
+                and run.status == write.result.status
+            ]
+            if not runs:
+                break
+            updated = await self._update_runs(session, runs, digests)
+            extended.update(write.service_id for write, run in runs if run.record_id in updated)
+            moved = [write.service_id for write, run in runs if run.record_id not in updated]
+            if not moved or attempt:
+                break
+            # Retry the moved records against their current keys
+            for service_id in moved:
+                self._open_runs.pop(service_id, None)
+            await self._load_open_runs(session, moved)
+            pending = [write for write, run in runs if run.record_id not in updated]
+        return extended
+
+    @staticmethod
+    async def _update_runs(
+        session: AsyncSession,
+        runs: list[tuple[StatusWrite, _OpenRun]],
+        digests: dict[uuid.UUID, bytes],
+    ) -> set[uuid.UUID]:
+        """Extend many records, each by its full key, with a single UPDATE.
+
+        Returns:
+            Ids of the records that still existed and were updated.
+        """
+        record_id = ServiceStatusRecord.id
+        result = await session.execute(
+            update(ServiceStatusRecord)
+            .where(
+                tuple_(record_id, ServiceStatusRecord.checked_at).in_(
+                    [(run.record_id, run.checked_at) for _, run in runs]
+                ),
+                ServiceStatusRecord.checked_at >= min(run.checked_at for _, run in runs),
+            )
+            .values(
+                last_seen_at=case(
+                    {run.record_id: write.checked_at for write, run in runs}, value=record_id
+                ),
+                check_count=ServiceStatusRecord.check_count + 1,
+                raw_response_digest=case(
+                    {run.record_id: digests.get(write.service_id) for write, run in runs},
+                    value=record_id,
+                ),
+            )
+            .returning(record_id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars().all())
+
+    async def _insert_records(
+        self,
+        session: AsyncSession,
+        writes: list[StatusWrite],
+        digests: dict[uuid.UUID, bytes],
+    ) -> None:
+        """Open a new record per write with a multi-row INSERT."""
+        opened = [
+            (write, _OpenRun(uuid7(), write.checked_at, write.result.status)) for write in writes
+        ]
+        rows = [
+            {
+                "id": run.record_id,
+                "service_id": write.service_id,
+                "status": write.result.status,
+                "checked_at": write.checked_at,
+                "last_seen_at": write.checked_at,
+                "check_count": 1,
+                "raw_response_digest": digests.get(write.service_id),
+            }
+            for write, run in opened
+        ]
+        await session.execute(insert(ServiceStatusRecord), rows)
+        for write, run in opened:
+            self._open_runs[write.service_id] = run
+
+    async def _extend_runs(
+        self,
+        session: AsyncSession,
+        service_ids: list[uuid.UUID],
+        seen_at: datetime,
+    ) -> None:
+        """Extend the open runs of many services with a single UPDATE."""
+        missing = [sid for sid in service_ids if sid not in self._open_runs]
+        if missing:
+            await self._load_open_runs(session, missing)
+        runs = [run for sid in service_ids if (run := self._open_runs.get(sid))]
+        if not runs:
+            return
+        result = await session.execute(
+            update(ServiceStatusRecord)
+            .where(
+                tuple_(ServiceStatusRecord.id, ServiceStatusRecord.checked_at).in_(
+                    [(run.record_id, run.checked_at) for run in runs]
+                ),
+                # Lets PostgreSQL prune partitions older than any open run
+                ServiceStatusRecord.checked_at >= min(run.checked_at for run in runs),
+            )
+            .values(last_seen_at=seen_at, check_count=ServiceStatusRecord.check_count + 1)
+        )
+        if cast("CursorResult[Any]", result).rowcount != len(runs):
+            # Some records moved; reload their keys on the next batch
+            for sid in service_ids:
+                self._open_runs.pop(sid, None)
+
+    async def _load_open_runs(self, session: AsyncSession, service_ids: list[uuid.UUID]) -> None:
+        """Load the latest record of each service into the run cache."""
+        latest = (
+            select(
+                ServiceStatusRecord.service_id,
+                func.max(ServiceStatusRecord.checked_at).label("checked_at"),
+            )
+            .where(ServiceStatusRecord.service_id.in_(service_ids))
+            .group_by(ServiceStatusRecord.service_id)
+            .subquery()
+        )
+        rows = await session.execute(
+            select(
+                ServiceStatusRecord.id,
+                ServiceStatusRecord.service_id,
+                ServiceStatusRecord.checked_at,
+                ServiceStatusRecord.status,
+            ).join(
+                latest,
+                (ServiceStatusRecord.service_id == latest.c.service_id)
+                & (ServiceStatusRecord.checked_at == latest.c.checked_at),
+            )
+        )
+        for row in rows:
+            self._open_runs[row.service_id] = _OpenRun(
+                row.id, row.checked_at, ServiceStatus(row.status)
+            )
@@ -0,0 +1,302 @@
+"""Cross-process propagation of status updates and incidents over PostgreSQL LISTEN/NOTIFY."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+from src.models import IncidentImpact, IncidentStatus, ServiceStatus
+from src.services.incident_ingest import IncidentChange
+from src.services.ingest import StatusUpdate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from src.core.config import Settings
+    from src.services.incident_ingest import IncidentListener
+    from src.services.ingest import StatusListener
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+RECONNECT_DELAY_SECONDS = 5.0
+
+
+def encode_updates(origin: str, updates: Sequence[StatusUpdate]) -> Iterator[list[str]]:
+    """Pack updates into compact JSON items, chunked to fit one NOTIFY each.
+
+    Yields:
+        Lists of encoded items whose joined size fits in a payload.
+    """
+    return _chunk(
+        origin,
+        (
+            json.dumps(
+                [
+                    update.service_id.hex,
+                    update.status,
+                    update.previous_status,
+                    update.checked_at.isoformat(),
+                ],
+                separators=(",", ":"),
+            )
+            for update in updates
+        ),
+    )
+
+
+def encode_incidents(origin: str, changes: Sequence[IncidentChange]) -> Iterator[list[str]]:
+    """Pack incidents into compact JSON items, chunked to fit one NOTIFY each.
+
+    Yields:
+        Lists of encoded items whose joined size fits in a payload.
+    """
+    return _chunk(
+        origin,
+        (
+            json.dumps(
+                [
+                    change.incident_id.hex,
+                    change.service_id.hex,
+                    change.external_id,
+                    change.title,
+                    change.status,
+                    change.impact,
+                    change.resolved_at.isoformat() if change.resolved_at else None,
+                ],
+                separators=(",", ":"),
+            )
+            for change in changes
+        ),
+    )
+
+
+def _chunk(origin: str, items: Iterable[str]) -> Iterator[list[str]]:
+    """Group encoded items so each group fits in one payload."""
+    budget = MAX_PAYLOAD_BYTES - len(origin) - 64
+    chunk: list[str] = []
+    size = 0
+    for item in items:
+        if chunk and size + len(item) + 1 > budget:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(item)
+        size += len(item) + 1
+    if chunk:
+        yield chunk
+
+
+def build_payload(origin: str, seq: int, items: list[str], kind: str = "u") -> str:
+    """Wrap encoded items with the sender's origin and sequence number.
+
+    ``kind`` is ``"u"`` for items from ``encode_updates`` and ``"i"`` for
+    items from ``encode_incidents``.
+    """
+    return f'{{"o":"{origin}","v":{seq},"{kind}":[{",".join(items)}]}}'
+
+
+def decode_payload(payload: str) -> tuple[str, int, list[StatusUpdate], list[IncidentChange]]:
+    """Decode a payload produced by ``build_payload``.
+
+    Returns:
+        The origin, its sequence number, the updates and the incidents.
+
+    Raises:
+        ValueError: If the payload is malformed.
+    """
+    data = json.loads(payload)
+    try:
+        updates = [
+            StatusUpdate(
+                service_id=uuid.UUID(hex=service_id),
+                checked_at=datetime.fromisoformat(checked_at),
+                status=ServiceStatus(status) if status else None,
+                previous_status=ServiceStatus(previous) if previous else None,
+            )
+            for service_id, status, previous, checked_at in data.get("u", ())
+        ]
+        incidents = [
+            IncidentChange(
+                incident_id=uuid.UUID(hex=incident_id),
+                service_id=uuid.UUID(hex=service_id),
+                external_id=external_id,
+                title=title,
+                status=IncidentStatus(status),
+                impact=IncidentImpact(impact),
+                resolved_at=datetime.fromisoformat(resolved_at) if resolved_at else None,
+            )
+            for incident_id, service_id, external_id, title, status, impact, resolved_at in (
+                data.get("i", ())
+            )
+        ]
+        return str(data["o"]), int(data["v"]), updates, incidents
+    except (KeyError, TypeError) as e:
+        raise ValueError("Malformed status notification") from e
+
+
+class StatusNotificationBus:
+    """Relays committed status updates and incidents between worker processes.
+
+    Registered as a ``StatusIngestor`` listener, it sends the updates made
+    by this process to a NOTIFY channel, and passes updates received from
+    other processes to its own listeners (typically the status snapshot
+    cache and the event broker). Incidents written by an
+    ``IncidentIngestor`` travel the same way through ``publish_incidents``
+    and ``add_incident_listener``. Both directions share one dedicated
+    asyncpg connection outside the SQLAlchemy pool, reconnected when lost.
+
+    Every payload carries the sender's origin id and a per-origin sequence
+    number. A gap in a sender's sequence, or a reconnect of our listening
+    connection, means notifications were missed; reset listeners are then
+    called so caches can fall back to reloading from the database.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize the bus.
+
+        Args:
+            settings: Application settings with database and channel configuration.
+        """
+        self.settings = settings
+        self.channel = settings.status_notify_channel
+        self.origin = uuid.uuid4().hex
+        self._dsn = str(settings.database_url).replace("postgresql+asyncpg://", "postgresql://")
+        self._seq = 0
+        self._last_seen: dict[str, int] = {}
+        self._listeners: list[StatusListener] = []
+        self._incident_listeners: list[IncidentListener] = []
+        self._reset_listeners: list[Callable[[], None]] = []
+        self._outbox: asyncio.Queue[str] = asyncio.Queue(maxsize=1000)
+        self._task: asyncio.Task[None] | None = None
+
+    def add_listener(self, listener: StatusListener) -> None:
+        """Register a callback for updates received from other processes."""
+        self._listeners.append(listener)
+
+    def add_incident_listener(self, listener: IncidentListener) -> None:
+        """Register a callback for incidents received from other processes."""
+        self._incident_listeners.append(listener)
+
+    def add_reset_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked when notifications may have been missed."""
+        self._reset_listeners.append(listener)
+
+    async def start(self) -> None:
+        """Connect and start relaying in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="status-notify")
+
+    async def stop(self) -> None:
+        """Stop relaying and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def publish(self, updates: Sequence[StatusUpdate]) -> None:
+        """Queue locally committed updates for broadcast."""
+        if self._task is None:
+            return
+        self._send(encode_updates(self.origin, updates), "u")
+
+    def publish_incidents(self, changes: Sequence[IncidentChange]) -> None:
+        """Queue locally committed incidents for broadcast."""
+        if self._task is None:
+            return
+        self._send(encode_incidents(self.origin, changes), "i")
+
+    def _send(self, chunks: Iterable[list[str]], kind: str) -> None:
+        """Queue a payload per chunk of encoded items."""
+        for items in chunks:
+            self._seq += 1
+            try:
+                self._outbox.put_nowait(build_payload(self.origin, self._seq, items, kind))
+            except asyncio.QueueFull:
+                # Receivers detect the sequence gap and reload
+                logger.warning("Status notification outbox full; dropping update")
+
+    async def _run(self) -> None:
+        """Keep a listening connection open, reconnecting when it drops."""
+        connected_before = False
+        while True:
+            try:
+                conn = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("Failed to connect status notification bus")
+            else:
+                try:
+                    if connected_before:
+                        self._reset()
+                    connected_before = True
+                    await self._serve(conn)
+                except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                    logger.exception("Status notification connection lost")
+                finally:
+                    with contextlib.suppress(Exception):
+                        await conn.close(timeout=5)
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _serve(self, conn: Any) -> None:
+        """Listen and send queued notifications until the connection closes."""
+        closed = asyncio.Event()
+        conn.add_termination_listener(lambda _: closed.set())
+        await conn.add_listener(self.channel, self._on_notification)
+        closed_wait = asyncio.ensure_future(closed.wait())
+        try:
+            while True:
+                next_payload = asyncio.ensure_future(self._outbox.get())
+                done, _ = await asyncio.wait(
+                    {next_payload, closed_wait}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_payload not in done:
+                    next_payload.cancel()
+                    return
+                await conn.execute("SELECT pg_notify($1, $2)", self.channel, next_payload.result())
+        finally:
+            closed_wait.cancel()
+
+    def _on_notification(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        """Handle a notification delivered by asyncpg."""
+        try:
+            origin, seq, updates, incidents = decode_payload(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed status notification")
+            self._reset()
+            return
+        if origin == self.origin:
+            return
+        last = self._last_seen.get(origin)
+        self._last_seen[origin] = seq
+        if last is not None and seq != last + 1:
+            logger.info("Missed status notifications from %s; resetting", origin)
+            self._reset()
+            return
+        if updates:
+            for listener in self._listeners:
+                try:
+                    listener(updates)
+                except Exception:
+                    logger.exception("Status notification listener %r failed", listener)
+        if incidents:
+            for incident_listener in self._incident_listeners:
+                try:
+                    incident_listener(incidents)
+                except Exception:
+                    logger.exception("Incident notification listener %r failed", incident_listener)
+
+    def _reset(self) -> None:
+        """Tell reset listeners that notifications may have been missed."""
+        for listener in self._reset_listeners:
+            try:
+                listener()
+            except Exception:
+                logger.exception("Status notification reset listener %r failed", listener)
@@ -0,0 +1,88 @@
+"""Keyset (cursor) pagination over ``(timestamp, id)`` ordered queries."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import tuple_
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Row, Select
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    """Encode the position after a row as an opaque, URL-safe cursor."""
+    payload = json.dumps([sort_value.isoformat(), row_id.hex], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), uuid.UUID(hex=row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+async def fetch_keyset_page(
+    connection: AsyncConnection | AsyncSession,
+    stmt: Select[*tuple[Any, ...]],
+    sort_column: InstrumentedAttribute[datetime],
+    id_column: InstrumentedAttribute[uuid.UUID],
+    *,
+    limit: int,
+    cursor: str | None = None,
+) -> tuple[Sequence[Row[Any]], str | None]:
+    """Fetch one page of ``stmt`` ordered newest first.
+
+    Rows are ordered by ``(sort_column, id_column)`` descending and the
+    page starts strictly after the cursor position, so with an index
+    ending in those columns every page is a bounded index range scan no
+    matter how deep it is, unlike ``OFFSET`` which reads and discards all
+    preceding rows. ``id_column`` breaks ties between equal timestamps.
+
+    Args:
+        connection: Database connection, or a session.
+        stmt: Filtered select; ordering and limit are applied here.
+        sort_column: Timestamp column to page by.
+        id_column: Unique column breaking ties.
+        limit: Maximum number of rows in the page.
+        cursor: Cursor returned with the previous page, if any.
+
+    Returns:
+        The page's rows and the cursor of the next page, or None on the last page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    if cursor is not None:
+        stmt = stmt.where(tuple_(sort_column, id_column) < tuple_(*decode_cursor(cursor)))
+    stmt = stmt.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+    rows = (await connection.execute(stmt)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]._mapping
+    return rows, encode_cursor(last[sort_column.key], last[id_column.key])
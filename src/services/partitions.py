@@ -0,0 +1,243 @@
+"""Maintenance of the daily range partitions of ``service_status``.
+
+Partitions are named ``service_status_pYYYYMMDD`` and cover one UTC day of
+``checked_at``. Future partitions are created ahead of time so inserts
+never fail, and partitions older than the retention window are detached
+and dropped whole instead of being purged row by row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+from src.core.clock import utcnow
+from src.services.payloads import purge_unreferenced_payloads
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+    from src.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "service_status"
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p(\d{{8}})$")
+
+# Unreferenced payloads younger than this may belong to an uncommitted ingest
+PAYLOAD_GRACE_PERIOD = timedelta(hours=1)
+
+# Arbitrary application-wide key so only one worker maintains partitions at a time
+MAINTENANCE_LOCK_KEY = 0x5B_0001
+
+# Longest a DETACH waits for its lock; queued behind ingest, it would block every later write
+DETACH_LOCK_TIMEOUT = "5s"
+
+
+def partition_name(day: date) -> str:
+    """Name of the partition holding rows checked on ``day``."""
+    return f"{PARENT_TABLE}_p{day:%Y%m%d}"
+
+
+def _day_start(day: date) -> datetime:
+    """Midnight at the start of ``day`` as a naive UTC timestamp."""
+    return datetime.combine(day, time.min)
+
+
+@dataclass(slots=True)
+class MaintenanceResult:
+    """Partitions created and dropped by a maintenance run."""
+
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    purged_payloads: int = 0
+
+
+async def list_partitions(conn: AsyncConnection) -> dict[date, str]:
+    """Return the existing daily partitions keyed by the day they cover."""
+    rows = await conn.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :parent
+            """
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    partitions: dict[date, str] = {}
+    for (name,) in rows:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[datetime.strptime(match.group(1), "%Y%m%d").date()] = name
+    return partitions
+
+
+async def create_partition(conn: AsyncConnection, day: date) -> str:
+    """Create the partition for ``day`` if it does not exist yet."""
+    name = partition_name(day)
+    # Names and bounds are derived from dates, never from user input
+    await conn.execute(
+        text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {PARENT_TABLE} '
+            f"FOR VALUES FROM ('{_day_start(day).isoformat()}') "
+            f"TO ('{_day_start(day + timedelta(days=1)).isoformat()}')"
+        )
+    )
+    return name
+
+
+async def create_future_partitions(
+    conn: AsyncConnection,
+    today: date,
+    days_ahead: int,
+) -> list[str]:
+    """Ensure partitions exist from ``today`` through ``days_ahead`` days later."""
+    existing = await list_partitions(conn)
+    created = []
+    for offset in range(days_ahead + 1):
+        day = today + timedelta(days=offset)
+        if day not in existing:
+            created.append(await create_partition(conn, day))
+    return created
+
+
+async def drop_expired_partitions(conn: AsyncConnection, cutoff: date) -> list[str]:
+    """Detach and drop every partition covering days before ``cutoff``.
+
+    A run-length record that started in an expiring partition but was
+    still being seen afterwards is moved to the start of the following
+    day first, so dropping the partition only trims history that is past
+    retention. Its id is preserved, which keeps in-flight updates valid.
+
+    ``conn`` must not be in a transaction. Each partition's runs are moved
+    in one transaction, and it is detached and dropped in another that
+    does nothing else, so the ``ACCESS EXCLUSIVE`` lock ``DETACH PARTITION``
+    takes on ``service_status`` is held only briefly. That transaction
+    gives up after ``DETACH_LOCK_TIMEOUT`` rather than queue behind ingest.
+    """
+    dropped = []
+    async with conn.begin():
+        partitions = sorted((await list_partitions(conn)).items())
+    for day, name in partitions:
+        if day >= cutoff:
+            break
+        upper = _day_start(day + timedelta(days=1))
+        async with conn.begin():
+            await create_partition(conn, day + timedelta(days=1))
+            await conn.execute(
+                text(
+                    "UPDATE service_status SET checked_at = :upper "
+                    "WHERE checked_at >= :lower AND checked_at < :upper AND last_seen_at >= :upper"
+                ),
+                {"lower": _day_start(day), "upper": upper},
+            )
+        async with conn.begin():
+            await conn.execute(text(f"SET LOCAL lock_timeout = '{DETACH_LOCK_TIMEOUT}'"))
+            await conn.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{name}"'))
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append(name)
+    return dropped
+
+
+class PartitionMaintainer:
+    """Periodically creates upcoming partitions and drops expired ones.
+
+    Whenever partitions are dropped, raw payloads no longer referenced by
+    any status record are deleted as well.
+
+    Creating, dropping and purging each commit in transactions of their
+    own, so ingest is never blocked for longer than one of them takes.
+
+    Safe to run in every worker: each run holds a session-level advisory
+    lock across its transactions and is skipped if another worker holds
+    it. Does nothing on databases other than PostgreSQL.
+    """
+
+    def __init__(self, engine: AsyncEngine, settings: Settings) -> None:
+        """Initialize the maintainer.
+
+        Args:
+            engine: Database engine to run DDL on.
+            settings: Application settings with retention configuration.
+        """
+        self.engine = engine
+        self.settings = settings
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Run maintenance now and then on the configured interval."""
+        if self._task is None and self.engine.dialect.name == "postgresql":
+            self._task = asyncio.create_task(self._run(), name="partition-maintainer")
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Run maintenance until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Partition maintenance failed")
+            await asyncio.sleep(self.settings.status_partition_maintenance_interval_seconds)
+
+    async def run_once(self) -> MaintenanceResult | None:
+        """Create upcoming partitions, drop expired ones and purge orphaned payloads.
+
+        Returns:
+            What was changed, or None if another worker holds the lock.
+        """
+        today = utcnow().date()
+        async with self.engine.connect() as conn:
+            async with conn.begin():
+                locked = await conn.scalar(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+                )
+            if not locked:
+                return None
+            try:
+                result = MaintenanceResult()
+                async with conn.begin():
+                    result.created = await create_future_partitions(
+                        conn, today, self.settings.status_partition_premake_days
+                    )
+                result.dropped = await drop_expired_partitions(
+                    conn, today - timedelta(days=self.settings.status_retention_days)
+                )
+                # Collect unreferenced payloads about once a day, after retention
+                if result.dropped:
+                    async with conn.begin():
+                        result.purged_payloads = await purge_unreferenced_payloads(
+                            conn, utcnow() - PAYLOAD_GRACE_PERIOD
+                        )
+            finally:
+                # Rolls back first, in case a step above failed mid-transaction
+                if conn.in_transaction():
+                    await conn.rollback()
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+                )
+                await conn.commit()
+        if result.created or result.dropped or result.purged_payloads:
+            logger.info(
+                "Partition maintenance created %s, dropped %s, purged %d payloads",
+                result.created,
+                result.dropped,
+                result.purged_payloads,
+            )
+        return result
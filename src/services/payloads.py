@@ -0,0 +1,134 @@
+"""Content-addressed, compressed storage of raw provider payloads."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import delete, exists, select
+
+from src.core.database import upsert
+from src.core.ids import uuid7
+from src.models import RawPayload, ServiceStatusRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
+    from sqlalchemy.engine import CursorResult
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedPayload:
+    """A payload serialized canonically, hashed and compressed."""
+
+    digest: bytes
+    data: bytes
+    size: int
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> EncodedPayload:
+        """Encode a JSON payload.
+
+        Keys are sorted so equal documents hash equally regardless of the
+        upstream's key order, and gzip's timestamp is zeroed so equal
+        documents also compress to identical bytes.
+        """
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+        return cls(
+            digest=hashlib.sha256(body).digest(),
+            data=gzip.compress(body, mtime=0),
+            size=len(body),
+        )
+
+
+async def store_payload(
+    session: AsyncSession,
+    payload: dict[str, Any],
+    used_at: datetime,
+) -> bytes:
+    """Store a payload unless an identical one exists, and return its digest.
+
+    An existing row only has its ``last_used_at`` refreshed, which also
+    locks it against a concurrent garbage collection until commit.
+
+    Args:
+        session: Database session; the caller commits.
+        payload: Decoded upstream payload.
+        used_at: When the payload was observed.
+
+    Returns:
+        The digest to reference the payload by.
+    """
+    (digest,) = await store_payloads(session, [(payload, used_at)])
+    return digest
+
+
+async def store_payloads(
+    session: AsyncSession,
+    payloads: Sequence[tuple[dict[str, Any], datetime]],
+) -> list[bytes]:
+    """Store many payloads with a single multi-row upsert, like ``store_payload``.
+
+    Identical payloads in the batch are written once, with the latest use.
+
+    Args:
+        session: Database session; the caller commits.
+        payloads: Decoded upstream payloads with when each was observed.
+
+    Returns:
+        The digest of each payload, in order.
+    """
+    encoded = [(EncodedPayload.from_json(payload), used_at) for payload, used_at in payloads]
+    rows: dict[bytes, dict[str, Any]] = {}
+    for payload, used_at in encoded:
+        row = rows.get(payload.digest)
+        if row is None or row["last_used_at"] < used_at:
+            rows[payload.digest] = {
+                "id": uuid7(),
+                "digest": payload.digest,
+                "encoding": "gzip",
+                "data": payload.data,
+                "size": payload.size,
+                "last_used_at": used_at,
+            }
+    if rows:
+        stmt = upsert(session.get_bind().dialect.name, RawPayload)
+        await session.execute(
+            stmt.values(list(rows.values())).on_conflict_do_update(
+                index_elements=["digest"],
+                set_={"last_used_at": stmt.excluded.last_used_at},
+            )
+        )
+    return [payload.digest for payload, _ in encoded]
+
+
+async def load_payload(session: AsyncSession, digest: bytes) -> dict[str, Any] | None:
+    """Read and decompress a stored payload, or None if it does not exist."""
+    data = await session.scalar(select(RawPayload.data).where(RawPayload.digest == digest))
+    if data is None:
+        return None
+    payload: dict[str, Any] = json.loads(gzip.decompress(data))
+    return payload
+
+
+async def purge_unreferenced_payloads(conn: AsyncConnection, unused_since: datetime) -> int:
+    """Delete payloads no status record references any more.
+
+    Payloads used after ``unused_since`` are kept even if unreferenced, so
+    a payload stored by an ingest that has not committed yet is not lost.
+
+    Returns:
+        Number of payloads deleted.
+    """
+    result = await conn.execute(
+        delete(RawPayload).where(
+            RawPayload.last_used_at < unused_since,
+            ~exists().where(ServiceStatusRecord.raw_response_digest == RawPayload.digest),
+        )
+    )
+    return cast("CursorResult[Any]", result).rowcount
@@ -0,0 +1,618 @@
+"""Background poller that periodically fetches status pages for all services."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload
+
+from src.core.clock import utcnow
+from src.core.database import upsert
+from src.core.ids import uuid7
+from src.core.metrics import POLL_FETCH_DURATION
+from src.models import Incident, PollBudgetBucket, Service, ServiceStatus
+from src.providers import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderError,
+    ProviderResult,
+    get_provider_class,
+)
+from src.services.incident_ingest import IncidentIngestor
+from src.services.ingest import StatusIngestor, StatusWrite
+from src.services.schedule import (
+    CLOSED_INCIDENT_STATUSES,
+    URGENT_STATUSES,
+    PollBudget,
+    next_poll_interval,
+)
+from src.services.write_buffer import StatusWriteBuffer
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.core.config import Settings
+    from src.providers import IncidentReport, StatusProvider
+
+logger = logging.getLogger(__name__)
+
+# Row of PollBudgetBucket shared by every status poller
+BUDGET_BUCKET = "status_poll"
+
+
+class PollOutcome(StrEnum):
+    """Result of polling a single service within a cycle."""
+
+    STORED = "stored"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+    CIRCUIT_OPEN = "circuit_open"
+
+
+@dataclass(frozen=True, slots=True)
+class CycleStats:
+    """Summary of a single poll cycle."""
+
+    started_at: datetime
+    duration_seconds: float
+    services: int
+    succeeded: int
+    unchanged: int
+    failed: int
+    circuit_open: int = 0
+
+
+class StatusPoller:
+    """Polls each active service when it falls due.
+
+    Every tick the poller collects services whose ``next_poll_at`` has
+    passed, polls them, and schedules each one again: services with an
+    open incident or a non-operational status are polled at the minimum
+    interval, while quiet services back off towards the maximum. A
+    per-minute budget, kept in the database and shared by every poller,
+    caps upstream fetches however many services fall due at once; the
+    overdue ones are polled first on later ticks.
+
+    Fetches run concurrently but are bounded by a global concurrency limit
+    and a per-host limit, so many services hosted on the same status page
+    vendor never open more than a handful of connections to it. Start
+    times are spread across a fraction of the tick using a stable
+    per-service offset, which avoids firing every due service at once.
+
+    Any number of pollers, one per API replica or worker, can share a
+    database: each claims the due services it polls, so every service is
+    polled by one of them per interval and the work rebalances on its own
+    as pollers come and go. Claims are renewed while the cycle runs, so a
+    slow cycle never loses its services to another poller.
+
+    Changed pages are decoded on a pool of ``status_parse_workers``
+    processes, so parsing large documents never stalls the fetch loop or,
+    when polling inside the API process, request handling. If a worker
+    dies and breaks the pool, the polls it fails count as failed and a
+    fresh pool replaces it for every adapter.
+
+    Changed results are queued on a write-behind buffer that stores them
+    in batches as the fetches complete; the cycle waits for its batches
+    before extending unchanged runs and scheduling. Incidents reported by
+    every service polled in a cycle are written together once the fetches
+    finish, skipping those that did not change.
+
+    Hosts that keep failing are skipped by a per-host circuit breaker
+    until a probe succeeds; their services are marked UNKNOWN rather than
+    each waiting out a timeout.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        session_factory: async_sessionmaker[AsyncSession],
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the poller.
+
+        Args:
+            settings: Application settings with polling configuration.
+            session_factory: Factory for database sessions.
+            client: Optional HTTP client; one is created if not provided.
+        """
+        self.settings = settings
+        self.session_factory = session_factory
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.status_poll_timeout_seconds),
+            limits=httpx.Limits(max_connections=settings.status_poll_concurrency),
+            follow_redirects=True,
+        )
+        self._owns_client = client is None
+        self.parse_pool = self._create_parse_pool()
+        self.ingestor = StatusIngestor(session_factory, settings.status_history_mode)
+        self.writes = StatusWriteBuffer(self.ingestor, settings, on_failure=self._forget_writes)
+        self.incidents = IncidentIngestor(session_factory)
+        self._providers: dict[str, StatusProvider] = {}
+        self.circuits = CircuitBreaker(
+            failure_threshold=settings.status_poll_circuit_failure_threshold,
+            backoff=settings.status_poll_circuit_backoff_seconds,
+            max_backoff=settings.status_poll_circuit_max_backoff_seconds,
+        )
+        self.budget = PollBudget(settings.status_poll_budget_per_minute)
+        self._task: asyncio.Task[None] | None = None
+        self.last_cycle: CycleStats | None = None
+
+    def _create_parse_pool(self) -> ProcessPoolExecutor | None:
+        """Create the decoding pool, or None to decode on the event loop."""
+        if self.settings.status_parse_workers <= 0:
+            return None
+        # Worker processes start on first use; spawned, as forking a running loop is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.settings.status_parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace_parse_pool(self, broken: ProcessPoolExecutor | None) -> None:
+        """Swap a broken decoding pool for a new one in the poller and every adapter.
+
+        Polls failing on the same broken pool all call this; only the
+        first replaces it.
+        """
+        if broken is None or self.parse_pool is not broken:
+            return
+        logger.warning("Status parse pool is broken; starting a new one")
+        self.parse_pool = self._create_parse_pool()
+        for provider in self._providers.values():
+            provider.executor = self.parse_pool
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def tick(self) -> float:
+        """Seconds between the start of consecutive poll cycles."""
+        return self.settings.status_poll_tick_seconds
+
+    async def start(self) -> None:
+        """Start polling in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="status-poller")
+
+    async def stop(self) -> None:
+        """Stop the background task, write queued results, then release resources."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.writes.stop()
+        if self._owns_client:
+            await self.client.aclose()
+        if self.parse_pool is not None:
+            await asyncio.to_thread(self.parse_pool.shutdown, cancel_futures=True)
+
+    async def _run(self) -> None:
+        """Run a poll cycle every tick until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            try:
+                await self.run_cycle()
+            except Exception:
+                logger.exception("Status poll cycle failed")
+            elapsed = loop.time() - started
+            await asyncio.sleep(max(0.0, self.tick - elapsed))
+
+    async def run_cycle(self, now: datetime | None = None) -> CycleStats:
+        """Poll the active services that are due, within the budget.
+
+        Args:
+            now: Time the services are due by; defaults to the current time.
+
+        Returns:
+            Statistics describing the completed cycle.
+        """
+        started_at = now or utcnow()
+        start = time.perf_counter()
+        services = await self._claim_due_services(started_at, int(self.budget.capacity))
+        self._forget_stale(services)
+        renewal = asyncio.create_task(
+            self._renew_claims([service.id for service in services], started_at),
+            name="status-poll-claim-renewal",
+        )
+        try:
+            urgent = await self._load_open_incident_services([service.id for service in services])
+
+            concurrency = asyncio.Semaphore(self.settings.status_poll_concurrency)
+            host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+                lambda: asyncio.Semaphore(self.settings.status_poll_per_host_limit)
+            )
+            reported: list[tuple[Service, IncidentReport]] = []
+            polls = await asyncio.gather(
+                *(
+                    self._poll_service(service, concurrency, host_limits, reported)
+                    for service in services
+                )
+            )
+            # Unchanged runs can only be extended once the records they follow exist
+            await self.writes.drain()
+            outcomes = [outcome for outcome, _ in polls]
+            unchanged = [
+                service.id
+                for service, outcome in zip(services, outcomes, strict=True)
+                if outcome == PollOutcome.UNCHANGED
+            ]
+            try:
+                await self.ingestor.touch(unchanged, utcnow())
+            except SQLAlchemyError:
+                logger.exception("Failed to extend status runs for unchanged services")
+            await self._ingest_incidents(reported, started_at)
+        finally:
+            renewal.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewal
+        # Skipped fetches give their budget back to whichever poller claims next
+        await self._refund_budget(outcomes.count(PollOutcome.CIRCUIT_OPEN))
+        urgent.update(
+            service.id
+            for service, incident in reported
+            if incident.status not in CLOSED_INCIDENT_STATUSES
+        )
+        await self._schedule(services, polls, urgent, started_at)
+
+        stats = CycleStats(
+            started_at=started_at,
+            duration_seconds=time.perf_counter() - start,
+            services=len(services),
+            succeeded=outcomes.count(PollOutcome.STORED) + outcomes.count(PollOutcome.UNCHANGED),
+            unchanged=outcomes.count(PollOutcome.UNCHANGED),
+            failed=outcomes.count(PollOutcome.FAILED),
+            circuit_open=outcomes.count(PollOutcome.CIRCUIT_OPEN),
+        )
+        self.last_cycle = stats
+        logger.info(
+            "Poll cycle finished: %d services (%d ok, %d unchanged, %d failed, "
+            "%d circuit open) in %.2fs",
+            stats.services,
+            stats.succeeded,
+            stats.unchanged,
+            stats.failed,
+            stats.circuit_open,
+            stats.duration_seconds,
+        )
+        if stats.duration_seconds > self.settings.status_poll_min_interval_seconds:
+            logger.warning(
+                "Poll cycle took %.2fs, longer than the %ds minimum interval",
+                stats.duration_seconds,
+                self.settings.status_poll_min_interval_seconds,
+            )
+        return stats
+
+    async def _claim_due_services(self, now: datetime, limit: int) -> list[Service]:
+        """Claim up to ``limit`` due active services, most overdue first.
+
+        Services never polled have no ``next_poll_at`` and come first.
+        Claiming moves ``next_poll_at`` a lease ahead in the same
+        transaction, and rows another poller is claiming are skipped
+        rather than waited for, so concurrent pollers never claim the same
+        service. The lease is replaced by the real schedule once the poll
+        finishes; if this poller dies first, the service falls due again
+        when the lease expires. Relationships are not loaded.
+
+        No more services are claimed than the shared budget has tokens
+        for, and one token is taken per claimed service. The budget row is
+        locked for the transaction, so concurrent pollers take turns
+        drawing from it rather than each spending the whole budget.
+        """
+        claimed_until = now + timedelta(seconds=self.settings.status_poll_claim_seconds)
+        async with self.session_factory() as session, session.begin():
+            tokens, refilled_at = await self._lock_budget(session, now)
+            tokens = self.budget.refill(tokens, (now - refilled_at).total_seconds())
+            services: list[Service] = []
+            if min(limit, int(tokens)) > 0:
+                result = await session.scalars(
+                    select(Service)
+                    .where(
+                        Service.is_active.is_(True),
+                        Service.next_poll_at.is_(None) | (Service.next_poll_at <= now),
+                    )
+                    .order_by(Service.next_poll_at.asc().nulls_first())
+                    .limit(min(limit, int(tokens)))
+                    .with_for_update(skip_locked=True)
+                    .options(raiseload("*"))
+                )
+                services = list(result.all())
+            if services:
+                await session.execute(
+                    update(Service)
+                    .where(Service.id.in_([service.id for service in services]))
+                    .values(next_poll_at=claimed_until)
+                )
+            await session.execute(
+                update(PollBudgetBucket)
+                .where(PollBudgetBucket.name == BUDGET_BUCKET)
+                .values(tokens=tokens - len(services), refilled_at=max(refilled_at, now))
+            )
+            # Detach before commit so the claimed rows stay readable
+            session.expunge_all()
+        return services
+
+    async def _lock_budget(self, session: AsyncSession, now: datetime) -> tuple[float, datetime]:
+        """Lock the shared budget row, creating it full if missing.
+
+        Returns:
+            The tokens it holds and when they were last refilled.
+        """
+        stmt = upsert(session.get_bind().dialect.name, PollBudgetBucket)
+        await session.execute(
+            stmt.values(
+                id=uuid7(), name=BUDGET_BUCKET, tokens=self.budget.capacity, refilled_at=now
+            ).on_conflict_do_nothing(index_elements=["name"])
+        )
+        row = (
+            await session.execute(
+                select(PollBudgetBucket.tokens, PollBudgetBucket.refilled_at)
+                .where(PollBudgetBucket.name == BUDGET_BUCKET)
+                .with_for_update()
+            )
+        ).one()
+        return row.tokens, row.refilled_at
+
+    async def _refund_budget(self, fetches: int) -> None:
+        """Return tokens for claimed services that were not fetched."""
+        if not fetches:
+            return
+        try:
+            async with self.session_factory() as session, session.begin():
+                await session.execute(
+                    update(PollBudgetBucket)
+                    .where(PollBudgetBucket.name == BUDGET_BUCKET)
+                    .values(tokens=PollBudgetBucket.tokens + fetches)
+                )
+        except SQLAlchemyError:
+            logger.exception("Failed to return %d fetches to the poll budget", fetches)
+
+    async def _renew_claims(self, service_ids: list[uuid.UUID], claimed_at: datetime) -> None:
+        """Keep extending the lease on claimed services until cancelled.
+
+        Every third of ``status_poll_claim_seconds`` the lease is moved a
+        full lease past the time elapsed since the claim. Only services
+        still holding this poller's lease are extended; one that expired
+        and was claimed elsewhere in the meantime is left alone.
+        """
+        if not service_ids:
+            return
+        lease = self.settings.status_poll_claim_seconds
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        claimed_until = claimed_at + timedelta(seconds=lease)
+        while True:
+            await asyncio.sleep(lease / 3)
+            renewed_until = claimed_at + timedelta(seconds=loop.time() - started + lease)
+            try:
+                async with self.session_factory() as session, session.begin():
+                    await session.execute(
+                        update(Service)
+                        .where(
+                            Service.id.in_(service_ids),
+                            Service.next_poll_at == claimed_until,
+                        )
+                        .values(next_poll_at=renewed_until)
+                    )
+            except SQLAlchemyError:
+                logger.exception("Failed to renew the claim on %d services", len(service_ids))
+                continue
+            claimed_until = renewed_until
+
+    async def _load_open_incident_services(self, service_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        """Ids among ``service_ids`` with at least one unresolved incident."""
+        if not service_ids:
+            return set()
+        async with self.session_factory() as session:
+            result = await session.scalars(
+                select(Incident.service_id)
+                .where(
+                    Incident.service_id.in_(service_ids),
+                    Incident.status.not_in(CLOSED_INCIDENT_STATUSES),
+                )
+                .distinct()
+            )
+            return set(result.all())
+
+    async def _ingest_incidents(
+        self, reported: list[tuple[Service, IncidentReport]], seen_at: datetime
+    ) -> None:
+        """Write the incidents reported during a cycle in one batch.
+
+        If the write fails, the reporting services' adapters forget their
+        last fetch, so the incidents are reported again on the next poll.
+        """
+        if not reported:
+            return
+        try:
+            await self.incidents.ingest(
+                ((service.id, incident) for service, incident in reported), seen_at
+            )
+        except SQLAlchemyError:
+            logger.exception("Failed to store %d reported incidents", len(reported))
+            for service in {service.id: service for service, _ in reported}.values():
+                if provider := self._get_provider(service.provider):
+                    provider.forget(service.id)
+
+    async def _schedule(
+        self,
+        services: list[Service],
+        polls: list[tuple[PollOutcome, ServiceStatus | None]],
+        urgent: set[uuid.UUID],
+        now: datetime,
+    ) -> None:
+        """Store when each polled service is next due.
+
+        Intervals are measured from the cycle's due time rather than from
+        when each fetch finished, so a service's cadence does not drift.
+        """
+        schedule = []
+        for service, (outcome, status) in zip(services, polls, strict=True):
+            interval = next_poll_interval(
+                self.settings,
+                service.poll_interval_seconds,
+                urgent=service.id in urgent or status in URGENT_STATUSES,
+                changed=outcome in (PollOutcome.STORED, PollOutcome.FAILED),
+            )
+            schedule.append(
+                {
+                    "id": service.id,
+                    "next_poll_at": now + timedelta(seconds=interval),
+                    "poll_interval_seconds": round(interval),
+                }
+            )
+        if not schedule:
+            return
+        try:
+            async with self.session_factory() as session, session.begin():
+                await session.execute(update(Service), schedule)
+        except SQLAlchemyError:
+            logger.exception("Failed to schedule the next poll of %d services", len(schedule))
+
+    def start_offset(self, service: Service) -> float:
+        """Stable delay before a service is polled within a cycle.
+
+        Derived from the service id so each service keeps the same phase
+        from one cycle to the next while due services are spread evenly.
+        """
+        window = self.tick * self.settings.status_poll_jitter_ratio
+        return (service.id.int % 10_000) / 10_000 * window
+
+    def _get_provider(self, name: str) -> StatusProvider | None:
+        """Return the shared adapter instance for a provider name."""
+        provider = self._providers.get(name)
+        if provider is None:
+            provider_class = get_provider_class(name)
+            if provider_class is None:
+                return None
+            provider = self._providers[name] = provider_class(self.client, self.parse_pool)
+        return provider
+
+    async def _poll_service(
+        self,
+        service: Service,
+        concurrency: asyncio.Semaphore,
+        host_limits: defaultdict[str, asyncio.Semaphore],
+        reported: list[tuple[Service, IncidentReport]],
+    ) -> tuple[PollOutcome, ServiceStatus | None]:
+        """Fetch the status of one service and queue it for storage.
+
+        Incidents from a queued result are appended to ``reported``, to be
+        written with those of the rest of the cycle.
+
+        Returns:
+            Whether a new status was queued, the page was unchanged, the
+            poll failed, or the host's circuit was open, together with the
+            service's status afterwards.
+        """
+        provider = self._get_provider(service.provider)
+        if provider is None:
+            logger.warning("No provider adapter registered for %r", service.provider)
+            return PollOutcome.FAILED, service.current_status
+
+        await asyncio.sleep(self.start_offset(service))
+        host = urlsplit(service.status_url).hostname or ""
+        # Wait for the host slot first so a busy host never holds a global slot idle
+        async with host_limits[host]:
+            try:
+                self.circuits.before_request(host)
+            except CircuitOpenError:
+                result = None
+            else:
+                async with concurrency:
+                    checked_at = utcnow()
+                    started = time.perf_counter()
+                    parse_pool = self.parse_pool
+                    try:
+                        result = await provider.fetch_status(service)
+                    except BrokenExecutor as exc:
+                        # A decoding worker died; not the host's fault, so its circuit is spared
+                        POLL_FETCH_DURATION.labels(service.provider, "error").observe(
+                            time.perf_counter() - started
+                        )
+                        logger.warning("Failed to decode %s: %s", service.name, exc)
+                        self._replace_parse_pool(parse_pool)
+                        provider.forget(service.id)
+                        return PollOutcome.FAILED, service.current_status
+                    except (ProviderError, httpx.HTTPError) as exc:
+                        self.circuits.record_failure(host)
+                        POLL_FETCH_DURATION.labels(service.provider, "error").observe(
+                            time.perf_counter() - started
+                        )
+                        logger.warning("Failed to poll %s: %s", service.name, exc)
+                        return PollOutcome.FAILED, service.current_status
+                    self.circuits.record_success(host)
+                    POLL_FETCH_DURATION.labels(
+                        service.provider, "changed" if result.changed else "unchanged"
+                    ).observe(time.perf_counter() - started)
+
+        if result is None:
+            return await self._mark_unknown(service, provider), ServiceStatus.UNKNOWN
+        if not result.changed:
+            return PollOutcome.UNCHANGED, service.current_status
+        await self.writes.put(service.id, result, checked_at)
+        reported.extend((service, incident) for incident in result.incidents)
+        return PollOutcome.STORED, result.status
+
+    def _forget_writes(self, writes: Sequence[StatusWrite]) -> None:
+        """Have services whose results were not stored report them again.
+
+        Every adapter forgets the services' last fetch, so their next poll
+        reports the page as changed and it is stored then.
+        """
+        self._forget_fetches([write.service_id for write in writes])
+
+    def _forget_fetches(self, service_ids: list[uuid.UUID]) -> None:
+        """Drop what every adapter remembers about the services' last fetch."""
+        for provider in self._providers.values():
+            for service_id in service_ids:
+                provider.forget(service_id)
+
+    def _forget_stale(self, services: list[Service]) -> None:
+        """Drop cached state of claimed services another poller wrote since.
+
+        Open runs, validators, feed cursors, incident digests and the last
+        observation uptime is counted from only hold while this poller
+        made the service's latest write, which the ``last_checked_at`` read
+        with the claim tells. Otherwise they are reloaded, refetched or
+        resumed from the claimed row, so the next write follows what the
+        other poller stored rather than extending a run it already closed.
+        """
+        stale = [
+            service
+            for service in services
+            if not self.ingestor.wrote_last(service.id, service.last_checked_at)
+        ]
+        if stale:
+            stale_ids = [service.id for service in stale]
+            self.ingestor.resync(stale)
+            self.incidents.forget(stale_ids)
+            self._forget_fetches(stale_ids)
+
+    async def _mark_unknown(self, service: Service, provider: StatusProvider) -> PollOutcome:
+        """Record UNKNOWN for a service whose host circuit is open.
+
+        Nothing is written if the service is already UNKNOWN. The adapter
+        forgets the service's last fetch, so the first fetch after the
+        circuit closes stores the real status even if the page is unchanged.
+        """
+        if service.current_status == ServiceStatus.UNKNOWN:
+            return PollOutcome.CIRCUIT_OPEN
+        provider.forget(service.id)
+        await self.writes.put(service.id, ProviderResult(status=ServiceStatus.UNKNOWN), utcnow())
+        return PollOutcome.CIRCUIT_OPEN
@@ -0,0 +1,309 @@
+"""Incrementally maintained uptime rollups and window queries over them."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import uuid  # noqa: TC003
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel
+from sqlalchemy import delete, func, select
+
+from src.core.clock import utcnow
+from src.core.database import upsert
+from src.core.ids import uuid7
+from src.models import DailyStatusRollup, HourlyStatusRollup, Service, ServiceStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.core.config import Settings
+    from src.services.ingest import StatusUpdate
+
+logger = logging.getLogger(__name__)
+
+UptimeWindow = Literal["24h", "7d", "30d", "90d"]
+
+WINDOWS: dict[str, timedelta] = {
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "90d": timedelta(days=90),
+}
+
+RollupModel = type[HourlyStatusRollup] | type[DailyStatusRollup]
+
+BUCKETS: tuple[tuple[RollupModel, timedelta], ...] = (
+    (HourlyStatusRollup, timedelta(hours=1)),
+    (DailyStatusRollup, timedelta(days=1)),
+)
+
+# Statuses that count as neither up nor down when computing uptime
+EXCLUDED_FROM_UPTIME = frozenset({ServiceStatus.MAINTENANCE, ServiceStatus.UNKNOWN})
+
+
+def floor_to_bucket(moment: datetime, size: timedelta) -> datetime:
+    """Round a timestamp down to the start of its bucket."""
+    return datetime.min + ((moment - datetime.min) // size) * size
+
+
+def split_by_bucket(
+    start: datetime,
+    end: datetime,
+    size: timedelta,
+) -> Iterator[tuple[datetime, float]]:
+    """Split ``[start, end)`` into per-bucket durations.
+
+    Yields:
+        Bucket start and the seconds of the interval that fall inside it.
+    """
+    bucket = floor_to_bucket(start, size)
+    while bucket < end:
+        next_bucket = bucket + size
+        seconds = (min(end, next_bucket) - max(start, bucket)).total_seconds()
+        if seconds > 0:
+            yield bucket, seconds
+        bucket = next_bucket
+
+
+class UptimeAggregator:
+    """Folds status updates into hourly and daily rollups.
+
+    Registered as a ``StatusIngestor`` listener, it attributes the time
+    between two consecutive observations of a service to the status held
+    during that time and accumulates the seconds per bucket in memory.
+    A background task periodically flushes them with additive upserts, so
+    rollups stay correct when several workers each contribute the
+    services they poll. Registered as a resync listener too, it resumes a
+    service another worker polled since from the observation that worker
+    stored, so each span is counted once, by the worker that closed it.
+    Gaps longer than ``max_gap`` (the poller was not running) are only
+    counted up to ``max_gap``, which is never shorter than the longest a
+    healthy poller can leave between two polls of a quiet service: the
+    maximum interval plus a claim lease.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: Settings,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            session_factory: Factory for database sessions.
+            settings: Application settings with rollup configuration.
+        """
+        self.session_factory = session_factory
+        self.settings = settings
+        self.max_gap = timedelta(
+            seconds=max(
+                settings.uptime_max_gap_seconds,
+                settings.status_poll_max_interval_seconds + settings.status_poll_claim_seconds,
+            )
+        )
+        self._last_seen: dict[uuid.UUID, tuple[datetime, ServiceStatus]] = {}
+        self._pending: defaultdict[tuple[RollupModel, uuid.UUID, datetime, ServiceStatus], float]
+        self._pending = defaultdict(float)
+        self._last_purge: datetime | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Seed the last observations and start periodic flushing."""
+        try:
+            await self.prime()
+        except Exception:
+            logger.exception("Failed to seed uptime aggregator; starting empty")
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="uptime-aggregator")
+
+    async def stop(self) -> None:
+        """Stop the background task and flush what is pending."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def prime(self) -> None:
+        """Resume from each service's last projected observation."""
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                select(Service.id, Service.current_status, Service.last_checked_at)
+            )
+            for service_id, status, checked_at in rows:
+                if status is not None and checked_at is not None:
+                    self._last_seen.setdefault(service_id, (checked_at, ServiceStatus(status)))
+
+    def resync(self, observed: Sequence[StatusUpdate]) -> None:
+        """Resume services from the last observation stored for them."""
+        for update in observed:
+            if update.status is None:
+                self._last_seen.pop(update.service_id, None)
+            else:
+                self._last_seen[update.service_id] = (update.checked_at, update.status)
+
+    def apply(self, updates: Sequence[StatusUpdate]) -> None:
+        """Accumulate the time covered by new observations."""
+        for update in updates:
+            previous = self._last_seen.get(update.service_id)
+            status = update.status or (previous[1] if previous else None)
+            if previous is not None:
+                since, held = previous
+                if update.checked_at <= since:
+                    continue
+                self._accumulate(
+                    update.service_id,
+                    held,
+                    since,
+                    min(update.checked_at, since + self.max_gap),
+                )
+            if status is not None:
+                self._last_seen[update.service_id] = (update.checked_at, status)
+
+    def _accumulate(
+        self,
+        service_id: uuid.UUID,
+        status: ServiceStatus,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Add an interval to the pending rollup increments."""
+        for model, size in BUCKETS:
+            for bucket, seconds in split_by_bucket(start, end, size):
+                self._pending[model, service_id, bucket, status] += seconds
+
+    async def flush(self) -> None:
+        """Write pending increments with one upsert per rollup table."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, defaultdict(float)
+        try:
+            async with self.session_factory() as session:
+                dialect = session.get_bind().dialect.name
+                for model, _ in BUCKETS:
+                    rows = [
+                        {
+                            "id": uuid7(),
+                            "service_id": service_id,
+                            "bucket_start": bucket,
+                            "status": status,
+                            "seconds": seconds,
+                        }
+                        for (row_model, service_id, bucket, status), seconds in pending.items()
+                        if row_model is model
+                    ]
+                    if not rows:
+                        continue
+                    stmt = upsert(dialect, model)
+                    await session.execute(
+                        stmt.values(rows).on_conflict_do_update(
+                            index_elements=["service_id", "bucket_start", "status"],
+                            set_={"seconds": model.seconds + stmt.excluded.seconds},
+                        )
+                    )
+                await session.commit()
+        except Exception:
+            # Keep the increments for the next attempt
+            for key, seconds in pending.items():
+                self._pending[key] += seconds
+            raise
+
+    async def purge(self) -> None:
+        """Delete hourly rollups older than their retention period."""
+        cutoff = utcnow() - timedelta(days=self.settings.uptime_hourly_retention_days)
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(HourlyStatusRollup).where(HourlyStatusRollup.bucket_start < cutoff)
+            )
+            await session.commit()
+
+    async def _run(self) -> None:
+        """Flush periodically and purge expired hourly rows once an hour."""
+        while True:
+            await asyncio.sleep(self.settings.uptime_rollup_flush_seconds)
+            try:
+                await self.flush()
+                now = utcnow()
+                if self._last_purge is None or now - self._last_purge >= timedelta(hours=1):
+                    await self.purge()
+                    self._last_purge = now
+            except Exception:
+                logger.exception("Failed to flush uptime rollups")
+
+
+@dataclass(frozen=True, slots=True)
+class UptimeSummary:
+    """Time spent in each status over a window, read from rollups."""
+
+    window: UptimeWindow
+    since: datetime
+    until: datetime
+    seconds: dict[ServiceStatus, float]
+
+    @property
+    def uptime_ratio(self) -> float | None:
+        """Share of counted time spent operational, or None without data.
+
+        Maintenance and unknown time count neither for nor against uptime.
+        """
+        counted = sum(s for status, s in self.seconds.items() if status not in EXCLUDED_FROM_UPTIME)
+        if counted <= 0:
+            return None
+        return self.seconds.get(ServiceStatus.OPERATIONAL, 0.0) / counted
+
+
+class UptimeReport(BaseModel):
+    """Public view of a service's uptime over a window."""
+
+    service_id: uuid.UUID
+    window: UptimeWindow
+    since: datetime
+    until: datetime
+    uptime_ratio: float | None
+    seconds: dict[ServiceStatus, float]
+
+
+async def load_uptime(
+    session: AsyncSession,
+    service_id: uuid.UUID,
+    window: UptimeWindow,
+    now: datetime | None = None,
+) -> UptimeSummary:
+    """Sum the rollup rows covering a window.
+
+    Windows up to 7 days read hourly rollups (at most 168 buckets per
+    status); longer windows read daily rollups.
+
+    Args:
+        session: Database session.
+        service_id: Service to report on.
+        window: One of the supported window names.
+        now: End of the window; defaults to the current time.
+
+    Returns:
+        Seconds per status and the derived uptime ratio.
+    """
+    until = now or utcnow()
+    length = WINDOWS[window]
+    model, size = BUCKETS[0] if length <= timedelta(days=7) else BUCKETS[1]
+    since = floor_to_bucket(until - length, size)
+    rows = await session.execute(
+        select(model.status, func.sum(model.seconds))
+        .where(model.service_id == service_id, model.bucket_start >= since)
+        .group_by(model.status)
+    )
+    return UptimeSummary(
+        window=window,
+        since=since,
+        until=until,
+        seconds={ServiceStatus(status): float(total) for status, total in rows},
+    )
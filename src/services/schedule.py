@@ -0,0 +1,84 @@
+"""Adaptive per-service poll scheduling."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.models import IncidentStatus, ServiceStatus
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+# Statuses polled at the fast cadence; UNKNOWN is excluded because it
+# usually means the page cannot be reached, which polling faster won't fix
+URGENT_STATUSES = frozenset(
+    {
+        ServiceStatus.DEGRADED,
+        ServiceStatus.PARTIAL_OUTAGE,
+        ServiceStatus.MAJOR_OUTAGE,
+        ServiceStatus.MAINTENANCE,
+    }
+)
+
+# Incidents in these statuses no longer make their service urgent
+CLOSED_INCIDENT_STATUSES = (IncidentStatus.RESOLVED, IncidentStatus.POSTMORTEM)
+
+
+def next_poll_interval(
+    settings: Settings,
+    previous: float | None,
+    *,
+    urgent: bool,
+    changed: bool,
+) -> float:
+    """Seconds until a service should be polled again.
+
+    Urgent services (an open incident or a non-operational status) are
+    polled every ``status_poll_min_interval_seconds``. A page that changed
+    resets a service to the base ``status_poll_interval_seconds``; each
+    unchanged poll of a quiet service stretches its interval by
+    ``status_poll_backoff_factor``, up to ``status_poll_max_interval_seconds``.
+
+    Args:
+        settings: Application settings with polling configuration.
+        previous: The service's current interval, if it has one.
+        urgent: Whether the service has an open incident or is not operational.
+        changed: Whether the last poll found a new page or failed.
+
+    Returns:
+        The service's next interval in seconds.
+    """
+    if urgent:
+        return float(settings.status_poll_min_interval_seconds)
+    base = float(settings.status_poll_interval_seconds)
+    if previous is None or changed:
+        return base
+    return min(
+        max(previous, base) * settings.status_poll_backoff_factor,
+        float(settings.status_poll_max_interval_seconds),
+    )
+
+
+class PollBudget:
+    """Token bucket capping upstream fetches per minute.
+
+    Holds at most one minute's worth of fetches and refills continuously,
+    so the long-run rate never exceeds the budget whatever the intervals
+    of individual services add up to. Services due beyond the budget stay
+    due and are polled first once tokens are available again. The tokens
+    themselves are stored in ``PollBudgetBucket`` so that every poller
+    draws from the same budget; this class only does the arithmetic.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        """Initialize the budget.
+
+        Args:
+            per_minute: Fetches allowed per minute.
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+
+    def refill(self, tokens: float, elapsed_seconds: float) -> float:
+        """Tokens after refilling for ``elapsed_seconds``, capped at capacity."""
+        return min(self.capacity, tokens + max(0.0, elapsed_seconds) * self.rate)
@@ -0,0 +1,214 @@
+"""In-memory snapshot of every active service and its current status."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import uuid
+from dataclasses import dataclass
+from datetime import datetime  # noqa: TC003
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from src.models import Service, ServiceStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.services.ingest import StatusUpdate
+
+
+class ServiceSnapshot(BaseModel):
+    """Public view of a service and its latest known status."""
+
+    id: uuid.UUID
+    name: str
+    provider: str
+    status_url: str
+    status: ServiceStatus | None
+    last_checked_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedEntity:
+    """A pre-serialized JSON body together with its weak ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes, validator: bytes) -> RenderedEntity:
+        """Build an entity whose ETag is derived from ``validator``.
+
+        ``validator`` is the content that a client's copy must match, which
+        leaves out ``last_checked_at``: every poll moves it, so tagging it
+        would defeat ``304`` for pages that did not change. The body may
+        differ under the same tag, so the tag is weak. Content-derived tags
+        stay identical across workers that hold the same data, unlike a
+        per-process version counter.
+        """
+        return cls(body, f'W/"{hashlib.blake2b(validator, digest_size=16).hexdigest()}"')
+
+
+_Entries = dict[uuid.UUID, tuple[ServiceSnapshot, RenderedEntity]]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusSnapshot:
+    """An immutable, rendered version of the cache contents."""
+
+    version: int
+    services: RenderedEntity
+    by_id: dict[uuid.UUID, RenderedEntity]
+    providers: dict[uuid.UUID, str]
+
+
+class StatusSnapshotCache:
+    """Versioned snapshot of current service statuses served without the DB.
+
+    The snapshot is loaded from ``service`` once, then kept current by
+    applying ``StatusUpdate`` events from the ingest path. Each service's
+    JSON is rendered when it changes, so producing a new version after an
+    update only joins the pre-rendered entries. ``invalidate`` forces a
+    full reload on the next read, for changes the ingest path does not
+    see (services added or deactivated).
+
+    Updates applied while a load is running are buffered and replayed onto
+    what it read, in order, so a steady stream of updates never keeps the
+    load from completing. Only an ``invalidate`` during the load repeats it.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            session_factory: Factory for database sessions used on reload.
+        """
+        self.session_factory = session_factory
+        self._entries: _Entries | None = None
+        self._snapshot: StatusSnapshot | None = None
+        self._version = 0
+        self._invalidations = 0
+        # Updates applied while a load runs, replayed onto its result; None when idle
+        self._pending: list[StatusUpdate] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented by every change to the contents."""
+        return self._version
+
+    def invalidate(self) -> None:
+        """Discard the contents so the next read reloads from the database."""
+        self._entries = None
+        self._snapshot = None
+        self._version += 1
+        self._invalidations += 1
+
+    def apply(self, updates: Sequence[StatusUpdate]) -> None:
+        """Fold committed status updates into the cache.
+
+        Suitable as a ``StatusIngestor`` listener. An update for a service
+        the cache does not know triggers a full reload on the next read.
+        """
+        self._version += 1
+        if self._entries is None:
+            if self._pending is not None:
+                self._pending.extend(updates)
+            return
+        if not _fold(self._entries, updates):
+            self.invalidate()
+            return
+        self._snapshot = None
+
+    async def get(self) -> StatusSnapshot:
+        """Return the current snapshot, loading or rendering it if needed."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            while self._entries is None:
+                invalidations = self._invalidations
+                self._pending = []
+                try:
+                    entries = await self._load()
+                finally:
+                    pending, self._pending = self._pending, None
+                # The set of services may have changed while loading; read it again
+                if invalidations != self._invalidations:
+                    continue
+                # Updates for services the load did not see are for inactive ones
+                _fold(entries, pending)
+                self._entries = entries
+            if self._snapshot is None:
+                self._snapshot = self._render(self._entries)
+            return self._snapshot
+
+    async def _load(self) -> _Entries:
+        """Read every active service's projection with a single query."""
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                select(
+                    Service.id,
+                    Service.name,
+                    Service.provider,
+                    Service.status_url,
+                    Service.current_status.label("status"),
+                    Service.last_checked_at,
+                )
+                .where(Service.is_active.is_(True))
+                .order_by(Service.name)
+            )
+            entries = {}
+            for row in rows.mappings():
+                snapshot = ServiceSnapshot.model_validate(row)
+                entries[snapshot.id] = (snapshot, _render_service(snapshot))
+            return entries
+
+    def _render(self, entries: _Entries) -> StatusSnapshot:
+        """Build an immutable snapshot from the pre-rendered entries."""
+        return StatusSnapshot(
+            version=self._version,
+            services=RenderedEntity.from_body(
+                b"[" + b",".join(entity.body for _, entity in entries.values()) + b"]",
+                ",".join(entity.etag for _, entity in entries.values()).encode(),
+            ),
+            by_id={service_id: entity for service_id, (_, entity) in entries.items()},
+            providers={
+                service_id: snapshot.provider for service_id, (snapshot, _) in entries.items()
+            },
+        )
+
+
+def _fold(entries: _Entries, updates: Sequence[StatusUpdate]) -> bool:
+    """Apply updates to the entries of the services they concern.
+
+    Returns:
+        False if some updates were for services missing from ``entries``.
+    """
+    known = True
+    for update in updates:
+        current = entries.get(update.service_id)
+        if current is None:
+            known = False
+            continue
+        snapshot = current[0].model_copy(
+            update={
+                "status": update.status or current[0].status,
+                "last_checked_at": update.checked_at,
+            }
+        )
+        entries[update.service_id] = (snapshot, _render_service(snapshot))
+    return known
+
+
+def _render_service(snapshot: ServiceSnapshot) -> RenderedEntity:
+    """Serialize a single service entry."""
+    return RenderedEntity.from_body(
+        snapshot.model_dump_json().encode(),
+        snapshot.model_dump_json(exclude={"last_checked_at"}).encode(),
+    )
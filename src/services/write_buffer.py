@@ -0,0 +1,145 @@
+"""Write-behind buffer batching changed poll results into shared transactions."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from src.core.metrics import STATUS_WRITE_QUEUE_DEPTH
+from src.services.ingest import StatusWrite
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable, Sequence
+    from datetime import datetime
+
+    from src.core.config import Settings
+    from src.providers import ProviderResult
+    from src.services.ingest import StatusIngestor
+
+logger = logging.getLogger(__name__)
+
+
+class _Marker(Enum):
+    """Queued after results to have the writer act once it reaches them."""
+
+    FLUSH = "flush"  # Write the current batch without waiting for it to fill
+    STOP = "stop"  # Write the current batch and exit
+
+
+class StatusWriteBuffer:
+    """Queues changed poll results and writes them in batches.
+
+    A background task takes results off a bounded queue and hands them to
+    ``StatusIngestor.record_many`` once ``status_write_batch_size`` have
+    been collected or ``status_write_flush_ms`` have passed since the
+    first, so a cycle polling thousands of services commits a handful of
+    multi-row transactions instead of one per service. When the queue is
+    full, ``put`` waits for the writer to catch up, which holds back the
+    fetches feeding it.
+
+    A batch that fails to write is dropped and passed to ``on_failure``;
+    the poller uses it to have the affected services stored on their next
+    poll. ``stop`` writes everything still queued before returning.
+    """
+
+    def __init__(
+        self,
+        ingestor: StatusIngestor,
+        settings: Settings,
+        on_failure: Callable[[Sequence[StatusWrite]], None] | None = None,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            ingestor: Ingestor writing the batches.
+            settings: Application settings with write buffer configuration.
+            on_failure: Called with the writes of a batch that could not be stored.
+        """
+        self.ingestor = ingestor
+        self.batch_size = max(1, settings.status_write_batch_size)
+        self.flush_interval = settings.status_write_flush_ms / 1000
+        self.on_failure = on_failure
+        self._queue: asyncio.Queue[StatusWrite | _Marker] = asyncio.Queue(
+            max(1, settings.status_write_queue_size)
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    async def put(
+        self, service_id: uuid.UUID, result: ProviderResult, checked_at: datetime
+    ) -> None:
+        """Queue a changed poll result, waiting while the queue is full.
+
+        The writer is started on first use.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="status-write-buffer")
+        await self._queue.put(StatusWrite(service_id, result, checked_at))
+        STATUS_WRITE_QUEUE_DEPTH.set(self._queue.qsize())
+
+    async def drain(self) -> None:
+        """Write everything queued so far without waiting for batches to fill."""
+        if self._task is None:
+            return
+        await self._queue.put(_Marker.FLUSH)
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        """Write what is still queued, then stop the writer."""
+        if self._task is None:
+            return
+        await self._queue.put(_Marker.STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Write batches until stopped."""
+        marker = None
+        while marker is not _Marker.STOP:
+            batch, marker = await self._next_batch()
+            try:
+                if batch:
+                    await self._write(batch)
+            finally:
+                for _ in range(len(batch) + (marker is not None)):
+                    self._queue.task_done()
+                STATUS_WRITE_QUEUE_DEPTH.set(self._queue.qsize())
+
+    async def _next_batch(self) -> tuple[list[StatusWrite], _Marker | None]:
+        """Wait for a result, then collect more until the batch is full or due.
+
+        Returns:
+            The batch, and the marker that ended it, if any.
+        """
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        if isinstance(first, _Marker):
+            return [], first
+        batch = [first]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    write = await asyncio.wait_for(self._queue.get(), remaining)
+                except TimeoutError:
+                    break
+            else:
+                write = self._queue.get_nowait()
+            if isinstance(write, _Marker):
+                return batch, write
+            batch.append(write)
+        return batch, None
+
+    async def _write(self, batch: list[StatusWrite]) -> None:
+        """Store a batch, reporting it to ``on_failure`` if that fails."""
+        try:
+            await self.ingestor.record_many(batch)
+        except Exception:
+            logger.exception("Failed to store a batch of %d poll results", len(batch))
+            if self.on_failure is not None:
+                self.on_failure(batch)
@@ -0,0 +1,96 @@
+"""Standalone status poller worker.
+
+Runs polling and ingest, with the rollups and notifications that follow
+them, without the HTTP app, so fetching and parsing never compete with
+API requests for the event loop. Run the API with
+``STATUS_POLLER_ENABLED=false`` next to one or more workers; API replicas
+learn about new statuses through the notification bus.
+
+Usage:
+    uv run python -m src.worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from prometheus_client import start_http_server
+
+from src.core.config import Settings, get_settings
+from src.core.database import create_engine, create_session_factory
+from src.core.metrics import instrument_engine
+from src.services.notify import StatusNotificationBus
+from src.services.partitions import PartitionMaintainer
+from src.services.poller import StatusPoller
+from src.services.rollups import UptimeAggregator
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(settings: Settings, stop: asyncio.Event) -> None:
+    """Poll and ingest statuses until ``stop`` is set.
+
+    Args:
+        settings: Application settings.
+        stop: Event that shuts the worker down once set.
+    """
+    engine = create_engine(settings)
+    session_factory = create_session_factory(engine)
+    if settings.metrics_enabled:
+        instrument_engine(engine)
+
+    partition_maintainer = PartitionMaintainer(engine, settings)
+    await partition_maintainer.start()
+
+    poller = StatusPoller(settings, session_factory)
+
+    # Tell API replicas about new statuses and incidents so their snapshots and streams stay current
+    notification_bus = StatusNotificationBus(settings)
+    poller.ingestor.add_listener(notification_bus.publish)
+    poller.incidents.add_listener(notification_bus.publish_incidents)
+    if settings.status_notify_enabled and engine.dialect.name == "postgresql":
+        await notification_bus.start()
+
+    uptime_aggregator = UptimeAggregator(session_factory, settings)
+    poller.ingestor.add_listener(uptime_aggregator.apply)
+    poller.ingestor.add_resync_listener(uptime_aggregator.resync)
+    await uptime_aggregator.start()
+
+    await poller.start()
+    logger.info("Status worker started")
+    try:
+        await stop.wait()
+    finally:
+        logger.info("Status worker stopping")
+        # Writes the poll results still buffered, so their listeners see them before stopping
+        await poller.stop()
+        await uptime_aggregator.stop()
+        await notification_bus.stop()
+        await partition_maintainer.stop()
+        await engine.dispose()
+
+
+async def _serve() -> None:
+    """Run the worker until SIGINT or SIGTERM."""
+    settings = get_settings()
+    if settings.metrics_enabled:
+        start_http_server(settings.worker_metrics_port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    await run_worker(settings, stop)
+
+
+def main() -> None:
+    """Worker entry point."""
+    logging.basicConfig(
+        level=logging.DEBUG if get_settings().debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
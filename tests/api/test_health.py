@@ -13,3 +13,24 @@ async def test_health_check(client: AsyncClient) -> None:
     data = response.json()
     assert data["status"] == "healthy"
     assert data["version"] == __version__
+
+
+async def test_readiness_reports_cached_verdict(client: AsyncClient, health_monitor) -> None:
+    """Readiness returns the monitor's verdict and its age without querying."""
+    await health_monitor.check()
+
+    response = await client.get("/api/v1/health/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["database"] == "connected"
+    assert data["checked_at"] is not None
+    assert data["age_seconds"] >= 0
+
+
+async def test_readiness_is_unhealthy_before_first_check(client: AsyncClient) -> None:
+    """Without a verdict the API does not claim to be ready."""
+    response = await client.get("/api/v1/health/ready")
+
+    assert response.json()["status"] == "unhealthy"
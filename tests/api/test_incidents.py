@@ -0,0 +1,52 @@
+"""Tests for incident endpoints."""
+
+from datetime import datetime
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Incident, IncidentImpact, IncidentStatus
+
+
+async def test_list_incidents_follows_cursor(
+    client: AsyncClient,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """The next_cursor of one page fetches the following page."""
+    service = await service_factory()
+    for n in range(3):
+        db_session.add(
+            Incident(
+                service_id=service.id,
+                external_id=f"inc-{n}",
+                title=f"Incident {n}",
+                status=IncidentStatus.INVESTIGATING,
+                impact=IncidentImpact.MINOR,
+                created_at=datetime(2026, 1, 1, n),
+            )
+        )
+    await db_session.commit()
+
+    first = (
+        await client.get("/api/v1/incidents", params={"status": "investigating", "limit": 2})
+    ).json()
+    second = (
+        await client.get(
+            "/api/v1/incidents",
+            params={"status": "investigating", "limit": 2, "cursor": first["next_cursor"]},
+        )
+    ).json()
+
+    assert len(first["items"]) == 2
+    assert len(second["items"]) == 1
+    assert second["next_cursor"] is None
+
+
+async def test_list_incidents_rejects_invalid_cursor(client: AsyncClient) -> None:
+    """A malformed cursor is a client error."""
+    response = await client.get(
+        "/api/v1/incidents", params={"status": "resolved", "cursor": "garbage"}
+    )
+
+    assert response.status_code == 400
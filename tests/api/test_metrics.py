@@ -0,0 +1,44 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+async def test_metrics_endpoint_serves_prometheus_text(client: AsyncClient) -> None:
+    """The scrape endpoint returns the text exposition format."""
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "status_beacon_http_request_duration_seconds" in response.text
+
+
+async def test_requests_are_labelled_by_route_template(
+    client: AsyncClient, service_factory
+) -> None:
+    """Latency is recorded once per route template, not per URL."""
+    service = await service_factory()
+    name = "status_beacon_http_request_duration_seconds_count"
+    labels = {"method": "GET", "route": "/services/{service_id}/history", "status": "200"}
+    before = _sample(name, **labels)
+
+    await client.get(f"/api/v1/services/{service.id}/history")
+    await client.get(f"/api/v1/services/{service.id}/history")
+
+    assert _sample(name, **labels) - before == 2
+
+
+async def test_unmatched_paths_share_one_series(client: AsyncClient) -> None:
+    """Requests for unknown paths do not create a series per path."""
+    name = "status_beacon_http_request_duration_seconds_count"
+    labels = {"method": "GET", "route": "unmatched", "status": "404"}
+    before = _sample(name, **labels)
+
+    await client.get("/api/v1/does-not-exist")
+    await client.get("/api/v1/also-missing")
+
+    assert _sample(name, **labels) - before == 2
@@ -0,0 +1,73 @@
+"""Tests for request rate limiting."""
+
+import logging
+
+import pytest
+from httpx import AsyncClient
+
+from src.api.rate_limit import ClientRateLimiter, RateLimitExceededError
+from src.core.config import Settings
+from src.main import app
+
+
+@pytest.fixture
+def strict_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    limiter = ClientRateLimiter(Settings(rate_limit_requests=2, rate_limit_window_seconds=60))
+    monkeypatch.setattr(app.state, "rate_limiter", limiter)
+
+
+@pytest.mark.usefixtures("strict_limiter")
+async def test_requests_over_limit_get_429(client: AsyncClient) -> None:
+    """A client exceeding its per-route budget is rejected with a retry hint."""
+    responses = [await client.get("/api/v1/services") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert 1 <= int(responses[2].headers["retry-after"]) <= 60
+
+
+@pytest.mark.usefixtures("strict_limiter")
+async def test_buckets_are_per_route_and_health_is_exempt(client: AsyncClient) -> None:
+    """Exhausting one route leaves others and health probes available."""
+    for _ in range(3):
+        await client.get("/api/v1/services")
+
+    assert (await client.get("/api/v1/incidents", params={"status": "resolved"})).status_code == 200
+    assert {(await client.get("/api/v1/health")).status_code for _ in range(5)} == {200}
+
+
+async def test_unreachable_shared_storage_falls_back_to_memory() -> None:
+    """A broken shared store degrades to per-process counting instead of failing."""
+    limiter = ClientRateLimiter(Settings(rate_limit_requests=1))
+
+    async def broken_hit(*_args: object, **_kwargs: object) -> bool:
+        raise ConnectionError
+
+    limiter.strategy.hit = broken_hit  # type: ignore[method-assign]
+
+    await limiter.hit("10.0.0.1", "/services")
+    with pytest.raises(RateLimitExceededError):
+        await limiter.hit("10.0.0.1", "/services")
+
+
+async def test_broken_shared_storage_is_skipped_until_retry(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """After a failure the store is not called again until the retry window passes."""
+    limiter = ClientRateLimiter(Settings(rate_limit_storage_retry_seconds=30))
+    calls = 0
+
+    async def broken_hit(*_args: object, **_kwargs: object) -> bool:
+        nonlocal calls
+        calls += 1
+        raise ConnectionError
+
+    limiter.strategy.hit = broken_hit  # type: ignore[method-assign]
+
+    with caplog.at_level(logging.WARNING, logger="src.api.rate_limit"):
+        for _ in range(3):
+            await limiter.hit("10.0.0.1", "/services")
+        limiter._storage_retry_at = 0.0  # The window has passed
+        await limiter.hit("10.0.0.1", "/services")
+
+    assert calls == 2
+    assert len(caplog.records) == 1
@@ -0,0 +1,164 @@
+"""Tests for service status endpoints."""
+
+from datetime import UTC, datetime
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import HourlyStatusRollup, ServiceStatus, ServiceStatusRecord
+from src.services.ingest import StatusUpdate
+from src.services.status_cache import StatusSnapshotCache
+
+
+async def test_list_services_returns_current_status(
+    client: AsyncClient,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Active services are listed with their projected status."""
+    await service_factory(name="GitHub", current_status=ServiceStatus.DEGRADED)
+    await service_factory(name="Retired", is_active=False)
+    await db_session.commit()
+
+    response = await client.get("/api/v1/services")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert [(s["name"], s["status"]) for s in response.json()] == [("GitHub", "degraded")]
+
+
+async def test_list_services_answers_304_for_current_etag(
+    client: AsyncClient,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """A matching If-None-Match is answered without a body."""
+    await service_factory()
+    await db_session.commit()
+    etag = (await client.get("/api/v1/services")).headers["etag"]
+
+    response = await client.get("/api/v1/services", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+async def test_unchanged_poll_keeps_etag(
+    client: AsyncClient,
+    status_cache: StatusSnapshotCache,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """A poll that only moves ``last_checked_at`` still answers 304."""
+    service = await service_factory(current_status=ServiceStatus.OPERATIONAL)
+    await db_session.commit()
+    urls = ["/api/v1/services", f"/api/v1/services/{service.id}/status"]
+    etags = [(await client.get(url)).headers["etag"] for url in urls]
+
+    status_cache.apply([StatusUpdate(service.id, datetime(2026, 1, 1))])
+    responses = [
+        await client.get(url, headers={"If-None-Match": etag})
+        for url, etag in zip(urls, etags, strict=True)
+    ]
+
+    assert [response.status_code for response in responses] == [304, 304]
+    assert (await client.get(urls[1])).json()["last_checked_at"] == "2026-01-01T00:00:00"
+
+
+async def test_ingested_update_changes_etag_without_reload(
+    client: AsyncClient,
+    status_cache: StatusSnapshotCache,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Applied updates produce a new representation and ETag."""
+    service = await service_factory()
+    await db_session.commit()
+    url = f"/api/v1/services/{service.id}/status"
+    etag = (await client.get(url)).headers["etag"]
+
+    status_cache.apply([StatusUpdate(service.id, datetime(2026, 1, 1), ServiceStatus.MAJOR_OUTAGE)])
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["status"] == "major_outage"
+
+
+async def test_get_service_status_unknown_service_returns_404(
+    client: AsyncClient,
+) -> None:
+    """Unknown service ids return 404."""
+    response = await client.get("/api/v1/services/00000000-0000-0000-0000-000000000000/status")
+
+    assert response.status_code == 404
+
+
+async def test_get_service_uptime_reads_rollups(
+    client: AsyncClient,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Uptime is summed from rollup rows inside the window."""
+    service = await service_factory()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    bucket = now.replace(minute=0, second=0, microsecond=0)
+    db_session.add_all(
+        [
+            HourlyStatusRollup(
+                service_id=service.id, bucket_start=bucket, status=status, seconds=seconds
+            )
+            for status, seconds in [
+                (ServiceStatus.OPERATIONAL, 2700.0),
+                (ServiceStatus.MAJOR_OUTAGE, 900.0),
+            ]
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/services/{service.id}/uptime", params={"window": "24h"})
+
+    assert response.status_code == 200
+    assert response.json()["uptime_ratio"] == 0.75
+
+
+async def test_get_service_uptime_rejects_unknown_window(
+    client: AsyncClient,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Only the supported windows are accepted."""
+    service = await service_factory()
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/services/{service.id}/uptime", params={"window": "1y"})
+
+    assert response.status_code == 422
+
+
+async def test_get_service_history_pages_newest_first(
+    client: AsyncClient,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Status records are returned newest first with a cursor for older ones."""
+    service = await service_factory()
+    for day in (1, 2, 3):
+        db_session.add(
+            ServiceStatusRecord(
+                service_id=service.id,
+                status=ServiceStatus.OPERATIONAL,
+                checked_at=datetime(2026, 1, day),
+                last_seen_at=datetime(2026, 1, day),
+            )
+        )
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/services/{service.id}/history", params={"limit": 2})
+
+    body = response.json()
+    assert [item["checked_at"] for item in body["items"]] == [
+        "2026-01-03T00:00:00",
+        "2026-01-02T00:00:00",
+    ]
+    assert body["next_cursor"] is not None
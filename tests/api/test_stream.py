@@ -0,0 +1,43 @@
+"""Tests for the status event stream."""
+
+import uuid
+from datetime import datetime
+
+from httpx import AsyncClient
+
+from src.api.streaming import sse_events
+from src.models import ServiceStatus
+from src.services.events import StatusEventBroker
+from src.services.ingest import StatusUpdate
+
+
+class ConnectedRequest:
+    """Minimal stand-in for a request whose client stays connected."""
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+async def test_sse_events_renders_frames_and_overflow() -> None:
+    """Events are framed as SSE; an overflow ends the stream with a notice."""
+    broker = StatusEventBroker(buffer_size=1)
+    subscription = broker.subscribe()
+    frames = sse_events(ConnectedRequest(), broker, subscription, keepalive_seconds=0.01)  # type: ignore[arg-type]
+
+    assert await anext(frames) == ": keepalive\n\n"
+    update = StatusUpdate(uuid.uuid4(), datetime(2026, 1, 1), ServiceStatus.DEGRADED)
+    broker.publish([update])
+    assert (await anext(frames)).startswith("event: status\ndata: {")
+    broker.publish([update, update])
+    assert [frame async for frame in frames] == ["event: overflow\ndata: {}\n\n"]
+
+
+async def test_stream_refuses_subscribers_over_limit(
+    client: AsyncClient, event_broker: StatusEventBroker
+) -> None:
+    """A full broker answers 503 instead of opening another stream."""
+    event_broker.max_subscribers = 0
+
+    response = await client.get("/api/v1/stream")
+
+    assert response.status_code == 503
@@ -6,7 +6,12 @@ from uuid import uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import StaticPool
 
 # Set test environment variables BEFORE importing app
@@ -17,9 +22,20 @@ os.environ.setdefault("POSTGRES_HOST", "localhost")
 os.environ.setdefault("POSTGRES_DB", "test")
 os.environ.setdefault("ENVIRONMENT", "development")
 
-from src.api.dependencies import get_db_session
+from src.api.dependencies import (
+    get_db_session,
+    get_event_broker,
+    get_health_monitor,
+    get_read_db_connection,
+    get_read_db_session,
+    get_status_cache,
+)
+from src.core.config import get_settings
 from src.main import app
 from src.models import Base, Service
+from src.services.events import StatusEventBroker
+from src.services.health import HealthMonitor
+from src.services.status_cache import StatusSnapshotCache
 
 # Use in-memory SQLite for unit tests (fast, no external deps)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -64,13 +80,45 @@ async def db_session(test_engine) -> AsyncIterator[AsyncSession]:
 
 
 @pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:
+def status_cache(test_engine) -> StatusSnapshotCache:
+    """Create a status snapshot cache backed by the test database."""
+    return StatusSnapshotCache(async_sessionmaker(bind=test_engine, class_=AsyncSession))
+
+
+@pytest.fixture
+def event_broker() -> StatusEventBroker:
+    """Create an event broker for stream tests."""
+    return StatusEventBroker()
+
+
+@pytest.fixture
+def health_monitor(test_engine) -> HealthMonitor:
+    """Create a health monitor checking the test database."""
+    return HealthMonitor(test_engine, get_settings())
+
+
+@pytest.fixture
+async def client(
+    db_session: AsyncSession,
+    status_cache: StatusSnapshotCache,
+    event_broker: StatusEventBroker,
+    health_monitor: HealthMonitor,
+) -> AsyncIterator[AsyncClient]:
     """Create an async test client with mocked database session."""
 
     async def override_get_db_session() -> AsyncIterator[AsyncSession]:
         yield db_session
 
+    async def override_get_db_connection() -> AsyncIterator[AsyncConnection]:
+        yield await db_session.connection()
+
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_db_connection] = override_get_db_connection
+    app.dependency_overrides[get_status_cache] = lambda: status_cache
+    app.dependency_overrides[get_event_broker] = lambda: event_broker
+    app.dependency_overrides[get_health_monitor] = lambda: health_monitor
+    await app.state.rate_limiter.reset()
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
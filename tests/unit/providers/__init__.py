@@ -0,0 +1 @@
+"""Provider adapter unit tests."""
@@ -0,0 +1,194 @@
+"""Tests for the AWS Health Dashboard RSS adapter."""
+
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.core.clock import utcnow
+from src.models import Service, ServiceStatus
+from src.providers import AwsRssProvider, FeedReader, ProviderError
+from src.providers.aws import RECENT_WINDOW, FeedCursor
+
+HEAD = b'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>EC2</title>'
+TAIL = b"</channel></rss>"
+
+
+def item(guid: str, title: str, hours_ago: float, published: str | None = None) -> bytes:
+    if published is None:
+        published = format_datetime((utcnow() - timedelta(hours=hours_ago)).replace(tzinfo=UTC))
+    return (
+        f"<item><title>{title}</title><guid>{guid}</guid>"
+        f"<pubDate>{published}</pubDate>"
+        f"<description>Details of {guid}</description></item>"
+    ).encode()
+
+
+def make_service() -> Service:
+    return Service(
+        id=uuid.uuid4(),
+        name="EC2 us-east-1",
+        provider="aws",
+        status_url="https://status.aws.amazon.com/rss/ec2-us-east-1.rss",
+    )
+
+
+class Feed:
+    """Mock feed server that streams its body in chunks and counts them."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.sent = 0
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    def __call__(self, _request: httpx.Request) -> httpx.Response:
+        self.sent = 0
+        return httpx.Response(200, content=self.stream())
+
+
+@pytest.fixture
+def feed() -> Feed:
+    return Feed(
+        [
+            HEAD + item("e2", "Performance issues: Increased latencies", 2),
+            item("e1", "Service is operating normally: [RESOLVED] Launch errors", 20) + TAIL,
+        ]
+    )
+
+
+@pytest.fixture
+async def provider(feed: Feed):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(feed)) as client:
+        yield AwsRssProvider(client)
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Service is operating normally: [RESOLVED] Errors", ServiceStatus.OPERATIONAL),
+        ("Informational message: [RESOLVED] Elevated errors", ServiceStatus.OPERATIONAL),
+        ("Service disruption: [Resolved] Instances unreachable", ServiceStatus.OPERATIONAL),
+        ("Informational message: Scheduled change", ServiceStatus.DEGRADED),
+        ("Performance issues: Increased latencies", ServiceStatus.PARTIAL_OUTAGE),
+        ("Service disruption: Instances unreachable", ServiceStatus.MAJOR_OUTAGE),
+        ("Something else", ServiceStatus.UNKNOWN),
+    ],
+)
+def test_parse_status_maps_title(title: str, expected: ServiceStatus) -> None:
+    """The severity phrase leading an item title maps onto ServiceStatus."""
+    assert AwsRssProvider.parse_status(title) == expected
+
+
+def test_reader_stops_at_cursor_without_more_input() -> None:
+    """Reaching the last-seen item ends parsing; the rest is never fed."""
+    reader = FeedReader(FeedCursor("e1", None))
+
+    newest = item("e2", "Service disruption: Down", 0, "Thu, 16 Oct 2026 10:00:00 PDT")
+
+    done = reader.feed(HEAD + newest + item("e1", "x", 1))
+
+    assert done
+    assert [i.guid for i in reader.items] == ["e2"]
+    assert reader.items[0].published_at == datetime(2026, 10, 16, 17, 0)
+    assert reader.feed(b"<<not xml") is True
+
+
+def test_reader_bounds_items() -> None:
+    """Without a cursor, reading stops after ``max_items`` items."""
+    reader = FeedReader(max_items=2)
+    body = HEAD + b"".join(item(f"e{n}", "x", 10 - n) for n in range(9, 0, -1)) + TAIL
+    assert reader.feed(body)
+    assert [i.guid for i in reader.items] == ["e9", "e8"]
+
+
+def test_reader_rejects_malformed_feed() -> None:
+    """Broken XML surfaces as ProviderError, also when the body ends early."""
+    with pytest.raises(ProviderError):
+        FeedReader().feed(HEAD + b"<item></channel>")
+    reader = FeedReader()
+    reader.feed(HEAD)
+    with pytest.raises(ProviderError):
+        reader.close()
+
+
+async def test_first_fetch_reads_whole_feed(provider: AwsRssProvider, feed: Feed) -> None:
+    """The newest item decides the status and every item is returned."""
+    result = await provider.fetch_status(make_service())
+
+    assert result.changed
+    assert result.status == ServiceStatus.PARTIAL_OUTAGE
+    assert result.raw_response is not None
+    assert [i["guid"] for i in result.raw_response["items"]] == ["e2", "e1"]
+    assert feed.sent == 2
+
+
+async def test_refetch_stops_at_last_seen_item(provider: AwsRssProvider, feed: Feed) -> None:
+    """Later fetches return only newer items and stop streaming at the old ones."""
+    service = make_service()
+    await provider.fetch_status(service)
+    feed.chunks = [
+        HEAD + item("e3", "Service is operating normally: [RESOLVED] Latencies", 1),
+        item("e2", "Performance issues: Increased latencies", 2),
+        b"<<never parsed",
+    ]
+
+    result = await provider.fetch_status(service)
+
+    assert result.status == ServiceStatus.OPERATIONAL
+    assert result.raw_response is not None
+    assert [i["guid"] for i in result.raw_response["items"]] == ["e3"]
+    assert feed.sent == 2
+
+
+async def test_refetch_without_new_items_is_unchanged(provider: AwsRssProvider, feed: Feed) -> None:
+    """A feed whose newest item was seen before reports the previous status."""
+    service = make_service()
+    await provider.fetch_status(service)
+
+    result = await provider.fetch_status(service)
+
+    assert not result.changed
+    assert result.status == ServiceStatus.PARTIAL_OUTAGE
+    assert feed.sent == 1
+
+
+async def test_empty_feed_is_operational(provider: AwsRssProvider, feed: Feed) -> None:
+    """A feed without items means the service is operating normally."""
+    feed.chunks = [HEAD + TAIL]
+
+    result = await provider.fetch_status(make_service())
+
+    assert result.status == ServiceStatus.OPERATIONAL
+    assert result.raw_response == {"items": []}
+
+
+async def test_stale_item_does_not_set_status(provider: AwsRssProvider, feed: Feed) -> None:
+    """A newest item older than the recency window means operational."""
+    feed.chunks = [HEAD + item("e1", "Service disruption: Instances unreachable", 30) + TAIL]
+
+    result = await provider.fetch_status(make_service())
+
+    assert result.status == ServiceStatus.OPERATIONAL
+
+
+async def test_held_status_clears_once_its_item_ages_out(
+    provider: AwsRssProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An unchanged feed stops reporting an outage after the recency window."""
+    service = make_service()
+    await provider.fetch_status(service)
+    later = utcnow() + RECENT_WINDOW
+    monkeypatch.setattr("src.providers.aws.utcnow", lambda: later)
+
+    result = await provider.fetch_status(service)
+    repeated = await provider.fetch_status(service)
+
+    assert (result.changed, result.status) == (True, ServiceStatus.OPERATIONAL)
+    assert (repeated.changed, repeated.status) == (False, ServiceStatus.OPERATIONAL)
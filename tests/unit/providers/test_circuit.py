@@ -0,0 +1,78 @@
+"""Tests for the per-host circuit breaker."""
+
+import pytest
+
+from src.providers import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=2, backoff=10, max_backoff=25, clock=clock)
+
+
+def test_circuit_opens_after_consecutive_failures(breaker: CircuitBreaker) -> None:
+    """Failures below the threshold keep the circuit closed."""
+    breaker.record_failure("a.example")
+    breaker.before_request("a.example")
+    breaker.record_failure("a.example")
+
+    assert breaker.state("a.example") == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("a.example")
+    breaker.before_request("b.example")
+
+
+def test_success_resets_failure_count(breaker: CircuitBreaker) -> None:
+    """Only consecutive failures count towards the threshold."""
+    breaker.record_failure("a.example")
+    breaker.record_success("a.example")
+    breaker.record_failure("a.example")
+
+    assert breaker.state("a.example") == CircuitState.CLOSED
+
+
+def test_half_open_admits_one_probe(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """After the backoff a single probe goes through; its success closes the circuit."""
+    breaker.record_failure("a.example")
+    breaker.record_failure("a.example")
+    clock.now = 10
+
+    breaker.before_request("a.example")
+    assert breaker.state("a.example") == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("a.example")
+
+    breaker.record_success("a.example")
+    assert breaker.state("a.example") == CircuitState.CLOSED
+    breaker.before_request("a.example")
+
+
+def test_failed_probe_doubles_backoff_up_to_max(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """Each failed probe reopens the circuit for twice as long, capped."""
+    breaker.record_failure("a.example")
+    breaker.record_failure("a.example")  # open until t=10
+
+    for probe_at, backoff in ((10, 20), (30, 25)):
+        clock.now = probe_at
+        breaker.before_request("a.example")
+        breaker.record_failure("a.example")
+        clock.now = probe_at + backoff - 1
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("a.example")
+
+    clock.now = 55
+    breaker.before_request("a.example")
+    assert breaker.state("a.example") == CircuitState.HALF_OPEN
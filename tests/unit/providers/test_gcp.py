@@ -0,0 +1,165 @@
+"""Tests for the Google Cloud incidents.json adapter."""
+
+import json
+import multiprocessing
+import uuid
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Any
+
+import httpx
+import pytest
+
+from src.core.clock import utcnow
+from src.models import IncidentImpact, IncidentStatus, Service, ServiceStatus
+from src.providers import GcpIncidentsProvider, ProviderError
+from src.providers.gcp import JsonArrayReader
+
+
+def incident(
+    incident_id: str,
+    *,
+    impact: str = "SERVICE_DISRUPTION",
+    age: timedelta = timedelta(hours=1),
+    resolved: bool = False,
+    product: str = "Cloud Run",
+) -> dict[str, Any]:
+    modified = (utcnow() - age).isoformat() + "+00:00"
+    return {
+        "id": incident_id,
+        "external_desc": f"Incident {incident_id}",
+        "modified": modified,
+        "end": modified if resolved else None,
+        "status_impact": impact,
+        "affected_products": [{"title": product, "id": product.lower().replace(" ", "-")}],
+        "most_recent_update": {"status": impact, "text": f"Update on {incident_id}"},
+    }
+
+
+def make_service(fragment: str = "") -> Service:
+    return Service(
+        id=uuid.uuid4(),
+        name="Google Cloud",
+        provider="gcp",
+        status_url=f"https://status.cloud.google.com/incidents.json{fragment}",
+    )
+
+
+class Feed:
+    """Mock feed that streams ``incidents`` in small chunks."""
+
+    def __init__(self, incidents: list[dict[str, Any]]) -> None:
+        self.incidents = incidents
+        self.urls: list[str] = []
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        body = json.dumps(self.incidents).encode()
+        for offset in range(0, len(body), 64):
+            yield body[offset : offset + 64]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.urls.append(str(request.url))
+        return httpx.Response(200, content=self.stream())
+
+
+@pytest.fixture
+def feed() -> Feed:
+    return Feed(
+        [
+            incident("open", impact="SERVICE_OUTAGE"),
+            incident("recent", resolved=True),
+            incident("old", resolved=True, age=timedelta(days=30)),
+            incident("other", product="BigQuery"),
+        ]
+    )
+
+
+@pytest.fixture
+async def provider(feed: Feed):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(feed)) as client:
+        yield GcpIncidentsProvider(client)
+
+
+def test_reader_decodes_elements_split_across_chunks() -> None:
+    """Elements are returned once complete, wherever the chunks split them."""
+    body = json.dumps([{"id": 1, "text": "café ]"}, 12345, [1, 2], "x"]).encode()
+    reader = JsonArrayReader()
+    elements = []
+    for offset in range(0, len(body), 3):
+        elements.extend(reader.feed(body[offset : offset + 3]))
+    reader.close()
+    assert elements == [{"id": 1, "text": "café ]"}, 12345, [1, 2], "x"]
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b"[1 2]", b'[{"id": 1},', b"[1] 2"])
+def test_reader_rejects_malformed_arrays(body: bytes) -> None:
+    """Non-arrays, missing separators, truncation and trailing data are errors."""
+    reader = JsonArrayReader()
+    with pytest.raises(ProviderError):
+        reader.feed(body)
+        reader.close()
+
+
+async def test_first_fetch_reports_open_and_recent_incidents(
+    provider: GcpIncidentsProvider, feed: Feed
+) -> None:
+    """Old resolved incidents are skipped; the worst open one sets the status."""
+    result = await provider.fetch_status(make_service())
+
+    assert result.status == ServiceStatus.MAJOR_OUTAGE
+    assert [i.external_id for i in result.incidents] == ["open", "recent", "other"]
+    recent = result.incidents[1]
+    assert recent.status == IncidentStatus.RESOLVED
+    assert recent.impact == IncidentImpact.MAJOR
+    assert recent.resolved_at is not None
+    assert feed.urls == ["https://status.cloud.google.com/incidents.json"]
+
+
+async def test_decodes_batches_on_process_pool(feed: Feed, monkeypatch: pytest.MonkeyPatch) -> None:
+    """With an executor, batches are decoded in a worker, resuming where the last one stopped."""
+
+    async def truncated() -> AsyncIterator[bytes]:
+        yield json.dumps([incident("open")]).encode()[:-1]
+
+    monkeypatch.setattr("src.providers.gcp.PARSE_BATCH_BYTES", 100)
+    feed.incidents.append(incident("café", product="Cloud Run"))
+    pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(feed)) as client:
+        provider = GcpIncidentsProvider(client, pool)
+        try:
+            result = await provider.fetch_status(make_service("#cloud-run"))
+            monkeypatch.setattr(feed, "stream", truncated)
+            with pytest.raises(ProviderError):
+                await provider.fetch_status(make_service())
+        finally:
+            pool.shutdown()
+
+    assert [i.external_id for i in result.incidents] == ["open", "recent", "café"]
+    assert result.status == ServiceStatus.MAJOR_OUTAGE
+
+
+async def test_fragment_selects_product(provider: GcpIncidentsProvider) -> None:
+    """A product in the URL fragment limits the incidents to that product."""
+    result = await provider.fetch_status(make_service("#bigquery"))
+
+    assert [i.external_id for i in result.incidents] == ["other"]
+    assert result.status == ServiceStatus.PARTIAL_OUTAGE
+
+
+async def test_refetch_reports_only_changed_incidents(
+    provider: GcpIncidentsProvider, feed: Feed
+) -> None:
+    """Incidents with an unchanged ``modified`` are not reported again."""
+    service = make_service()
+    await provider.fetch_status(service)
+
+    unchanged = await provider.fetch_status(service)
+    feed.incidents[0] = incident("open", impact="SERVICE_OUTAGE", resolved=True)
+    resolved = await provider.fetch_status(service)
+
+    assert not unchanged.changed
+    assert unchanged.incidents == ()
+    assert [i.external_id for i in resolved.incidents] == ["open"]
+    assert resolved.incidents[0].status == IncidentStatus.RESOLVED
+    assert resolved.status == ServiceStatus.PARTIAL_OUTAGE
@@ -0,0 +1,146 @@
+"""Tests for the Statuspage.io adapter."""
+
+import json
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+import pytest
+
+from src.models import Service, ServiceStatus
+from src.providers import ProviderError, StatuspageProvider
+
+SUMMARY = {"page": {"id": "abc"}, "status": {"indicator": "minor", "description": "Degraded"}}
+
+
+def make_service(status_url: str = "https://www.githubstatus.com") -> Service:
+    return Service(id=uuid.uuid4(), name="GitHub", provider="statuspage", status_url=status_url)
+
+
+class Upstream:
+    """Mock Statuspage server that honours If-None-Match."""
+
+    def __init__(self, body: bytes, etag: str | None = '"v1"') -> None:
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        headers = {"ETag": self.etag} if self.etag else {}
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, content=self.body, headers=headers)
+
+
+@pytest.fixture
+def upstream() -> Upstream:
+    return Upstream(json.dumps(SUMMARY).encode())
+
+
+@pytest.fixture
+async def provider(upstream: Upstream):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        yield StatuspageProvider(client)
+
+
+@pytest.mark.parametrize(
+    ("indicator", "expected"),
+    [
+        ("none", ServiceStatus.OPERATIONAL),
+        ("minor", ServiceStatus.DEGRADED),
+        ("major", ServiceStatus.PARTIAL_OUTAGE),
+        ("critical", ServiceStatus.MAJOR_OUTAGE),
+        ("maintenance", ServiceStatus.MAINTENANCE),
+        ("bogus", ServiceStatus.UNKNOWN),
+    ],
+)
+def test_parse_status_maps_indicator(indicator: str, expected: ServiceStatus) -> None:
+    """Statuspage indicators map onto ServiceStatus values."""
+    assert StatuspageProvider.parse_status({"status": {"indicator": indicator}}) == expected
+
+
+def test_summary_url_accepts_page_root_or_json_url() -> None:
+    """Both the page root and an explicit API URL resolve to a JSON endpoint."""
+    assert (
+        StatuspageProvider.summary_url("https://www.githubstatus.com/")
+        == "https://www.githubstatus.com/api/v2/summary.json"
+    )
+    url = "https://status.example.com/api/v2/status.json"
+    assert StatuspageProvider.summary_url(url) == url
+
+
+async def test_first_fetch_parses_payload(provider: StatuspageProvider) -> None:
+    """The first fetch is always parsed and reported as changed."""
+    result = await provider.fetch_status(make_service())
+
+    assert result.changed
+    assert result.status == ServiceStatus.DEGRADED
+    assert result.raw_response == SUMMARY
+
+
+async def test_not_modified_short_circuits(
+    provider: StatuspageProvider, upstream: Upstream
+) -> None:
+    """A 304 reuses the previous status without a payload."""
+    service = make_service()
+    await provider.fetch_status(service)
+    result = await provider.fetch_status(service)
+
+    assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+    assert not result.changed
+    assert result.status == ServiceStatus.DEGRADED
+    assert result.raw_response is None
+
+
+async def test_identical_body_short_circuits(
+    provider: StatuspageProvider, upstream: Upstream
+) -> None:
+    """Without validators, an identical body is detected by hash."""
+    upstream.etag = None
+    service = make_service()
+    await provider.fetch_status(service)
+    result = await provider.fetch_status(service)
+
+    assert not result.changed
+    assert result.status == ServiceStatus.DEGRADED
+
+
+async def test_changed_body_is_parsed(provider: StatuspageProvider, upstream: Upstream) -> None:
+    """A new body is parsed even when a previous fetch is cached."""
+    service = make_service()
+    await provider.fetch_status(service)
+    upstream.etag = '"v2"'
+    upstream.body = json.dumps({"status": {"indicator": "none"}}).encode()
+    result = await provider.fetch_status(service)
+
+    assert result.changed
+    assert result.status == ServiceStatus.OPERATIONAL
+
+
+async def test_invalid_json_raises_provider_error(
+    provider: StatuspageProvider, upstream: Upstream
+) -> None:
+    """Non-JSON bodies surface as ProviderError."""
+    upstream.body = b"<html>maintenance</html>"
+    with pytest.raises(ProviderError):
+        await provider.fetch_status(make_service())
+
+
+async def test_decodes_on_process_pool(upstream: Upstream) -> None:
+    """With an executor, bodies are decoded in a worker process, errors included."""
+    pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        provider = StatuspageProvider(client, pool)
+        try:
+            result = await provider.fetch_status(make_service())
+            upstream.etag = None
+            upstream.body = b"[]"
+            with pytest.raises(ProviderError):
+                await provider.fetch_status(make_service())
+        finally:
+            pool.shutdown()
+
+    assert result.status == ServiceStatus.DEGRADED
+    assert result.raw_response == SUMMARY
@@ -0,0 +1,91 @@
+"""Tests for the status event broker."""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.models import IncidentImpact, IncidentStatus, ServiceStatus
+from src.services.events import StatusEventBroker, SubscriberLimitError
+from src.services.incident_ingest import IncidentChange
+from src.services.ingest import StatusUpdate
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+def transition(service_id: uuid.UUID, status: ServiceStatus = ServiceStatus.DEGRADED):
+    return StatusUpdate(service_id, T0, status, ServiceStatus.OPERATIONAL)
+
+
+async def test_publish_sends_matching_transitions_only() -> None:
+    """Subscribers get transitions for their services; confirmations are skipped."""
+    watched, other = uuid.uuid4(), uuid.uuid4()
+    broker = StatusEventBroker()
+    subscription = broker.subscribe(frozenset({watched}))
+
+    broker.publish(
+        [
+            StatusUpdate(watched, T0),
+            transition(other),
+            transition(watched, ServiceStatus.MAJOR_OUTAGE),
+        ]
+    )
+
+    event = await asyncio.wait_for(subscription.next(), 1)
+    assert event is not None
+    assert json.loads(event.data)["status"] == "major_outage"
+    assert subscription.queue.empty()
+
+
+async def test_publish_incidents_sends_incident_events() -> None:
+    """Incident changes reach subscribers of their service as ``incident`` events."""
+    service_id = uuid.uuid4()
+    broker = StatusEventBroker()
+    subscription = broker.subscribe(frozenset({service_id}))
+    change = IncidentChange(
+        uuid.uuid4(),
+        service_id,
+        "inc-1",
+        "Errors",
+        IncidentStatus.RESOLVED,
+        IncidentImpact.MINOR,
+        T0,
+    )
+
+    broker.publish_incidents([change])
+
+    event = await asyncio.wait_for(subscription.next(), 1)
+    assert event is not None
+    assert event.type == "incident"
+    assert json.loads(event.data) | {"id": None} == {
+        "id": None,
+        "service_id": str(service_id),
+        "external_id": "inc-1",
+        "title": "Errors",
+        "status": "resolved",
+        "impact": "minor",
+        "resolved_at": T0.isoformat(),
+    }
+
+
+async def test_full_buffer_closes_subscription() -> None:
+    """A subscriber that stops reading is dropped instead of buffering without bound."""
+    broker = StatusEventBroker(buffer_size=2)
+    subscription = broker.subscribe()
+
+    broker.publish([transition(uuid.uuid4()) for _ in range(5)])
+
+    assert subscription.overflowed
+    assert broker.subscriber_count == 0
+    assert await subscription.next() is None
+
+
+def test_subscriber_limit() -> None:
+    """Subscriptions beyond the limit are refused."""
+    broker = StatusEventBroker(max_subscribers=1)
+    broker.subscribe()
+
+    with pytest.raises(SubscriberLimitError):
+        broker.subscribe()
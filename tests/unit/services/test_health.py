@@ -0,0 +1,63 @@
+"""Tests for the background readiness monitor."""
+
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.clock import utcnow
+from src.core.config import get_settings
+from src.services.health import HealthMonitor
+
+
+async def test_check_reports_newest_poll(
+    test_engine, service_factory, db_session: AsyncSession
+) -> None:
+    """The verdict carries the most recent poll time across services."""
+    now = utcnow().replace(microsecond=0)
+    await service_factory(last_checked_at=now - timedelta(minutes=5))
+    await service_factory(last_checked_at=now - timedelta(minutes=1))
+    await db_session.commit()
+    monitor = HealthMonitor(test_engine, get_settings())
+
+    verdict = await monitor.check()
+
+    assert verdict.database == "connected"
+    assert verdict.last_poll_at == now - timedelta(minutes=1)
+    assert monitor.status() == "healthy"
+
+
+async def test_stale_polls_degrade_readiness(
+    test_engine, service_factory, db_session: AsyncSession
+) -> None:
+    """Poll results older than the threshold report degraded."""
+    settings = get_settings().model_copy(update={"health_poll_stale_seconds": 60})
+    await service_factory(last_checked_at=utcnow() - timedelta(minutes=10))
+    await db_session.commit()
+    monitor = HealthMonitor(test_engine, settings)
+
+    await monitor.check()
+
+    assert monitor.status() == "degraded"
+
+
+async def test_stale_verdict_degrades_readiness(test_engine) -> None:
+    """A verdict the monitor failed to refresh is not trusted as healthy."""
+    monitor = HealthMonitor(test_engine, get_settings())
+    verdict = await monitor.check()
+
+    interval = monitor.settings.health_check_interval_seconds
+    later = verdict.checked_at + timedelta(seconds=interval * 4)
+
+    assert monitor.status(later) == "degraded"
+
+
+async def test_unreachable_database_is_unhealthy(tmp_path) -> None:
+    """A failed check is cached as disconnected."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'db.sqlite'}")
+    monitor = HealthMonitor(engine, get_settings())
+
+    verdict = await monitor.check()
+    await engine.dispose()
+
+    assert verdict.database == "disconnected"
+    assert monitor.status() == "unhealthy"
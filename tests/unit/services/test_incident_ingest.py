@@ -0,0 +1,126 @@
+"""Tests for incident change detection and batched writes."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models import Incident, IncidentImpact, IncidentStatus
+from src.providers import IncidentReport
+from src.services import IncidentIngestor
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+def minutes(n: int) -> datetime:
+    return T0 + timedelta(minutes=n)
+
+
+def report(
+    external_id: str = "inc-1",
+    status: IncidentStatus = IncidentStatus.INVESTIGATING,
+    **kwargs,
+) -> IncidentReport:
+    kwargs.setdefault("title", "Elevated errors")
+    kwargs.setdefault("impact", IncidentImpact.MAJOR)
+    return IncidentReport(external_id=external_id, status=status, **kwargs)
+
+
+@pytest.fixture
+def ingestor(test_engine) -> IncidentIngestor:
+    return IncidentIngestor(
+        async_sessionmaker(bind=test_engine, class_=AsyncSession, expire_on_commit=False)
+    )
+
+
+@pytest.fixture
+async def service(service_factory, db_session: AsyncSession):
+    service = await service_factory()
+    await db_session.commit()
+    return service
+
+
+async def incidents(db_session: AsyncSession) -> list[Incident]:
+    db_session.expire_all()
+    result = await db_session.execute(select(Incident).order_by(Incident.external_id))
+    return list(result.scalars().all())
+
+
+async def test_ingest_batches_services_and_skips_unchanged(
+    ingestor: IncidentIngestor, service_factory, db_session: AsyncSession
+) -> None:
+    """Incidents of several services are written once; repeats write nothing."""
+    first = await service_factory()
+    second = await service_factory()
+    await db_session.commit()
+    first_id = first.id
+    batch = [(first_id, report("a")), (first_id, report("b")), (second.id, report("a"))]
+
+    assert await ingestor.ingest(batch, T0) == 3
+    assert await ingestor.ingest(batch, minutes(1)) == 0
+    assert await ingestor.ingest([(first_id, report("b", title="Fixed typo"))], minutes(2)) == 1
+
+    rows = await incidents(db_session)
+    assert sorted((r.service_id == first_id, r.external_id, r.title) for r in rows) == [
+        (False, "a", "Elevated errors"),
+        (True, "a", "Elevated errors"),
+        (True, "b", "Fixed typo"),
+    ]
+
+
+async def test_ingest_passes_written_incidents_to_listeners(
+    ingestor: IncidentIngestor, service
+) -> None:
+    """Listeners get the rows of each committed write, and nothing for repeats."""
+    batches: list[list] = []
+    ingestor.add_listener(lambda changes: batches.append(list(changes)))
+    resolved = report(status=IncidentStatus.RESOLVED)
+
+    await ingestor.ingest([(service.id, report())], T0)
+    await ingestor.ingest([(service.id, report())], minutes(1))
+    await ingestor.ingest([(service.id, resolved)], minutes(2))
+
+    assert [[(c.external_id, c.status, c.resolved_at) for c in b] for b in batches] == [
+        [("inc-1", IncidentStatus.INVESTIGATING, None)],
+        [("inc-1", IncidentStatus.RESOLVED, minutes(2))],
+    ]
+    assert batches[0][0].incident_id == batches[1][0].incident_id
+
+
+async def test_ingest_indexes_stored_incidents(
+    ingestor: IncidentIngestor, test_engine, service
+) -> None:
+    """A new ingestor loads what is stored and skips incidents already there."""
+    await ingestor.ingest([(service.id, report())], T0)
+    restarted = IncidentIngestor(async_sessionmaker(bind=test_engine, class_=AsyncSession))
+
+    assert await restarted.ingest([(service.id, report())], minutes(1)) == 0
+
+
+async def test_ingest_sets_resolved_at_on_transitions(
+    ingestor: IncidentIngestor, service, db_session: AsyncSession
+) -> None:
+    """Resolving sets resolved_at once, reopening clears it."""
+    service_id = service.id
+    await ingestor.ingest([(service_id, report())], T0)
+    await ingestor.ingest([(service_id, report(status=IncidentStatus.RESOLVED))], minutes(5))
+    await ingestor.ingest([(service_id, report(status=IncidentStatus.POSTMORTEM))], minutes(9))
+    resolved = [(r.status, r.resolved_at) for r in await incidents(db_session)]
+
+    await ingestor.ingest([(service_id, report(status=IncidentStatus.IDENTIFIED))], minutes(12))
+    reopened = [(r.status, r.resolved_at) for r in await incidents(db_session)]
+
+    assert resolved == [(IncidentStatus.POSTMORTEM, minutes(5))]
+    assert reopened == [(IncidentStatus.IDENTIFIED, None)]
+
+
+async def test_ingest_prefers_reported_resolution_time(
+    ingestor: IncidentIngestor, service, db_session: AsyncSession
+) -> None:
+    """A resolution time from the provider wins over when it was seen."""
+    resolved = report(status=IncidentStatus.RESOLVED, resolved_at=minutes(3))
+
+    await ingestor.ingest([(service.id, resolved)], minutes(10))
+
+    assert [r.resolved_at for r in await incidents(db_session)] == [minutes(3)]
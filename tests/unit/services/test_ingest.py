@@ -0,0 +1,166 @@
+"""Tests for status history ingestion and timeline reconstruction."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models import ServiceStatus, ServiceStatusRecord
+from src.providers import ProviderResult
+from src.services import StatusIngestor, load_timeline
+from src.services.ingest import StatusWrite
+
+T0 = datetime(2026, 1, 1, 12, 0)
+UP = ProviderResult(status=ServiceStatus.OPERATIONAL)
+DOWN = ProviderResult(status=ServiceStatus.MAJOR_OUTAGE)
+
+
+def minutes(n: int) -> datetime:
+    return T0 + timedelta(minutes=n)
+
+
+@pytest.fixture
+def session_factory(test_engine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def service(service_factory, db_session: AsyncSession):
+    service = await service_factory()
+    await db_session.commit()
+    return service
+
+
+async def records(db_session: AsyncSession) -> list[ServiceStatusRecord]:
+    db_session.expire_all()
+    result = await db_session.execute(
+        select(ServiceStatusRecord).order_by(ServiceStatusRecord.checked_at)
+    )
+    return list(result.scalars().all())
+
+
+async def test_run_length_extends_until_transition(
+    session_factory, service, db_session: AsyncSession
+) -> None:
+    """Repeated statuses extend one record; a transition opens another."""
+    ingestor = StatusIngestor(session_factory, "run_length")
+    for n, result in enumerate([UP, UP, UP, DOWN, DOWN]):
+        await ingestor.record(service.id, result, minutes(n))
+
+    rows = await records(db_session)
+    assert [(r.status, r.check_count) for r in rows] == [
+        (ServiceStatus.OPERATIONAL, 3),
+        (ServiceStatus.MAJOR_OUTAGE, 2),
+    ]
+    assert (rows[0].checked_at, rows[0].last_seen_at) == (minutes(0), minutes(2))
+
+
+async def test_run_length_resumes_from_stored_run(
+    session_factory, service, db_session: AsyncSession
+) -> None:
+    """A fresh ingestor extends the latest stored run instead of duplicating it."""
+    await StatusIngestor(session_factory).record(service.id, UP, minutes(0))
+    await StatusIngestor(session_factory).record(service.id, UP, minutes(1))
+
+    rows = await records(db_session)
+    assert [r.check_count for r in rows] == [2]
+
+
+async def test_touch_extends_open_runs(session_factory, service, db_session: AsyncSession) -> None:
+    """Unchanged polls extend the open run in one batch."""
+    ingestor = StatusIngestor(session_factory)
+    await ingestor.record(service.id, UP, minutes(0))
+    await ingestor.touch([service.id], minutes(5))
+
+    rows = await records(db_session)
+    assert (rows[0].last_seen_at, rows[0].check_count) == (minutes(5), 2)
+
+
+async def test_per_poll_mode_stores_every_poll(
+    session_factory, service, db_session: AsyncSession
+) -> None:
+    """Per-poll mode keeps one record per stored poll."""
+    ingestor = StatusIngestor(session_factory, "per_poll")
+    for n in range(3):
+        await ingestor.record(service.id, UP, minutes(n))
+    await ingestor.touch([service.id], minutes(5))
+
+    assert [r.check_count for r in await records(db_session)] == [1, 1, 1]
+
+
+async def test_load_timeline_rebuilds_intervals(
+    session_factory, service, db_session: AsyncSession
+) -> None:
+    """Runs become consecutive intervals clipped to the requested range."""
+    ingestor = StatusIngestor(session_factory)
+    for n, result in [(0, UP), (10, UP), (20, DOWN), (30, UP), (40, UP)]:
+        await ingestor.record(service.id, result, minutes(n))
+
+    timeline = await load_timeline(db_session, service.id, minutes(5), minutes(35))
+
+    assert [(i.status, i.start, i.end) for i in timeline] == [
+        (ServiceStatus.OPERATIONAL, minutes(5), minutes(20)),
+        (ServiceStatus.MAJOR_OUTAGE, minutes(20), minutes(30)),
+        (ServiceStatus.OPERATIONAL, minutes(30), minutes(35)),
+    ]
+
+
+async def test_ingest_maintains_service_projection(
+    session_factory, service, db_session: AsyncSession
+) -> None:
+    """Stored and unchanged polls keep current_status/last_checked_at fresh."""
+    ingestor = StatusIngestor(session_factory)
+    await ingestor.record(service.id, DOWN, minutes(0))
+    await ingestor.touch([service.id], minutes(1))
+
+    await db_session.refresh(service)
+    assert service.current_status == ServiceStatus.MAJOR_OUTAGE
+    assert service.last_checked_at == minutes(1)
+
+
+async def test_run_length_follows_moved_record(
+    session_factory, service, db_session: AsyncSession
+) -> None:
+    """A run moved by partition retention is extended, not duplicated."""
+    ingestor = StatusIngestor(session_factory)
+    await ingestor.record(service.id, UP, minutes(0))
+    await db_session.execute(update(ServiceStatusRecord).values(checked_at=minutes(1)))
+    await db_session.commit()
+
+    await ingestor.record(service.id, UP, minutes(2))
+    await ingestor.touch([service.id], minutes(3))
+    await ingestor.touch([service.id], minutes(4))
+
+    rows = await records(db_session)
+    assert [(r.checked_at, r.last_seen_at, r.check_count) for r in rows] == [
+        (minutes(1), minutes(4), 4)
+    ]
+
+
+async def test_record_many_writes_services_in_one_batch(
+    session_factory, service_factory, db_session: AsyncSession
+) -> None:
+    """One batch extends, opens and repeats runs in poll order per service."""
+    steady = await service_factory()
+    flapping = await service_factory()
+    await db_session.commit()
+    steady_id, flapping_id = steady.id, flapping.id
+    ingestor = StatusIngestor(session_factory)
+    await ingestor.record_many([StatusWrite(steady_id, UP, minutes(0))])
+
+    await ingestor.record_many(
+        [
+            StatusWrite(steady_id, UP, minutes(1)),
+            StatusWrite(flapping_id, UP, minutes(1)),
+            StatusWrite(flapping_id, DOWN, minutes(2)),
+            StatusWrite(flapping_id, DOWN, minutes(3)),
+        ]
+    )
+
+    rows = await records(db_session)
+    assert sorted((r.service_id == steady_id, r.status, r.check_count) for r in rows) == [
+        (False, ServiceStatus.MAJOR_OUTAGE, 2),
+        (False, ServiceStatus.OPERATIONAL, 1),
+        (True, ServiceStatus.OPERATIONAL, 2),
+    ]
@@ -0,0 +1,93 @@
+"""Tests for cross-process status notifications."""
+
+import uuid
+from datetime import datetime
+
+from src.core.config import Settings
+from src.models import IncidentImpact, IncidentStatus, ServiceStatus
+from src.services.incident_ingest import IncidentChange
+from src.services.ingest import StatusUpdate
+from src.services.notify import (
+    MAX_PAYLOAD_BYTES,
+    StatusNotificationBus,
+    build_payload,
+    decode_payload,
+    encode_incidents,
+    encode_updates,
+)
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+def update(status: ServiceStatus | None = ServiceStatus.DEGRADED) -> StatusUpdate:
+    return StatusUpdate(uuid.uuid4(), T0, status, ServiceStatus.OPERATIONAL)
+
+
+def incident(
+    status: IncidentStatus = IncidentStatus.IDENTIFIED, resolved_at: datetime | None = None
+) -> IncidentChange:
+    return IncidentChange(
+        uuid.uuid4(), uuid.uuid4(), "inc-1", "Errors", status, IncidentImpact.MAJOR, resolved_at
+    )
+
+
+def test_payload_round_trip() -> None:
+    """Updates survive encoding, including confirmations without a status."""
+    updates = [update(), update(None)]
+    (items,) = encode_updates("origin", updates)
+
+    assert decode_payload(build_payload("origin", 7, items)) == ("origin", 7, updates, [])
+
+
+def test_incident_payload_round_trip() -> None:
+    """Incidents survive encoding, with and without a resolution time."""
+    changes = [incident(IncidentStatus.RESOLVED, T0), incident()]
+    (items,) = encode_incidents("origin", changes)
+
+    payload = build_payload("origin", 3, items, "i")
+
+    assert decode_payload(payload) == ("origin", 3, [], changes)
+
+
+def test_large_batches_are_split_below_notify_limit() -> None:
+    """Each chunk fits in a single NOTIFY payload."""
+    chunks = list(encode_updates("origin", [update() for _ in range(500)]))
+
+    assert len(chunks) > 1
+    assert sum(len(chunk) for chunk in chunks) == 500
+    assert all(len(build_payload("origin", 1, c).encode()) < MAX_PAYLOAD_BYTES for c in chunks)
+
+
+def test_remote_updates_reach_listeners_and_gaps_reset() -> None:
+    """Other origins' updates are applied in order; a missed sequence resets."""
+    bus = StatusNotificationBus(Settings())
+    received: list[StatusUpdate] = []
+    resets: list[None] = []
+    bus.add_listener(received.extend)
+    bus.add_reset_listener(lambda: resets.append(None))
+    first, second = update(), update()
+
+    for seq, item in [(1, first), (2, second), (4, update())]:
+        (items,) = encode_updates("peer", [item])
+        bus._on_notification(None, 0, bus.channel, build_payload("peer", seq, items))
+    (items,) = encode_updates(bus.origin, [update()])
+    bus._on_notification(None, 0, bus.channel, build_payload(bus.origin, 1, items))
+
+    assert received == [first, second]
+    assert len(resets) == 1
+
+
+def test_remote_incidents_reach_incident_listeners() -> None:
+    """Incidents from other origins go to incident listeners only."""
+    bus = StatusNotificationBus(Settings())
+    updates: list[StatusUpdate] = []
+    incidents: list[IncidentChange] = []
+    bus.add_listener(updates.extend)
+    bus.add_incident_listener(incidents.extend)
+    change = incident()
+
+    (items,) = encode_incidents("peer", [change])
+    bus._on_notification(None, 0, bus.channel, build_payload("peer", 1, items, "i"))
+
+    assert incidents == [change]
+    assert updates == []
@@ -0,0 +1,67 @@
+"""Tests for keyset pagination."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Incident, IncidentImpact, IncidentStatus
+from src.services.incidents import load_incident_page
+from src.services.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+def test_cursor_round_trip() -> None:
+    """A cursor decodes back to the position it encodes."""
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(T0, row_id)) == (T0, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzFd"])
+def test_decode_rejects_malformed_cursor(cursor: str) -> None:
+    """Garbage is reported as an invalid cursor, not a server error."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+async def test_pages_cover_every_row_once(service_factory, db_session: AsyncSession) -> None:
+    """Walking the cursors visits each row once, even across equal timestamps."""
+    service = await service_factory()
+    for n in range(7):
+        db_session.add(
+            Incident(
+                service_id=service.id,
+                external_id=f"inc-{n}",
+                title=f"Incident {n}",
+                status=IncidentStatus.RESOLVED,
+                impact=IncidentImpact.MINOR,
+                # Pairs of incidents share a creation time
+                created_at=T0 + timedelta(minutes=n // 2),
+            )
+        )
+    db_session.add(
+        Incident(
+            service_id=service.id,
+            external_id="open",
+            title="Open",
+            status=IncidentStatus.INVESTIGATING,
+            impact=IncidentImpact.MAJOR,
+        )
+    )
+    await db_session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = await load_incident_page(db_session, IncidentStatus.RESOLVED, 3, cursor)
+        seen.extend(incident.external_id for incident in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert sorted(seen) == [f"inc-{n}" for n in range(7)]
+    assert len(seen) == 7
+    assert seen[0] == "inc-6"
@@ -0,0 +1,69 @@
+"""Tests for content-addressed payload storage."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models import RawPayload, ServiceStatus, ServiceStatusRecord
+from src.providers import ProviderResult
+from src.services import StatusIngestor
+from src.services.payloads import EncodedPayload, load_payload, purge_unreferenced_payloads
+
+T0 = datetime(2026, 1, 1, 12, 0)
+SUMMARY = {"status": {"indicator": "none"}, "components": [{"name": "API"}]}
+
+
+@pytest.fixture
+def session_factory(test_engine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def test_encoding_ignores_key_order() -> None:
+    """Documents differing only in key order share a digest and compressed bytes."""
+    first = EncodedPayload.from_json({"a": 1, "b": [1, 2]})
+    second = EncodedPayload.from_json({"b": [1, 2], "a": 1})
+
+    assert first == second
+
+
+async def test_identical_payloads_are_stored_once(
+    session_factory, service_factory, db_session: AsyncSession
+) -> None:
+    """Records of several services reference one compressed copy of a payload."""
+    services = [await service_factory(), await service_factory()]
+    await db_session.commit()
+    ingestor = StatusIngestor(session_factory, "per_poll")
+    for service in services:
+        for minute in range(3):
+            result = ProviderResult(status=ServiceStatus.OPERATIONAL, raw_response=SUMMARY)
+            await ingestor.record(service.id, result, T0.replace(minute=minute))
+
+    digests = set(await db_session.scalars(select(ServiceStatusRecord.raw_response_digest)))
+    assert await db_session.scalar(select(func.count()).select_from(RawPayload)) == 1
+    assert len(digests) == 1
+    assert await load_payload(db_session, digests.pop()) == SUMMARY
+
+
+async def test_purge_keeps_referenced_and_recent_payloads(
+    session_factory, service_factory, db_session: AsyncSession, test_engine
+) -> None:
+    """Only payloads that are unreferenced and past the grace period are purged."""
+    service = await service_factory()
+    await db_session.commit()
+    ingestor = StatusIngestor(session_factory)
+    await ingestor.record(service.id, ProviderResult(ServiceStatus.OPERATIONAL, {"v": 1}), T0)
+    # The open run now references a newer payload, orphaning the first one
+    await ingestor.record(
+        service.id, ProviderResult(ServiceStatus.OPERATIONAL, {"v": 2}), T0.replace(minute=1)
+    )
+    await db_session.execute(update(RawPayload).values(last_used_at=T0))
+    await db_session.commit()
+
+    async with test_engine.begin() as conn:
+        assert await purge_unreferenced_payloads(conn, T0) == 0
+        assert await purge_unreferenced_payloads(conn, T0.replace(hour=13)) == 1
+
+    remaining = (await db_session.scalars(select(RawPayload.digest))).all()
+    assert remaining == [EncodedPayload.from_json({"v": 2}).digest]
@@ -0,0 +1,508 @@
+"""Tests for the status poller."""
+
+import asyncio
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from typing import ClassVar
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.clock import utcnow
+from src.core.config import get_settings
+from src.models import (
+    HourlyStatusRollup,
+    Incident,
+    IncidentImpact,
+    IncidentStatus,
+    Service,
+    ServiceStatus,
+    ServiceStatusRecord,
+)
+from src.providers import (
+    IncidentReport,
+    ProviderError,
+    ProviderResult,
+    StatusProvider,
+    registry,
+)
+from src.services.poller import StatusPoller
+from src.services.rollups import UptimeAggregator
+from src.services.schedule import PollBudget
+
+
+class FakeProvider(StatusProvider):
+    """Provider returning canned results and tracking concurrency."""
+
+    in_flight = 0
+    max_in_flight = 0
+    failing: ClassVar[set[str]] = set()
+    changed = True
+    status = ServiceStatus.OPERATIONAL
+    incidents: ClassVar[tuple[IncidentReport, ...]] = ()
+    delay = 0.01
+    pool_broken = False
+
+    async def fetch_status(self, service: Service) -> ProviderResult:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(cls.delay)
+            if service.name in cls.failing:
+                raise ProviderError("boom")
+            if cls.pool_broken:
+                raise BrokenProcessPool("worker died")
+            return ProviderResult(
+                status=cls.status,
+                raw_response={"ok": True},
+                changed=cls.changed,
+                incidents=cls.incidents,
+            )
+        finally:
+            cls.in_flight -= 1
+
+
+@pytest.fixture
+def fake_provider(monkeypatch: pytest.MonkeyPatch) -> type[FakeProvider]:
+    monkeypatch.setitem(registry._PROVIDERS, "test", FakeProvider)
+    FakeProvider.in_flight = 0
+    FakeProvider.max_in_flight = 0
+    FakeProvider.failing = set()
+    FakeProvider.changed = True
+    FakeProvider.status = ServiceStatus.OPERATIONAL
+    FakeProvider.incidents = ()
+    FakeProvider.delay = 0.01
+    FakeProvider.pool_broken = False
+    return FakeProvider
+
+
+@pytest.fixture
+def poller(test_engine) -> StatusPoller:
+    settings = get_settings().model_copy(
+        update={
+            "status_poll_jitter_ratio": 0.0,
+            "status_poll_concurrency": 10,
+            "status_poll_per_host_limit": 2,
+        }
+    )
+    session_factory = async_sessionmaker(bind=test_engine, class_=AsyncSession)
+    return StatusPoller(settings, session_factory)
+
+
+@pytest.mark.usefixtures("fake_provider")
+async def test_run_cycle_records_status_for_active_services(
+    poller: StatusPoller,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Each active service gets one record; inactive ones are skipped."""
+    active = await service_factory()
+    await service_factory(is_active=False)
+    await db_session.commit()
+
+    stats = await poller.run_cycle()
+    await poller.stop()
+
+    assert stats.services == 1
+    assert stats.succeeded == 1
+    records = (await db_session.execute(select(ServiceStatusRecord))).scalars().all()
+    assert [r.service_id for r in records] == [active.id]
+    assert records[0].status == ServiceStatus.OPERATIONAL
+
+
+async def test_run_cycle_limits_concurrency_per_host(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Services on the same host never exceed the per-host limit."""
+    for _ in range(6):
+        await service_factory(status_url="https://status.example.com/api/v2/summary.json")
+    await db_session.commit()
+
+    await poller.run_cycle()
+    await poller.stop()
+
+    assert fake_provider.max_in_flight == 2
+
+
+async def test_run_cycle_counts_failures(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """A failing fetch is counted and does not abort the cycle."""
+    await service_factory(name="healthy")
+    await service_factory(name="broken")
+    await db_session.commit()
+    fake_provider.failing = {"broken"}
+
+    def fetches(outcome: str) -> float:
+        name = "status_beacon_poll_fetch_duration_seconds_count"
+        return REGISTRY.get_sample_value(name, {"provider": "test", "outcome": outcome}) or 0
+
+    errors, changed = fetches("error"), fetches("changed")
+    stats = await poller.run_cycle()
+    await poller.stop()
+
+    assert (stats.succeeded, stats.failed) == (1, 1)
+    assert (fetches("error") - errors, fetches("changed") - changed) == (1, 1)
+
+
+def test_start_offset_spreads_within_window(poller: StatusPoller) -> None:
+    """Offsets stay inside the configured jitter window."""
+    poller.settings = poller.settings.model_copy(update={"status_poll_jitter_ratio": 0.5})
+    service = Service(id=uuid.uuid4(), name="x", provider="test", status_url="https://x.io")
+    assert 0 <= poller.start_offset(service) < poller.tick * 0.5
+
+
+async def test_run_cycle_skips_write_for_unchanged_results(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Unchanged results are counted but not stored."""
+    await service_factory()
+    await db_session.commit()
+    fake_provider.changed = False
+
+    stats = await poller.run_cycle()
+    await poller.stop()
+
+    assert (stats.succeeded, stats.unchanged) == (1, 1)
+    assert (await db_session.execute(select(ServiceStatusRecord))).first() is None
+
+
+async def test_open_circuit_marks_services_unknown_without_fetching(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Once a host's circuit opens its services are marked UNKNOWN and skipped."""
+    poller.circuits.failure_threshold = 1
+    service = await service_factory(name="broken", current_status=ServiceStatus.OPERATIONAL)
+    await db_session.commit()
+    fake_provider.failing = {"broken"}
+
+    now = utcnow()
+    first = await poller.run_cycle(now)
+    fake_provider.max_in_flight = 0
+    second = await poller.run_cycle(now + timedelta(minutes=5))
+    await poller.stop()
+
+    assert first.failed == 1
+    assert second.circuit_open == 1
+    assert fake_provider.max_in_flight == 0
+    await db_session.refresh(service)
+    assert service.current_status == ServiceStatus.UNKNOWN
+
+
+async def test_run_cycle_schedules_next_poll(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Polled services are not due again until their interval has passed."""
+    quiet = await service_factory(current_status=ServiceStatus.OPERATIONAL)
+    await db_session.commit()
+    fake_provider.changed = False
+    now = utcnow()
+
+    first = await poller.run_cycle(now)
+    early = await poller.run_cycle(now + timedelta(seconds=30))
+    due = await poller.run_cycle(now + timedelta(seconds=60))
+    await poller.stop()
+
+    assert (first.services, early.services, due.services) == (1, 0, 1)
+    await db_session.refresh(quiet)
+    assert quiet.poll_interval_seconds == 90
+    assert quiet.next_poll_at == now + timedelta(seconds=150)
+
+
+async def test_run_cycle_polls_services_with_open_incidents_fastest(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """An unresolved incident puts its service on the minimum interval."""
+    service = await service_factory(current_status=ServiceStatus.OPERATIONAL)
+    db_session.add(
+        Incident(
+            service_id=service.id,
+            external_id="inc-1",
+            title="Elevated errors",
+            status=IncidentStatus.INVESTIGATING,
+            impact=IncidentImpact.MINOR,
+        )
+    )
+    await db_session.commit()
+    fake_provider.changed = False
+
+    await poller.run_cycle()
+    await poller.stop()
+
+    await db_session.refresh(service)
+    assert service.poll_interval_seconds == poller.settings.status_poll_min_interval_seconds
+
+
+async def test_run_cycle_writes_reported_incidents_in_one_batch(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Incidents from every polled service are written together, once."""
+    for _ in range(2):
+        await service_factory(current_status=ServiceStatus.OPERATIONAL)
+    await db_session.commit()
+    fake_provider.incidents = (
+        IncidentReport("inc-1", "Elevated errors", IncidentStatus.IDENTIFIED, IncidentImpact.MINOR),
+    )
+
+    def batches() -> float:
+        name = "status_beacon_ingest_batch_size_count"
+        return REGISTRY.get_sample_value(name, {"operation": "incidents"}) or 0
+
+    before = batches()
+    now = utcnow()
+    await poller.run_cycle(now)
+    await poller.run_cycle(now + timedelta(minutes=5))
+    await poller.stop()
+
+    assert batches() - before == 1
+    incidents = (await db_session.execute(select(Incident))).scalars().all()
+    assert len(incidents) == 2
+    intervals = (await db_session.execute(select(Service.poll_interval_seconds))).scalars().all()
+    assert set(intervals) == {poller.settings.status_poll_min_interval_seconds}
+
+
+async def test_broken_parse_pool_is_replaced(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Polls failing on a broken pool count as failed, and later cycles get a new pool."""
+    # As many failures as open a circuit, which a broken pool must not do
+    for _ in range(poller.settings.status_poll_circuit_failure_threshold):
+        await service_factory()
+    await db_session.commit()
+    broken = poller.parse_pool
+    fake_provider.pool_broken = True
+    now = utcnow()
+
+    failed = await poller.run_cycle(now)
+    fake_provider.pool_broken = False
+    recovered = await poller.run_cycle(now + timedelta(hours=1))
+    await poller.stop()
+
+    assert failed.failed == recovered.succeeded == failed.services
+    assert poller.parse_pool is not None
+    assert poller.parse_pool is not broken
+    assert poller._get_provider("test").executor is poller.parse_pool
+
+
+async def test_run_cycle_respects_poll_budget(
+    poller: StatusPoller,
+    service_factory,
+    db_session: AsyncSession,
+    fake_provider: type[FakeProvider],
+) -> None:
+    """Services due beyond the per-minute budget wait for a later cycle."""
+    poller.budget = PollBudget(2)
+    for _ in range(3):
+        await service_factory()
+    await db_session.commit()
+
+    first = await poller.run_cycle()
+    second = await poller.run_cycle()
+    await poller.stop()
+
+    assert (first.services, second.services) == (2, 0)
+    assert fake_provider.max_in_flight <= 2
+
+
+@pytest.mark.usefixtures("fake_provider")
+async def test_concurrent_pollers_split_due_services(
+    poller: StatusPoller,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """Services claimed by one poller are not polled by another."""
+    other = StatusPoller(poller.settings, poller.session_factory)
+    for _ in range(3):
+        await service_factory()
+    await db_session.commit()
+    now = utcnow()
+
+    first = await poller._claim_due_services(now, 2)
+    second = await other._claim_due_services(now, 2)
+    await poller.stop()
+    await other.stop()
+
+    assert (len(first), len(second)) == (2, 1)
+    assert {service.id for service in first}.isdisjoint(service.id for service in second)
+
+
+@pytest.mark.usefixtures("fake_provider")
+async def test_concurrent_pollers_share_poll_budget(
+    poller: StatusPoller,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """The per-minute budget holds across pollers rather than per poller."""
+    settings = poller.settings.model_copy(update={"status_poll_budget_per_minute": 2})
+    first, second = (StatusPoller(settings, poller.session_factory) for _ in range(2))
+    for _ in range(3):
+        await service_factory()
+    await db_session.commit()
+    now = utcnow()
+
+    both = await first.run_cycle(now), await second.run_cycle(now)
+    refilled = await second.run_cycle(now + timedelta(seconds=30))
+    await first.stop()
+    await second.stop()
+
+    assert [stats.services for stats in (*both, refilled)] == [2, 0, 1]
+
+
+async def test_claims_are_renewed_while_the_cycle_runs(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """A cycle outlasting the lease keeps its services from other pollers."""
+    poller.settings = poller.settings.model_copy(update={"status_poll_claim_seconds": 1})
+    other = StatusPoller(poller.settings, poller.session_factory)
+    fake_provider.delay = 1.5
+    await service_factory()
+    await db_session.commit()
+    now = utcnow()
+
+    cycle = asyncio.create_task(poller.run_cycle(now))
+    await asyncio.sleep(1.2)
+    stolen = await other._claim_due_services(now + timedelta(seconds=1.2), 10)
+    stats = await cycle
+    await poller.stop()
+    await other.stop()
+
+    assert stolen == []
+    assert stats.services == stats.succeeded == 1
+
+
+@pytest.mark.usefixtures("fake_provider")
+async def test_abandoned_claim_falls_due_after_lease(
+    poller: StatusPoller,
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """A service claimed by a poller that died is polled once the lease expires."""
+    await service_factory()
+    await db_session.commit()
+    now = utcnow()
+    lease = timedelta(seconds=poller.settings.status_poll_claim_seconds)
+
+    assert len(await poller._claim_due_services(now, 10)) == 1
+    during = await poller.run_cycle(now + lease / 2)
+    after = await poller.run_cycle(now + lease)
+    await poller.stop()
+
+    assert (during.services, after.services) == (0, 1)
+
+
+async def test_poller_reloads_state_written_by_another_poller(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+) -> None:
+    """A poller does not extend a run another poller closed in between."""
+    other = StatusPoller(poller.settings, poller.session_factory)
+    service = await service_factory()
+    await db_session.commit()
+    service_id = service.id
+    updates = []
+    poller.ingestor.add_listener(updates.extend)
+    now = utcnow()
+
+    for n, (owner, status) in enumerate(
+        [
+            (poller, ServiceStatus.OPERATIONAL),
+            (other, ServiceStatus.MAJOR_OUTAGE),
+            (poller, ServiceStatus.OPERATIONAL),
+        ]
+    ):
+        fake_provider.status = status
+        await owner.run_cycle(now + timedelta(hours=n))
+    await poller.stop()
+    await other.stop()
+
+    records = (
+        await db_session.execute(
+            select(ServiceStatusRecord).order_by(ServiceStatusRecord.checked_at)
+        )
+    ).scalars()
+    assert [record.status for record in records] == [
+        ServiceStatus.OPERATIONAL,
+        ServiceStatus.MAJOR_OUTAGE,
+        ServiceStatus.OPERATIONAL,
+    ]
+    recovery = [u for u in updates if u.service_id == service_id and u.status is not None][-1]
+    assert recovery.previous_status == ServiceStatus.MAJOR_OUTAGE
+
+
+async def test_uptime_resumes_from_observation_of_another_poller(
+    poller: StatusPoller,
+    fake_provider: type[FakeProvider],
+    service_factory,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each span between polls is counted once, with the status stored at its start."""
+    other = StatusPoller(poller.settings, poller.session_factory)
+    aggregators = []
+    for owner in (poller, other):
+        aggregator = UptimeAggregator(owner.session_factory, owner.settings)
+        owner.ingestor.add_listener(aggregator.apply)
+        owner.ingestor.add_resync_listener(aggregator.resync)
+        aggregators.append(aggregator)
+    await service_factory()
+    await db_session.commit()
+    start = utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+    clock = start
+    monkeypatch.setattr("src.services.poller.utcnow", lambda: clock)
+
+    for seconds, owner, status in [
+        (0, poller, ServiceStatus.OPERATIONAL),
+        (60, poller, ServiceStatus.OPERATIONAL),
+        (120, other, ServiceStatus.MAJOR_OUTAGE),
+        (600, poller, ServiceStatus.MAJOR_OUTAGE),
+    ]:
+        clock = start + timedelta(seconds=seconds)
+        fake_provider.status = status
+        assert (await owner.run_cycle(clock)).services == 1
+    await poller.stop()
+    await other.stop()
+    for aggregator in aggregators:
+        await aggregator.flush()
+
+    rows = await db_session.execute(
+        select(HourlyStatusRollup.status, HourlyStatusRollup.seconds).order_by(
+            HourlyStatusRollup.status
+        )
+    )
+    assert rows.tuples().all() == [
+        (ServiceStatus.MAJOR_OUTAGE, 480.0),
+        (ServiceStatus.OPERATIONAL, 120.0),
+    ]
@@ -0,0 +1,115 @@
+"""Tests for uptime rollup aggregation and window queries."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import Settings
+from src.models import DailyStatusRollup, HourlyStatusRollup, ServiceStatus
+from src.services import UptimeAggregator, load_uptime
+from src.services.ingest import StatusUpdate
+from src.services.rollups import split_by_bucket
+
+T0 = datetime(2026, 1, 1, 23, 30)
+UP = ServiceStatus.OPERATIONAL
+DOWN = ServiceStatus.MAJOR_OUTAGE
+
+
+def minutes(n: int) -> datetime:
+    return T0 + timedelta(minutes=n)
+
+
+@pytest.fixture
+def session_factory(test_engine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def service(service_factory, db_session: AsyncSession):
+    service = await service_factory()
+    await db_session.commit()
+    return service
+
+
+@pytest.fixture
+def aggregator(session_factory) -> UptimeAggregator:
+    return UptimeAggregator(
+        session_factory,
+        Settings(
+            uptime_max_gap_seconds=600,
+            status_poll_max_interval_seconds=300,
+            status_poll_claim_seconds=60,
+        ),
+    )
+
+
+def test_split_by_bucket_clips_to_bucket_edges() -> None:
+    """An interval crossing midnight is split between both days."""
+    parts = list(split_by_bucket(minutes(0), minutes(45), timedelta(hours=1)))
+
+    assert parts == [(datetime(2026, 1, 1, 23), 1800.0), (datetime(2026, 1, 2), 900.0)]
+
+
+async def test_flush_accumulates_across_batches(
+    aggregator: UptimeAggregator, service, db_session: AsyncSession
+) -> None:
+    """Time between observations goes to the held status, additively per bucket."""
+    aggregator.apply([StatusUpdate(service.id, minutes(0), UP)])
+    aggregator.apply([StatusUpdate(service.id, minutes(10), DOWN)])
+    await aggregator.flush()
+    # An unchanged poll carries no status and extends the held one
+    aggregator.apply([StatusUpdate(service.id, minutes(20))])
+    await aggregator.flush()
+
+    rows = await db_session.execute(
+        select(DailyStatusRollup.status, DailyStatusRollup.seconds).where(
+            DailyStatusRollup.bucket_start == datetime(2026, 1, 1)
+        )
+    )
+    assert dict(rows.tuples().all()) == {UP: 600.0, DOWN: 600.0}
+
+
+async def test_gaps_are_capped(aggregator: UptimeAggregator, service) -> None:
+    """Time beyond max_gap without a poll is not attributed to any status."""
+    aggregator.apply([StatusUpdate(service.id, minutes(0), UP)])
+    aggregator.apply([StatusUpdate(service.id, minutes(120), UP)])
+    await aggregator.flush()
+
+    async with aggregator.session_factory() as session:
+        summary = await load_uptime(session, service.id, "24h", now=minutes(120))
+    assert summary.seconds == {UP: 600.0}
+
+
+async def test_gap_cap_covers_the_longest_poll_interval(service, session_factory) -> None:
+    """A quiet service polled at the maximum interval counts as fully covered."""
+    settings = Settings(
+        uptime_max_gap_seconds=300,
+        status_poll_max_interval_seconds=600,
+        status_poll_claim_seconds=120,
+    )
+    aggregator = UptimeAggregator(session_factory, settings)
+    aggregator.apply([StatusUpdate(service.id, minutes(0), UP)])
+    aggregator.apply([StatusUpdate(service.id, minutes(11), UP)])
+    await aggregator.flush()
+
+    async with aggregator.session_factory() as session:
+        summary = await load_uptime(session, service.id, "24h", now=minutes(11))
+    assert summary.seconds == {UP: 660.0}
+
+
+async def test_load_uptime_excludes_maintenance(
+    aggregator: UptimeAggregator, service, db_session: AsyncSession
+) -> None:
+    """The ratio ignores maintenance time; long windows read daily rows."""
+    for n, status in enumerate([UP, UP, UP, DOWN, ServiceStatus.MAINTENANCE, UP]):
+        aggregator.apply([StatusUpdate(service.id, minutes(5 * n), status)])
+    await aggregator.flush()
+
+    hourly = await load_uptime(db_session, service.id, "24h", now=minutes(60))
+    daily = await load_uptime(db_session, service.id, "30d", now=minutes(60))
+
+    assert hourly.uptime_ratio == pytest.approx(0.75)
+    assert daily.seconds == hourly.seconds
+    assert (await db_session.scalar(select(HourlyStatusRollup.id).limit(1))) is not None
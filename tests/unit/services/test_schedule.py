@@ -0,0 +1,41 @@
+"""Tests for adaptive poll scheduling."""
+
+import pytest
+
+from src.core.config import get_settings
+from src.services.schedule import PollBudget, next_poll_interval
+
+
+@pytest.fixture
+def settings():
+    return get_settings().model_copy(
+        update={
+            "status_poll_interval_seconds": 60,
+            "status_poll_min_interval_seconds": 15,
+            "status_poll_max_interval_seconds": 200,
+            "status_poll_backoff_factor": 2.0,
+        }
+    )
+
+
+def test_next_poll_interval_backs_off_quiet_services_to_ceiling(settings) -> None:
+    """Unchanged polls stretch the interval until it hits the maximum."""
+    intervals = [None]
+    for _ in range(4):
+        intervals.append(next_poll_interval(settings, intervals[-1], urgent=False, changed=False))
+    assert intervals[1:] == [60.0, 120.0, 200.0, 200.0]
+
+
+def test_next_poll_interval_resets_on_change_and_urgency(settings) -> None:
+    """A change returns to the base interval; urgency overrides both."""
+    assert next_poll_interval(settings, 200.0, urgent=False, changed=True) == 60.0
+    assert next_poll_interval(settings, 200.0, urgent=True, changed=False) == 15.0
+    assert next_poll_interval(settings, 15.0, urgent=False, changed=False) == 120.0
+
+
+def test_poll_budget_refills_at_rate() -> None:
+    """Spent tokens come back at the per-minute rate, capped at capacity."""
+    budget = PollBudget(60)
+    assert budget.refill(0.0, 10.0) == 10.0
+    assert budget.refill(0.0, 1000.0) == 60.0
+    assert budget.refill(5.0, -30.0) == 5.0
@@ -0,0 +1,70 @@
+"""Tests for the in-memory status snapshot cache."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import ServiceStatus
+from src.services.ingest import StatusUpdate
+from src.services.status_cache import StatusSnapshotCache
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+async def test_updates_during_load_are_replayed(
+    status_cache: StatusSnapshotCache,
+    service_factory,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A load finishes under a steady stream of updates and reflects them."""
+    service = await service_factory()
+    await db_session.commit()
+    service_id = service.id
+    load = status_cache._load
+    loads = 0
+
+    async def load_while_updating():
+        nonlocal loads
+        loads += 1
+        entries = await load()
+        status_cache.apply([StatusUpdate(service_id, T0, ServiceStatus.MAJOR_OUTAGE)])
+        return entries
+
+    monkeypatch.setattr(status_cache, "_load", load_while_updating)
+    snapshot = await asyncio.wait_for(status_cache.get(), 1)
+
+    assert loads == 1
+    assert json.loads(snapshot.by_id[service_id].body)["status"] == "major_outage"
+
+
+async def test_invalidate_during_load_reloads(
+    status_cache: StatusSnapshotCache,
+    service_factory,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A load that raced an invalidation is repeated to pick up new services."""
+    await service_factory()
+    await db_session.commit()
+    load = status_cache._load
+    loads = 0
+
+    async def load_then_invalidate():
+        nonlocal loads
+        loads += 1
+        entries = await load()
+        if loads == 1:
+            await service_factory()
+            await db_session.commit()
+            status_cache.invalidate()
+        return entries
+
+    monkeypatch.setattr(status_cache, "_load", load_then_invalidate)
+    snapshot = await status_cache.get()
+
+    assert loads == 2
+    assert len(snapshot.by_id) == 2
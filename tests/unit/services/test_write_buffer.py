@@ -0,0 +1,113 @@
+"""Tests for the write-behind buffer of poll results."""
+
+import asyncio
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.core.config import get_settings
+from src.models import ServiceStatus
+from src.providers import ProviderResult
+from src.services.ingest import StatusWrite
+from src.services.write_buffer import StatusWriteBuffer
+
+T0 = datetime(2026, 1, 1, 12, 0)
+UP = ProviderResult(status=ServiceStatus.OPERATIONAL)
+
+
+class FakeIngestor:
+    """Records the batches it is given, optionally holding them until released."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[StatusWrite]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.failing = False
+
+    async def record_many(self, writes: Sequence[StatusWrite]) -> None:
+        await self.release.wait()
+        if self.failing:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(writes))
+
+
+def make_buffer(ingestor: FakeIngestor, **settings) -> StatusWriteBuffer:
+    defaults = {"status_write_batch_size": 2, "status_write_flush_ms": 1000}
+    return StatusWriteBuffer(
+        ingestor,
+        get_settings().model_copy(update=defaults | settings),
+    )
+
+
+async def test_stop_writes_queued_results_in_batches() -> None:
+    """Results are grouped up to the batch size, and stop writes the rest."""
+    ingestor = FakeIngestor()
+    buffer = make_buffer(ingestor)
+
+    for _ in range(5):
+        await buffer.put(uuid.uuid4(), UP, T0)
+    await buffer.stop()
+
+    assert [len(batch) for batch in ingestor.batches] == [2, 2, 1]
+
+
+async def test_partial_batch_is_written_after_flush_interval() -> None:
+    """A batch that does not fill is written once the flush interval passes."""
+    ingestor = FakeIngestor()
+    buffer = make_buffer(ingestor, status_write_batch_size=100, status_write_flush_ms=10)
+
+    await buffer.put(uuid.uuid4(), UP, T0)
+    await asyncio.sleep(0.1)
+
+    assert [len(batch) for batch in ingestor.batches] == [1]
+    await buffer.stop()
+
+
+async def test_drain_writes_without_waiting_for_interval() -> None:
+    """drain() returns once queued results are written, well before the interval."""
+    ingestor = FakeIngestor()
+    buffer = make_buffer(ingestor, status_write_batch_size=100, status_write_flush_ms=60_000)
+    await buffer.put(uuid.uuid4(), UP, T0)
+
+    await asyncio.wait_for(buffer.drain(), timeout=1)
+
+    assert [len(batch) for batch in ingestor.batches] == [1]
+    await buffer.stop()
+
+
+async def test_put_waits_while_queue_is_full() -> None:
+    """With the writer stalled, put() blocks once the queue is full."""
+    ingestor = FakeIngestor()
+    ingestor.release.clear()
+    buffer = make_buffer(ingestor, status_write_batch_size=1, status_write_queue_size=1)
+    await buffer.put(uuid.uuid4(), UP, T0)
+    await asyncio.sleep(0)  # The writer takes the first result and stalls on it
+    await buffer.put(uuid.uuid4(), UP, T0)
+
+    blocked = asyncio.create_task(buffer.put(uuid.uuid4(), UP, T0))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    ingestor.release.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await buffer.stop()
+    assert len(ingestor.batches) == 3
+
+
+async def test_failed_batch_is_reported_and_writer_continues() -> None:
+    """A batch that fails goes to on_failure; later batches are still written."""
+    ingestor = FakeIngestor()
+    ingestor.failing = True
+    failed: list[StatusWrite] = []
+    buffer = make_buffer(ingestor)
+    buffer.on_failure = failed.extend
+    service_id = uuid.uuid4()
+
+    await buffer.put(service_id, UP, T0)
+    await buffer.drain()
+    ingestor.failing = False
+    await buffer.put(uuid.uuid4(), UP, T0)
+    await buffer.stop()
+
+    assert [write.service_id for write in failed] == [service_id]
+    assert len(ingestor.batches) == 1
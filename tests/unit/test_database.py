@@ -0,0 +1,61 @@
+"""Tests for read connection routing."""
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.database import ReadRouter
+
+
+@pytest.fixture
+async def replica(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def unreachable_replica(tmp_path):
+    """An engine whose database cannot be opened."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def test_reads_use_the_replica_in_autocommit_mode(test_engine, replica) -> None:
+    """A reachable replica serves reads without opening a transaction."""
+    read_router = ReadRouter(test_engine, replica)
+
+    async with read_router.connect() as connection:
+        assert connection.engine.url == replica.url
+        assert connection.sync_connection.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+        assert await connection.scalar(text("SELECT 1")) == 1
+
+
+async def test_reads_fall_back_to_primary_and_skip_replica(
+    test_engine, unreachable_replica
+) -> None:
+    """An unreachable replica is skipped until the retry delay passes."""
+    read_router = ReadRouter(test_engine, unreachable_replica, retry_seconds=30)
+    attempts = 0
+
+    @event.listens_for(unreachable_replica.sync_engine, "do_connect")
+    def count_attempt(*_: object) -> None:
+        nonlocal attempts
+        attempts += 1
+
+    for _ in range(3):
+        async with read_router.connect() as connection:
+            assert connection.engine.url == test_engine.url
+
+    assert attempts == 1
+
+
+async def test_replica_failure_raises_without_fallback(test_engine, unreachable_replica) -> None:
+    """With fallback disabled the connection error reaches the caller."""
+    read_router = ReadRouter(test_engine, unreachable_replica, fallback=False)
+
+    with pytest.raises(DBAPIError):
+        async with read_router.connect():
+            pass
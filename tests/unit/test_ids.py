@@ -0,0 +1,25 @@
+"""Tests for time-ordered id generation."""
+
+import time
+import uuid
+
+from src.core.ids import uuid7
+
+
+def test_uuid7_layout() -> None:
+    """Ids carry version 7, the RFC variant and the current Unix time in ms."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_uuid7_is_strictly_increasing() -> None:
+    """Ids generated in a burst sort in generation order without duplicates."""
+    ids = [uuid7() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
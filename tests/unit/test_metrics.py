@@ -0,0 +1,60 @@
+"""Tests for database instrumentation."""
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.metrics import (
+    InstrumentedQueuePool,
+    QueryStats,
+    instrument_engine,
+    request_query_stats,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    instrument_engine(engine, label="test")
+    yield engine
+    await engine.dispose()
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+async def test_queries_are_attributed_to_the_current_request(engine) -> None:
+    """Queries run while a request is tracked add to its stats."""
+    stats = QueryStats()
+    token = request_query_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    finally:
+        request_query_stats.reset(token)
+
+    assert stats.count == 2
+    assert stats.duration > 0
+
+
+async def test_pool_checkouts_and_saturation_are_recorded(engine) -> None:
+    """Checkout waits are timed and pool gauges follow checked-out connections."""
+    checkouts = _sample("status_beacon_db_pool_checkout_duration_seconds_count", pool="test")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        checked_out = _sample("status_beacon_db_pool_connections", pool="test", state="checked_out")
+
+    assert _sample("status_beacon_db_pool_checkout_duration_seconds_count", pool="test") > checkouts
+    assert checked_out == 1
+    assert _sample("status_beacon_db_pool_max_connections", pool="test") == 3
+    await engine.dispose()
+    assert _sample("status_beacon_db_pool_connections", pool="test", state="checked_out") == 0
@@ -0,0 +1,20 @@
+"""Tests for model loading behaviour."""
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Service
+
+
+async def test_service_history_is_not_loaded_eagerly(
+    service_factory, db_session: AsyncSession
+) -> None:
+    """Loading a service leaves its history and incidents unloaded."""
+    await service_factory(name="lazy")
+    await db_session.commit()
+    db_session.expunge_all()
+
+    service = (await db_session.execute(select(Service))).scalar_one()
+
+    assert {"status_records", "incidents"} <= inspect(service).unloaded
+    assert await service.awaitable_attrs.status_records == []